@@ -0,0 +1,217 @@
+"""
+Pruebas de rendimiento de los algoritmos de ``scheduler``.
+
+Mide cada algoritmo registrado sobre cargas sintéticas de ``workloads`` desde 10
+hasta 10^6 procesos e informa tiempo, rendimiento (procesos por segundo) y pico
+de memoria (tracemalloc). Los tiempos se normalizan con una tarea de
+calibración fija para poder comparar contra una línea base guardada en otra
+máquina.
+
+Termina con código 1 si algún caso es más lento que la línea base por encima
+del umbral, o si el exponente de escalado (pendiente de log(tiempo) frente a
+log(n)) supera el máximo, lo que delata un cambio de complejidad aunque la
+constante mejore.
+
+Uso:
+    python benchmarks/bench_scheduler.py                     # comparar contra baseline.json
+    python benchmarks/bench_scheduler.py --max-size 10000    # versión rápida
+    python benchmarks/bench_scheduler.py --update-baseline   # regenerar la línea base
+"""
+import argparse
+import gc
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from scheduler import ALGORITHMS
+from workloads import GENERATORS, generate
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+SIZES = [10, 100, 1000, 10000, 100000, 1000000]
+# Fracción de empeoramiento tolerada respecto a la línea base
+DEFAULT_THRESHOLD = 0.5
+# Todos los algoritmos son O(n log n) (pendiente ~1.1 más efectos de caché); un paso
+# cuadrático da una pendiente cercana a 2
+DEFAULT_MAX_EXPONENT = 1.5
+# Por debajo de estos tamaños el tiempo está dominado por ruido y no se compara: con n=1000
+# cada caso dura 1-2 ms y la variación del temporizador se acerca al umbral
+MIN_GATED_SIZE = 10000
+MIN_SCALING_SIZE = 10000
+
+
+def calibrate(repeat=5):
+    """Segundos de una tarea fija en Python puro (ordenar y recorrer tuplas), el mejor de ``repeat``."""
+    data = [((i * 7919) % 100003, i) for i in range(200000)]
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        total = 0
+        for key, value in sorted(data):
+            total += key ^ value
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_algorithm(algorithm, processes, repeat):
+    """Mejor tiempo de ``repeat`` ejecuciones, con el recolector de basura desactivado."""
+    best = math.inf
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            algorithm(processes)
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def peak_memory(algorithm, processes):
+    """Pico de memoria asignada durante una ejecución, en bytes (sin contar la carga)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        algorithm(processes)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def scaling_exponent(points):
+    """
+    Pendiente por mínimos cuadrados de log(tiempo) frente a log(n).
+
+    Args:
+        points (list): Pares (n, segundos).
+
+    Returns:
+        float | None: Exponente estimado, o None con menos de dos puntos.
+    """
+    points = [(math.log(n), math.log(seconds)) for n, seconds in points if seconds > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def case_key(algorithm, workload, n):
+    return f'{algorithm}|{workload}|{n}'
+
+
+def run(algorithms, workloads, sizes, repeat=3, memory=True, seed=0, out=sys.stdout):
+    """
+    Medir cada combinación (algoritmo, carga, tamaño).
+
+    Returns:
+        dict: Clave de caso -> {'seconds', 'relative', 'throughput', 'peak_bytes'}; 'relative'
+        es el tiempo dividido por el de la calibración.
+    """
+    calibration = calibrate()
+    print(f'Calibración: {calibration * 1000:.1f} ms', file=out)
+    print(f"{'Algoritmo':<30}{'Carga':<15}{'n':>9}{'Tiempo (s)':>12}{'Procesos/s':>14}{'Pico (MB)':>11}", file=out)
+    results = {}
+    for workload in workloads:
+        for n in sizes:
+            processes = generate(workload, n, seed=seed)
+            for name in algorithms:
+                algorithm = ALGORITHMS[name]
+                # Menos repeticiones para las cargas grandes, que ya son estables
+                seconds = time_algorithm(algorithm, processes, repeat if n < 100000 else 1)
+                peak = peak_memory(algorithm, processes) if memory else None
+                results[case_key(name, workload, n)] = {
+                    'seconds': seconds,
+                    'relative': seconds / calibration,
+                    'throughput': n / seconds if seconds else math.inf,
+                    'peak_bytes': peak,
+                }
+                peak_text = f'{peak / 2 ** 20:>11.1f}' if peak is not None else f"{'-':>11}"
+                print(f'{name:<30}{workload:<15}{n:>9}{seconds:>12.4f}{n / seconds:>14,.0f}{peak_text}', file=out)
+    return results
+
+
+def check(results, baseline, threshold=DEFAULT_THRESHOLD, max_exponent=DEFAULT_MAX_EXPONENT):
+    """
+    Comparar los resultados con la línea base y el exponente de escalado.
+
+    Returns:
+        list: Mensajes de las regresiones encontradas (vacía si no hay).
+    """
+    failures = []
+    for key, result in results.items():
+        n = int(key.rsplit('|', 1)[1])
+        reference = baseline.get(key)
+        if reference is None or n < MIN_GATED_SIZE:
+            continue
+        ratio = result['relative'] / reference['relative']
+        if ratio > 1 + threshold:
+            failures.append(f'{key}: {ratio:.2f}x más lento que la línea base')
+
+    curves = {}
+    for key, result in results.items():
+        algorithm, workload, n = key.rsplit('|', 2)
+        if int(n) >= MIN_SCALING_SIZE:
+            curves.setdefault((algorithm, workload), []).append((int(n), result['seconds']))
+    for (algorithm, workload), points in curves.items():
+        exponent = scaling_exponent(points)
+        if exponent is not None and exponent > max_exponent:
+            failures.append(f'{algorithm}|{workload}: escala como n^{exponent:.2f} (máximo n^{max_exponent})')
+    return failures
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip(),
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-a', '--algoritmo', action='append', dest='algorithms', choices=list(ALGORITHMS),
+                        help='Algoritmo a medir; se puede repetir (por defecto, todos los registrados).')
+    parser.add_argument('-w', '--carga', action='append', dest='workloads', choices=list(GENERATORS),
+                        help='Generador de carga; se puede repetir (por defecto, todos).')
+    parser.add_argument('--max-size', type=int, default=SIZES[-1], help='Tamaño máximo (por defecto 10^6).')
+    parser.add_argument('--repeat', type=int, default=3, help='Repeticiones por caso; se usa el mejor tiempo.')
+    parser.add_argument('--no-memory', action='store_true', help='No medir el pico de memoria (más rápido).')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Archivo JSON de la línea base.')
+    parser.add_argument('--update-baseline', action='store_true', help='Guardar los resultados como línea base.')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Empeoramiento relativo tolerado (0.5 = 50%%).')
+    parser.add_argument('--max-exponent', type=float, default=DEFAULT_MAX_EXPONENT,
+                        help='Exponente de escalado máximo permitido.')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = [n for n in SIZES if n <= args.max_size]
+    results = run(args.algorithms or list(ALGORITHMS), args.workloads or list(GENERATORS), sizes,
+                  repeat=args.repeat, memory=not args.no_memory)
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding='utf-8') as file:
+                baseline = json.load(file)
+        baseline.update({key: {'relative': round(result['relative'], 6)} for key, result in results.items()})
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(baseline, file, indent=1, sort_keys=True)
+        print(f'Línea base actualizada: {args.baseline}')
+        return 0
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)
+    failures = check(results, baseline, args.threshold, args.max_exponent)
+    for failure in failures:
+        print(f'REGRESIÓN: {failure}')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
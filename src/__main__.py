@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Los módulos de src se importan entre sí por su nombre, como al ejecutar main.py
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cli import main
+
+sys.exit(main())
@@ -0,0 +1,147 @@
+import argparse
+import csv
+import inspect
+import json
+import os
+import sys
+
+from scheduler import ALGORITHMS
+import workload_io
+
+
+# Esta interfaz no importa PyQt5, matplotlib ni openai, y NumPy solo con el formato binario,
+# para que arranque rápido. Objetivo en segundos de ``python -m src --help``, comprobado en tests/test_cli.py
+STARTUP_TARGET = 0.15
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m src',
+        description='Ejecutar algoritmos de despacho sobre una carga de procesos, sin interfaz gráfica.')
+    parser.add_argument('archivo', help='Carga de procesos (.csv, .jsonl o .adc).')
+    parser.add_argument('-a', '--algoritmo', action='append', dest='algorithms', metavar='NOMBRE',
+                        help=f"Algoritmo a ejecutar; se puede repetir (por defecto, todos: {', '.join(ALGORITHMS)}).")
+    parser.add_argument('-q', '--quantum', type=int, help='Quantum de Round Robin.')
+    parser.add_argument('-p', '--param', action='append', default=[], metavar='CLAVE=VALOR',
+                        help='Parámetro adicional para los algoritmos que lo acepten; se puede repetir.')
+    parser.add_argument('-o', '--salida', metavar='ARCHIVO',
+                        help='Guardar métricas (.csv, .jsonl) o métricas y diagrama de Gantt (.adc). '
+                             'Con varios algoritmos se agrega su nombre al archivo.')
+    parser.add_argument('-c', '--cache', metavar='DIRECTORIO',
+                        help='Reutilizar entre ejecuciones los resultados guardados en este directorio.')
+    parser.add_argument('-d', '--detalle', action='store_true', help='Imprimir las métricas de cada proceso.')
+    return parser, parser.parse_args(argv)
+
+
+def select_algorithms(names):
+    """Resolver nombres de algoritmo sin distinguir mayúsculas; None selecciona todos."""
+    if not names:
+        return list(ALGORITHMS)
+    by_name = {name.lower(): name for name in ALGORITHMS}
+    unknown = [name for name in names if name.lower() not in by_name]
+    if unknown:
+        raise ValueError(f"Algoritmos desconocidos: {', '.join(unknown)}. Disponibles: {', '.join(ALGORITHMS)}")
+    return [by_name[name.lower()] for name in names]
+
+
+def parse_params(pairs):
+    """Convertir 'clave=valor' en un diccionario; los valores se leen como JSON si es posible."""
+    params = {}
+    for pair in pairs:
+        key, separator, value = pair.partition('=')
+        if not separator:
+            raise ValueError(f"Parámetro inválido '{pair}': se espera CLAVE=VALOR.")
+        try:
+            params[key] = json.loads(value)
+        except ValueError:
+            params[key] = value
+    return params
+
+
+def accepted_params(algorithm, params):
+    """Quedarse con los parámetros que acepta la función del algoritmo."""
+    accepted = inspect.signature(ALGORITHMS[algorithm]).parameters
+    return {key: value for key, value in params.items() if key in accepted}
+
+
+def output_path(path, algorithm, several):
+    if not several:
+        return path
+    base, extension = os.path.splitext(path)
+    return f"{base}-{algorithm.lower().replace(' ', '_')}{extension}"
+
+
+def write_output(path, schedule, metrics):
+    """Guardar los resultados de una ejecución según la extensión de ``path``."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == workload_io.BINARY_EXTENSION:
+        workload_io.save_results(path, schedule, metrics)
+    elif extension == '.csv':
+        with open(path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(['id', 'espera', 'retorno'])
+            writer.writerows(metrics)
+    elif extension in ('.jsonl', '.ndjson'):
+        with open(path, 'w', encoding='utf-8') as file:
+            for pid, waiting_time, turnaround_time in metrics:
+                file.write(json.dumps({'id': pid, 'espera': waiting_time, 'retorno': turnaround_time}) + '\n')
+    else:
+        raise ValueError(f"Formato de salida no soportado: {extension}")
+
+
+def format_summary(rows):
+    """Dar formato de tabla de texto a las filas (algoritmo, procesos, espera_prom, retorno_prom)."""
+    lines = [f"{'Algoritmo':<30}{'Procesos':>12}{'Espera prom.':>16}{'Retorno prom.':>16}"]
+    for algorithm, count, average_waiting, average_turnaround in rows:
+        lines.append(f"{algorithm:<30}{count:>12}{average_waiting:>16.2f}{average_turnaround:>16.2f}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """Punto de entrada de la CLI; devuelve el código de salida."""
+    parser, args = parse_args(argv)
+    try:
+        algorithms = select_algorithms(args.algorithms)
+        params = parse_params(args.param)
+        if args.quantum is not None:
+            params['quantum'] = args.quantum
+        processes = workload_io.load_workload(args.archivo)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+    cache = digest = None
+    if args.cache:
+        from result_cache import ResultCache, workload_digest
+
+        cache = ResultCache(directory=args.cache)
+        digest = workload_digest(processes)
+
+    rows = []
+    for algorithm in algorithms:
+        try:
+            algorithm_params = accepted_params(algorithm, params)
+            if cache is not None:
+                entry = cache.run(algorithm, processes, ALGORITHMS[algorithm], algorithm_params, digest)
+                schedule, metrics = entry.schedule, entry.metrics
+            else:
+                schedule, metrics = ALGORITHMS[algorithm](processes, **algorithm_params)
+            if args.salida:
+                write_output(output_path(args.salida, algorithm, len(algorithms) > 1), schedule, metrics)
+        except (OSError, ValueError) as error:
+            parser.error(f"{algorithm}: {error}")
+
+        count = len(metrics)
+        rows.append((algorithm, count,
+                     sum(m[1] for m in metrics) / count if count else 0.0,
+                     sum(m[2] for m in metrics) / count if count else 0.0))
+        if args.detalle:
+            print(f"--- {algorithm} ---")
+            for pid, waiting_time, turnaround_time in metrics:
+                print(f"Proceso {pid}: Espera={waiting_time}, Finalización={turnaround_time}")
+
+    print(format_summary(rows))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+from collections import namedtuple
+from multiprocessing import shared_memory
+import os
+
+import numpy as np
+
+from parallel import resolve_algorithms, run_tasks
+from process_table import ProcessTable
+
+
+ComparisonRow = namedtuple('ComparisonRow', ['algorithm', 'workloads', 'processes', 'average_waiting', 'average_turnaround'])
+
+# Estado de cada proceso trabajador: columnas en memoria compartida
+_worker_state = {}
+
+
+def _pack_workloads(workloads):
+    """Concatenar las cargas en un bloque (3, total) de enteros y sus desplazamientos."""
+    offsets = np.zeros(len(workloads) + 1, dtype=np.int64)
+    for i, workload in enumerate(workloads):
+        offsets[i + 1] = offsets[i] + len(workload)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, 3 * int(offsets[-1]) * 8))
+    columns = np.ndarray((3, int(offsets[-1])), dtype=np.int64, buffer=shm.buf)
+    for i, workload in enumerate(workloads):
+        start, stop = offsets[i], offsets[i + 1]
+        if isinstance(workload, ProcessTable):
+            for row, name in enumerate(('arrival', 'burst', 'priority')):
+                columns[row, start:stop] = workload[name]
+        elif stop > start:
+            columns[:, start:stop] = np.array([p[1:] for p in workload], dtype=np.int64).T
+    del columns
+    return shm, offsets
+
+
+def _attach(shm_name, total, offsets):
+    """Inicializador de los trabajadores: abrir la memoria compartida una sola vez."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_state['shm'] = shm
+    _worker_state['columns'] = np.ndarray((3, total), dtype=np.int64, buffer=shm.buf)
+    _worker_state['offsets'] = offsets
+
+
+def _run_chunk(algorithm, params, first, last):
+    """Ejecutar un algoritmo (una función) sobre las cargas [first, last) y devolver sumas parciales."""
+    columns = _worker_state['columns']
+    offsets = _worker_state['offsets']
+    total_waiting = 0
+    total_turnaround = 0
+    num_processes = 0
+
+    for i in range(first, last):
+        start, stop = offsets[i], offsets[i + 1]
+        arrival, burst, priority = (columns[row, start:stop].tolist() for row in range(3))
+        # El ID es el índice de fila: las métricas agregadas no dependen de él
+        _, metrics = algorithm(list(zip(range(stop - start), arrival, burst, priority)), **params)
+        for _, waiting_time, turnaround_time in metrics:
+            total_waiting += waiting_time
+            total_turnaround += turnaround_time
+        num_processes += len(metrics)
+
+    return total_waiting, total_turnaround, num_processes
+
+
+def compare(workloads, algorithms=None, params=None, max_workers=None, mp_context=None):
+    """
+    Comparar varios algoritmos sobre una o muchas cargas de trabajo en paralelo.
+
+    Las cargas se copian una sola vez a memoria compartida; cada tarea enviada a
+    los trabajadores solo contiene el algoritmo y un rango de índices de carga.
+
+    Args:
+        workloads (list | ProcessTable): Una carga (lista de tuplas o ProcessTable)
+            o una lista de cargas.
+        algorithms (list, optional): Nombres registrados en ``scheduler.ALGORITHMS``
+            o funciones a nivel de módulo; por defecto, todos los registrados.
+        params (dict, optional): Parámetros adicionales por algoritmo, por ejemplo
+            ``{'Round Robin': {'quantum': 4}}``.
+        max_workers (int, optional): Número de procesos; con 1 se ejecuta en el
+            proceso actual. Por defecto, el número de núcleos.
+        mp_context (multiprocessing.context.BaseContext, optional): Contexto con el
+            que se crean los trabajadores, por ejemplo ``get_context('spawn')``.
+
+    Returns:
+        list: Una fila ``ComparisonRow`` por algoritmo con los promedios de espera
+            y de retorno sobre todos los procesos.
+    """
+    if isinstance(workloads, ProcessTable) or (workloads and isinstance(workloads[0], tuple)):
+        workloads = [workloads]
+    labels, functions = resolve_algorithms(algorithms)
+    params = params or {}
+    max_workers = max_workers or os.cpu_count() or 1
+
+    # Varios bloques por trabajador para repartir bien la carga
+    chunk_size = max(1, len(workloads) // (4 * max_workers))
+    chunks = [(first, min(first + chunk_size, len(workloads))) for first in range(0, len(workloads), chunk_size)]
+    tasks = [(index, algorithm, params.get(label, {}), first, last)
+             for index, (algorithm, label) in enumerate(zip(functions, labels))
+             for first, last in chunks]
+
+    shm, offsets = _pack_workloads(workloads)
+    try:
+        init_args = (shm.name, int(offsets[-1]), offsets)
+        if max_workers == 1:
+            _attach(*init_args)
+        try:
+            results = run_tasks(_run_chunk, [task[1:] for task in tasks], max_workers,
+                                initializer=_attach, initargs=init_args, mp_context=mp_context)
+        finally:
+            if max_workers == 1:
+                _worker_state.pop('columns', None)
+                _worker_state.pop('shm').close()
+    finally:
+        shm.close()
+        shm.unlink()
+
+    totals = [[0, 0, 0] for _ in labels]
+    for (index, *_), partial in zip(tasks, results):
+        for j, value in enumerate(partial):
+            totals[index][j] += value
+
+    return [ComparisonRow(label, len(workloads), count,
+                          waiting / count if count else 0.0,
+                          turnaround / count if count else 0.0)
+            for label, (waiting, turnaround, count) in zip(labels, totals)]
+
+
+def format_table(rows):
+    """Dar formato de tabla de texto al resultado de ``compare``."""
+    lines = [f"{'Algoritmo':<30}{'Cargas':>8}{'Procesos':>12}{'Espera prom.':>16}{'Retorno prom.':>16}"]
+    for row in rows:
+        lines.append(f"{row.algorithm:<30}{row.workloads:>8}{row.processes:>12}"
+                     f"{row.average_waiting:>16.2f}{row.average_turnaround:>16.2f}")
+    return '\n'.join(lines)
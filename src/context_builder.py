@@ -0,0 +1,90 @@
+from collections import deque
+
+
+HEADER = "### Historial Completo de Ejecuciones ###\n"
+SUMMARY_HEADER = "\n### Resumen de ejecuciones anteriores ###\n"
+
+# Aproximación habitual para texto en español/inglés
+CHARS_PER_TOKEN = 4
+
+
+def serialize_run(algorithm, processes, schedule, metrics):
+    """Describir una ejecución con el mismo formato que el contexto original de la GUI."""
+    lines = [f"\n--- Algoritmo: {algorithm} ---"]
+    lines.extend(f"Proceso {pid}: Llegada={at}, Ejecución={bt}, Prioridad={pr}" for pid, at, bt, pr in processes)
+    lines.append("\nResultados:")
+    lines.extend(f"Proceso {pid}: Espera={wait}, Finalización={turnaround}" for pid, wait, turnaround in metrics)
+    lines.append("\nDescripción de la Gráfica de Gantt:")
+    lines.extend(f"Proceso {pid}: Inicio={start}, Fin={end}, Duración={end - start}" for pid, start, end, *_ in schedule)
+    return '\n'.join(lines) + '\n'
+
+
+class ContextBuilder:
+    """
+    Contexto para GPT mantenido de forma incremental y con tamaño acotado.
+
+    Cada ejecución se serializa una sola vez al agregarla. Cuando el texto supera
+    el presupuesto, las ejecuciones más antiguas se condensan en un resumen por
+    algoritmo (ejecuciones, procesos y promedios), de modo que construir el
+    contexto cuesta O(entradas nuevas) y nunca crece más allá del presupuesto
+    más el resumen.
+    """
+
+    def __init__(self, max_chars=None, max_tokens=6000):
+        self.max_chars = max_chars if max_chars is not None else max_tokens * CHARS_PER_TOKEN
+        self._runs = deque()  # (texto, algoritmo, procesos, espera_total, retorno_total)
+        self._chars = 0
+        self._summary = {}    # algoritmo -> [ejecuciones, procesos, espera_total, retorno_total]
+        self._context = None
+
+    def add_run(self, algorithm, processes, schedule, metrics):
+        """
+        Agregar una ejecución al contexto.
+
+        Args:
+            algorithm (str): Nombre del algoritmo.
+            processes (list | ProcessTable): Procesos de entrada.
+            schedule (list): Entradas del diagrama de Gantt.
+            metrics (list): Tuplas (ID, tiempo_espera, tiempo_retorno).
+        """
+        text = serialize_run(algorithm, processes, schedule, metrics)
+        total_waiting = sum(m[1] for m in metrics)
+        total_turnaround = sum(m[2] for m in metrics)
+        self._runs.append((text, algorithm, len(metrics), total_waiting, total_turnaround))
+        self._chars += len(text)
+
+        while self._runs and self._chars > self.max_chars:
+            text, algorithm, count, waiting, turnaround = self._runs.popleft()
+            self._chars -= len(text)
+            totals = self._summary.setdefault(algorithm, [0, 0, 0, 0])
+            totals[0] += 1
+            totals[1] += count
+            totals[2] += waiting
+            totals[3] += turnaround
+        self._context = None
+
+    def _summary_text(self):
+        lines = [SUMMARY_HEADER.rstrip('\n')]
+        for algorithm, (runs, count, waiting, turnaround) in self._summary.items():
+            average_waiting = waiting / count if count else 0
+            average_turnaround = turnaround / count if count else 0
+            lines.append(f"Algoritmo {algorithm}: {runs} ejecuciones, {count} procesos, "
+                         f"Espera promedio={average_waiting:.2f}, Finalización promedio={average_turnaround:.2f}")
+        return '\n'.join(lines) + '\n'
+
+    def build(self):
+        """Devolver el contexto actual; se reutiliza mientras no cambie el historial."""
+        if self._context is None:
+            parts = [HEADER]
+            if self._summary:
+                parts.append(self._summary_text())
+            parts.extend(run[0] for run in self._runs)
+            self._context = ''.join(parts)
+        return self._context
+
+    def clear(self):
+        """Olvidar todo el historial."""
+        self._runs.clear()
+        self._chars = 0
+        self._summary = {}
+        self._context = None
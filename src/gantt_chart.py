@@ -1,7 +1,146 @@
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.collections import PathCollection
+from matplotlib.path import Path
+from matplotlib.ticker import FuncFormatter, Locator, MaxNLocator
 import numpy as np
 
+from gantt_lod import ScheduleIndex
+
+
+ROW_HEIGHT = 10
+BAR_HEIGHT = 9
+MAX_LABELS = 150          # Máximo de etiquetas dentro de las barras
+MIN_LABEL_WIDTH_PX = 28   # Ancho mínimo en píxeles para etiquetar una barra
+ROW_TICK_SPACING_PX = 16  # Separación mínima en píxeles entre nombres de fila
+QUEUE_COLOR = '#37474F'   # Línea de la cola de listos
+
+
+def schedule_columns(schedule, row_keys=None, row_field=0):
+    """
+    Convertir el horario en columnas NumPy agrupadas por fila.
+
+    Cada ID de proceso ocupa una fila, en el orden en que aparece por primera vez.
+
+    Args:
+        schedule (list): Tuplas (ID, tiempo_inicio, tiempo_fin[, núcleo]).
+        row_keys (dict, optional): Filas ya asignadas (ID -> fila); se amplía con las nuevas.
+        row_field (int): Campo de la tupla que decide la fila; 3 agrupa por núcleo.
+
+    Returns:
+        row_keys (dict): ID -> índice de fila.
+        rows (ndarray): Fila de cada entrada.
+        starts (ndarray): Inicio de cada entrada.
+        ends (ndarray): Fin de cada entrada.
+    """
+    row_keys = {} if row_keys is None else row_keys
+    rows = np.fromiter((row_keys.setdefault(entry[row_field], len(row_keys)) for entry in schedule),
+                       dtype=np.int64, count=len(schedule))
+    starts = np.fromiter((entry[1] for entry in schedule), dtype=float, count=len(schedule))
+    ends = np.fromiter((entry[2] for entry in schedule), dtype=float, count=len(schedule))
+    return row_keys, rows, starts, ends
+
+
+def bar_paths(rows, starts, ends, color_codes, heights=None):
+    """
+    Construir un Path compuesto por color con todos los rectángulos de ese color.
+
+    Agrupar las barras en pocos paths evita crear un objeto por entrada, que es
+    lo que domina el coste de dibujo con decenas de miles de tramos.
+
+    Args:
+        rows (ndarray): Fila de cada entrada.
+        starts (ndarray): Inicio de cada entrada.
+        ends (ndarray): Fin de cada entrada.
+        color_codes (ndarray): Índice de color de cada entrada.
+        heights (ndarray, optional): Filas que cubre cada rectángulo; una por defecto.
+
+    Returns:
+        paths (list): Un ``Path`` por color presente.
+        colors (ndarray): Índice de color de cada path.
+    """
+    bottoms = rows * ROW_HEIGHT
+    verts = np.empty((len(rows), 5, 2))
+    verts[:, 0, 0] = verts[:, 1, 0] = verts[:, 4, 0] = starts
+    verts[:, 2, 0] = verts[:, 3, 0] = ends
+    verts[:, 0, 1] = verts[:, 3, 1] = verts[:, 4, 1] = bottoms
+    verts[:, 1, 1] = verts[:, 2, 1] = bottoms + BAR_HEIGHT
+    if heights is not None:
+        verts[:, 1, 1] += (heights - 1) * ROW_HEIGHT
+        verts[:, 2, 1] = verts[:, 1, 1]
+    codes = np.tile(np.array([Path.MOVETO] + [Path.LINETO] * 3 + [Path.CLOSEPOLY], dtype=Path.code_type),
+                    len(rows))
+
+    order = np.argsort(color_codes, kind='stable')
+    colors, first = np.unique(color_codes[order], return_index=True)
+    bounds = list(first) + [len(order)]
+    paths = []
+    for i in range(len(colors)):
+        group = order[bounds[i]:bounds[i + 1]]
+        paths.append(Path(verts[group].reshape(-1, 2), codes[:5 * len(group)]))
+    return paths, colors
+
+
+def decimate_steps(times, depths, bins):
+    """
+    Reducir una serie escalonada a como mucho ``bins`` tramos conservando el máximo de cada uno.
+
+    Args:
+        times (array): Instantes de cada muestra, en orden.
+        depths (array): Valor desde cada instante hasta el siguiente.
+        bins (int): Número de tramos, normalmente el ancho en píxeles.
+
+    Returns:
+        times (ndarray): Inicio de cada tramo.
+        depths (ndarray): Valor máximo dentro de cada tramo.
+    """
+    times = np.asarray(times, dtype=float)
+    depths = np.asarray(depths)
+    bins = max(1, int(bins))
+    if len(times) <= 2 * bins:
+        return times, depths
+    edges = np.linspace(times[0], times[-1], bins + 1)[:-1]
+    starts = np.unique(np.searchsorted(times, edges, side='right') - 1)
+    return times[starts], np.maximum.reduceat(depths, starts)
+
+
+def labels_to_draw(rows, starts, ends, xlim, ylim, pixels_per_unit):
+    """
+    Elegir qué barras se etiquetan con el nivel de zoom actual.
+
+    Solo se etiquetan las barras visibles con ancho suficiente en pantalla, hasta
+    ``MAX_LABELS``, dando preferencia a las más anchas.
+
+    Returns:
+        ndarray: Índices de las entradas a etiquetar.
+    """
+    bottoms = rows * ROW_HEIGHT
+    visible = ((ends > xlim[0]) & (starts < xlim[1]) &
+               (bottoms + BAR_HEIGHT > ylim[0]) & (bottoms < ylim[1]))
+    widths = (np.minimum(ends, xlim[1]) - np.maximum(starts, xlim[0])) * pixels_per_unit
+    candidates = np.flatnonzero(visible & (widths >= MIN_LABEL_WIDTH_PX))
+    if len(candidates) > MAX_LABELS:
+        widest = np.argpartition(widths[candidates], -MAX_LABELS)[-MAX_LABELS:]
+        candidates = np.sort(candidates[widest])
+    return candidates
+
+
+class RowLocator(Locator):
+    """Marca el centro de las filas visibles, saltando filas si sus nombres no caben."""
+
+    def __init__(self, num_rows):
+        self.num_rows = num_rows
+
+    def __call__(self):
+        low, high = sorted(self.axis.get_view_interval())
+        first = max(0, int(np.floor(low / ROW_HEIGHT)))
+        last = min(self.num_rows - 1, int(np.ceil(high / ROW_HEIGHT)))
+        if last < first:
+            return []
+        max_ticks = max(1, int(self.axis.axes.bbox.height // ROW_TICK_SPACING_PX))
+        step = max(1, int(np.ceil((last - first + 1) / max_ticks)))
+        return np.arange(first, last + 1, step) * ROW_HEIGHT + BAR_HEIGHT / 2
+
 
 class GanttChart(FigureCanvas):
     def __init__(self, parent=None):
@@ -13,28 +152,214 @@ class GanttChart(FigureCanvas):
         # Para almacenar el horario actual
         self.current_schedule = []
 
+        self._row_keys = {}
+        self._row_field = 0       # 3 cuando el horario trae núcleos: una fila por núcleo
+        self._row_labels = []
+        self._entry_labels = None  # ID de cada entrada cuando las filas son núcleos
+        self._rows = np.empty(0, dtype=np.int64)
+        self._starts = np.empty(0)
+        self._ends = np.empty(0)
+        self._row_colors = np.empty(0, dtype=np.int64)
+        self._texts = []
+        self._bars = None
+        self._extra_bars = []
+        self._index = None
+        self._index_stale = False  # Entradas agregadas con blitting que el índice aún no incluye
+        self._queue_ax = None
+        self._background = None
+        self.mpl_connect('draw_event', self._save_background)
+
     def plot_gantt(self, schedule):
-        """Dibuja el diagrama de Gantt basado en el horario proporcionado."""
-        self.current_schedule = schedule  # Almacena el horario actual
+        """
+        Dibuja el diagrama de Gantt basado en el horario proporcionado.
+
+        Las barras se dibujan en una sola colección a partir de un índice
+        multirresolución (``gantt_lod.ScheduleIndex``), de modo que solo se pinta
+        el detalle visible a resolución de píxel; al desplazarse o hacer zoom se
+        consulta de nuevo el índice. Las etiquetas y marcas también se recortan
+        según el zoom. Si el horario solo amplía el anterior y cabe en la vista
+        actual, únicamente se dibujan las entradas nuevas (blitting).
+
+        Si las entradas tienen un cuarto campo (núcleo, ver ``smp.simulate``), se
+        dibuja una fila por núcleo y cada barra se etiqueta con su proceso.
+        """
+        schedule = list(schedule)
+        previous = self.current_schedule
+        if (previous and len(schedule) > len(previous) and schedule[:len(previous)] == previous
+                and self._extend(schedule[len(previous):])):
+            self.current_schedule = schedule
+            return
+
+        self.current_schedule = schedule
+        self._redraw()
+
+    def plot_queue_depth(self, times, depths):
+        """
+        Mostrar la longitud de la cola de listos en un eje secundario, sobre el mismo eje de tiempo.
+
+        Args:
+            times (list): Instantes de cada muestra (ver ``Tracer.queue_depth``).
+            depths (list): Procesos en cola desde cada instante.
+        """
+        if self._queue_ax is None:
+            self._queue_ax = self.ax.twinx()
+        ax = self._queue_ax
+        ax.clear()
+        ax.set_visible(len(times) > 0)
+        if len(times):
+            times, depths = decimate_steps(times, depths, self.ax.bbox.width)
+            ax.step(times, depths, where='post', color=QUEUE_COLOR, linewidth=1, alpha=0.7)
+            ax.set_ylim(0, depths.max() * 1.1 + 1)
+            ax.set_ylabel('Procesos en cola')
+            ax.grid(False)
+        self.draw_idle()
+
+    def clear_chart(self):
+        """Borrar el diagrama y olvidar el horario actual."""
+        self.current_schedule = []
+        self._redraw()
+
+    def _redraw(self):
+        """Redibujar el gráfico completo a partir de ``current_schedule``."""
         self.ax.clear()
+        if self._queue_ax is not None:
+            # La cola corresponde a la ejecución anterior
+            self._queue_ax.clear()
+            self._queue_ax.set_visible(False)
+        self._texts = []
+        self._bars = None
+        self._extra_bars = []
         self.ax.set_xlabel('Tiempo')
         self.ax.set_ylabel('Procesos')
+        self.ax.grid(True, linestyle='--', alpha=0.6)
 
-        yticks = []
-        ylabels = []
+        schedule = self.current_schedule
+        self._row_field = 3 if schedule and len(schedule[0]) > 3 else 0
+        if self._row_field:
+            cores = sorted({entry[3] for entry in schedule})
+            self._row_keys = {core: row for row, core in enumerate(cores)}
+            self._row_labels = [f'Núcleo {core}' for core in cores]
+            self._entry_labels = [entry[0] for entry in schedule]
+        else:
+            self._row_keys = {}
+            self._entry_labels = None
+        self._row_keys, self._rows, self._starts, self._ends = schedule_columns(schedule, self._row_keys,
+                                                                                self._row_field)
+        if not self._row_field:
+            self._row_labels = list(self._row_keys)
+        self._index = None
+        if not self.current_schedule:
+            self.draw_idle()
+            return
 
-        colors = plt.cm.Paired(np.linspace(0, 1, len(schedule)))
+        # Paired es una paleta discreta: cada fila recibe uno de sus colores
+        cmap = plt.cm.Paired
+        positions = np.linspace(0, 1, len(self._row_labels)) * cmap.N
+        self._row_colors = np.minimum(positions.astype(np.int64), cmap.N - 1)
+        self._index = ScheduleIndex(self._rows, self._starts, self._ends)
+        self._index_stale = False
+        self._bars = self.ax.add_collection(PathCollection([], edgecolors='none'), autolim=False)
 
-        for i, (process_id, start, end) in enumerate(schedule):
-            self.ax.broken_barh([(start, end - start)], (10 * i, 9), facecolors=(colors[i]))
-            yticks.append(10 * i + 4.5)
-            ylabels.append(process_id)
-            self.ax.text(start + (end - start) / 2, 10 * i + 4.5, process_id,
-                        ha='center', va='center', color='white', fontsize=10, weight='bold')
+        # Un 5% de margen a la derecha permite ampliar el horario con blitting
+        left, right = min(0, self._starts.min()), self._ends.max()
+        self.ax.set_xlim(left, right + max(1, 0.05 * (right - left)))
+        self.ax.set_ylim(-1, len(self._row_labels) * ROW_HEIGHT)
+        self.ax.xaxis.set_major_locator(MaxNLocator(nbins='auto', integer=True))
+        self.ax.yaxis.set_major_locator(RowLocator(len(self._row_labels)))
+        self.ax.yaxis.set_major_formatter(FuncFormatter(self._row_label))
 
-        self.ax.set_yticks(yticks)
-        self.ax.set_yticklabels(ylabels)
-        self.ax.grid(True, linestyle='--', alpha=0.6)
-        self.ax.set_xticks(np.arange(0, max(end for _, _, end in schedule) + 1, 1))
+        self.ax.callbacks.connect('xlim_changed', self._update_view)
+        self.ax.callbacks.connect('ylim_changed', self._update_view)
+        self._update_view()
+        self.draw_idle()
+
+    def _add_bars(self, rows, starts, ends):
+        paths, colors = bar_paths(rows, starts, ends, self._row_colors[rows])
+        collection = PathCollection(paths, facecolors=plt.cm.Paired(colors), edgecolors='none')
+        return self.ax.add_collection(collection, autolim=False)
+
+    def _row_label(self, y, _):
+        row = int(y // ROW_HEIGHT)
+        return str(self._row_labels[row]) if 0 <= row < len(self._row_labels) else ''
+
+    def _pixels_per_unit(self):
+        x0, x1 = self.ax.get_xlim()
+        return self.ax.bbox.width / (x1 - x0) if x1 != x0 else 0.0
+
+    def _add_labels(self, indices):
+        texts = []
+        for i in indices:
+            start, end = self._starts[i], self._ends[i]
+            label = self._row_labels[self._rows[i]] if self._entry_labels is None else self._entry_labels[i]
+            texts.append(self.ax.text(start + (end - start) / 2, self._rows[i] * ROW_HEIGHT + BAR_HEIGHT / 2,
+                                      label, ha='center', va='center',
+                                      color='white', fontsize=10, weight='bold', clip_on=True))
+        self._texts.extend(texts)
+        return texts
+
+    def _update_view(self, _=None):
+        """Recalcular barras y etiquetas visibles tras un cambio de zoom o desplazamiento."""
+        if self._index is None:
+            return
+        if self._index_stale:
+            self._index = ScheduleIndex(self._rows, self._starts, self._ends)
+            self._index_stale = False
+        for collection in self._extra_bars:
+            collection.remove()
+        self._extra_bars = []
+
+        (x0, x1), (y0, y1) = self.ax.get_xlim(), sorted(self.ax.get_ylim())
+        rows, heights, starts, ends = self._index.query(x0, x1, y0 // ROW_HEIGHT, y1 // ROW_HEIGHT,
+                                                        self.ax.bbox.width, self.ax.bbox.height)
+        paths, colors = bar_paths(rows, starts, ends, self._row_colors[rows], heights)
+        self._bars.set_paths(paths)
+        self._bars.set_facecolor(plt.cm.Paired(colors))
+
+        for text in self._texts:
+            text.remove()
+        self._texts = []
+        self._add_labels(labels_to_draw(self._rows, self._starts, self._ends, self.ax.get_xlim(),
+                                        self.ax.get_ylim(), self._pixels_per_unit()))
+
+    def _save_background(self, _):
+        self._background = self.copy_from_bbox(self.ax.bbox)
+
+    def _extend(self, new_entries):
+        """
+        Dibujar solo las entradas nuevas sobre el fondo guardado.
+
+        Returns:
+            bool: False si hace falta un redibujado completo (filas nuevas o
+                entradas fuera de la vista actual).
+        """
+        if (self._background is None or self._bars not in self.ax.collections
+                or any((len(entry) > 3) != bool(self._row_field) or entry[self._row_field] not in self._row_keys
+                       for entry in new_entries)):
+            return False
+        _, rows, starts, ends = schedule_columns(new_entries, self._row_keys, self._row_field)
+        x0, x1 = self.ax.get_xlim()
+        if starts.min() < x0 or ends.max() > x1:
+            return False
+
+        self._rows = np.concatenate([self._rows, rows])
+        self._starts = np.concatenate([self._starts, starts])
+        self._ends = np.concatenate([self._ends, ends])
+        if self._entry_labels is not None:
+            self._entry_labels.extend(entry[0] for entry in new_entries)
+
+        collection = self._add_bars(rows, starts, ends)
+        self._extra_bars.append(collection)
+        # Las barras nuevas ya están dibujadas: el índice se reconstruye al cambiar la vista
+        self._index_stale = True
+        offset = len(self._rows) - len(rows)
+        budget = max(0, MAX_LABELS - len(self._texts))
+        indices = labels_to_draw(rows, starts, ends, (x0, x1), self.ax.get_ylim(), self._pixels_per_unit())[:budget]
+        texts = self._add_labels(indices + offset)
 
-        self.draw()
+        self.restore_region(self._background)
+        self.ax.draw_artist(collection)
+        for text in texts:
+            self.ax.draw_artist(text)
+        self.blit(self.ax.bbox)
+        self._background = self.copy_from_bbox(self.ax.bbox)
+        return True
@@ -0,0 +1,109 @@
+import numpy as np
+
+
+def _merge_gaps(rows, starts, ends, max_gap):
+    """
+    Fusionar los intervalos consecutivos de una misma fila separados por huecos
+    de como mucho ``max_gap``. Los intervalos deben venir ordenados por (fila, inicio).
+    """
+    if len(rows) < 2:
+        return rows, starts, ends
+    new_group = np.empty(len(rows), dtype=bool)
+    new_group[0] = True
+    new_group[1:] = (rows[1:] != rows[:-1]) | (starts[1:] - ends[:-1] > max_gap)
+    first = np.flatnonzero(new_group)
+    return rows[first], starts[first], np.maximum.reduceat(ends, first)
+
+
+class ScheduleIndex:
+    """
+    Índice multirresolución de un horario para dibujarlo según el zoom.
+
+    El nivel 0 guarda los tramos ordenados por (fila, inicio). Cada nivel
+    siguiente duplica el hueco máximo que se fusiona entre tramos de la misma
+    fila, y solo se conserva si reduce el número de intervalos al menos a la
+    mitad, por lo que todos los niveles juntos ocupan menos del doble que el
+    horario original.
+
+    ``query`` elige el nivel más grueso cuyo hueco fusionado no supera un píxel,
+    recorta la ventana visible y agrupa en bandas las filas que comparten píxel.
+    """
+
+    def __init__(self, rows, starts, ends):
+        rows = np.asarray(rows, dtype=np.int64)
+        starts = np.asarray(starts, dtype=float)
+        ends = np.asarray(ends, dtype=float)
+        order = np.lexsort((starts, rows))
+        rows, starts, ends = rows[order], starts[order], ends[order]
+
+        self.num_rows = int(rows.max()) + 1 if len(rows) else 0
+        self.span = float(ends.max() - starts.min()) if len(rows) else 0.0
+        self.levels = [(0.0,) + self._with_offsets(rows, starts, ends)]
+
+        min_gap = self.span / 2 ** 20
+        gap = min_gap
+        current = (rows, starts, ends)
+        while gap <= self.span and len(current[0]) > self.num_rows:
+            merged = _merge_gaps(*current, gap)
+            if 2 * len(merged[0]) <= len(self.levels[-1][2]):
+                self.levels.append((gap,) + self._with_offsets(*merged))
+            current = merged
+            gap *= 2
+
+    def _with_offsets(self, rows, starts, ends):
+        offsets = np.zeros(self.num_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=self.num_rows), out=offsets[1:])
+        return offsets, rows, starts, ends
+
+    def __len__(self):
+        """Número total de intervalos guardados en todos los niveles."""
+        return sum(len(level[2]) for level in self.levels)
+
+    def query(self, x0, x1, row0, row1, pixel_width, pixel_height):
+        """
+        Devolver los rectángulos a dibujar en la ventana visible.
+
+        Args:
+            x0, x1 (float): Límites horizontales visibles.
+            row0, row1 (int): Primera y última fila visibles.
+            pixel_width (float): Ancho en píxeles del área de dibujo.
+            pixel_height (float): Alto en píxeles del área de dibujo.
+
+        Returns:
+            rows (ndarray): Primera fila de cada rectángulo.
+            heights (ndarray): Número de filas que cubre cada rectángulo.
+            starts (ndarray): Inicio de cada rectángulo.
+            ends (ndarray): Fin de cada rectángulo (al menos un píxel de ancho).
+        """
+        empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0), np.empty(0))
+        row0, row1 = max(0, int(row0)), min(self.num_rows - 1, int(row1))
+        if row1 < row0 or x1 <= x0 or pixel_width <= 0:
+            return empty
+
+        resolution = (x1 - x0) / pixel_width
+        level = next(level for level in reversed(self.levels) if level[0] <= resolution)
+        _, offsets, rows, starts, ends = level
+        first, last = offsets[row0], offsets[row1 + 1]
+        rows, starts, ends = rows[first:last], starts[first:last], ends[first:last]
+        visible = (ends >= x0) & (starts <= x1)
+        rows, starts, ends = rows[visible], starts[visible], ends[visible]
+
+        # Bandas de filas cuando varias caen en el mismo píxel vertical
+        band = max(1, int(np.ceil((row1 - row0 + 1) / max(1.0, pixel_height))))
+        if band > 1:
+            bands = (rows - row0) // band
+            order = np.lexsort((starts, bands))
+            bands, starts, ends = bands[order], starts[order], ends[order]
+            # Los tramos de filas distintas se solapan: usar el fin acumulado de la banda
+            new_band = np.empty(len(bands), dtype=bool)
+            new_band[:1] = True
+            new_band[1:] = bands[1:] != bands[:-1]
+            band_first = np.flatnonzero(new_band)
+            for begin, stop in zip(band_first, list(band_first[1:]) + [len(bands)]):
+                np.maximum.accumulate(ends[begin:stop], out=ends[begin:stop])
+            rows = bands * band + row0
+
+        rows, starts, ends = _merge_gaps(rows, starts, ends, resolution)
+        ends = np.maximum(ends, starts + resolution)
+        heights = np.minimum(band, row1 + 1 - rows)
+        return rows, heights, starts, ends
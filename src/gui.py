@@ -1,7 +1,52 @@
-from PyQt5 import QtWidgets, QtCore, QtGui
-from gantt_chart import GanttChart
+from PyQt5 import QtWidgets, QtCore
+from context_builder import ContextBuilder
+from incremental import INCREMENTAL_KEYS, IncrementalScheduler
+from instrumentation import Tracer
 from openai_client import ask_openai
-from scheduler import fifo, sjf, priority_scheduling
+from process_model import ProcessTableModel
+from process_table import ProcessTable
+from response_cache import ResponseCache
+from result_cache import ResultCache, result_key, workload_digest
+from scheduler import ALGORITHMS
+import smp
+import sqlite3
+import workload_io
+
+
+# Algoritmos que usan el campo de prioridad
+PRIORITY_ALGORITHMS = ('Prioridad', 'Prioridad Apropiativa', 'Prioridad con Envejecimiento')
+
+IMPORT_FILTER = 'Cargas y resultados (*.csv *.jsonl *.ndjson *.adc);;Todos los archivos (*)'
+BINARY_FILTER = 'Formato columnar (*.adc)'
+# Consultas a GPT simultáneas; las canceladas siguen ocupando un hilo hasta responder o agotar el tiempo
+MAX_GPT_REQUESTS = 8
+
+
+class GptWorkerSignals(QtCore.QObject):
+    """Señales del trabajador de GPT (QRunnable no puede emitirlas directamente)."""
+    finished = QtCore.pyqtSignal(int, str)
+
+
+class GptWorker(QtCore.QRunnable):
+    """
+    Consulta a GPT fuera del hilo de la interfaz.
+
+    La petición HTTP no se puede interrumpir: una consulta cancelada sigue en
+    curso hasta que llega la respuesta o vence ``openai_client.DEFAULT_TIMEOUT``,
+    y ``finished`` se emite igualmente.
+    """
+
+    def __init__(self, request_id, context, question, cache):
+        super().__init__()
+        self.request_id = request_id
+        self.context = context
+        self.question = question
+        self.cache = cache
+        self.signals = GptWorkerSignals()
+
+    def run(self):
+        answer = ask_openai(self.context, self.question, cache=self.cache)
+        self.signals.finished.emit(self.request_id, answer)
 
 
 class SchedulerApp(QtWidgets.QWidget):
@@ -25,7 +70,7 @@ class SchedulerApp(QtWidgets.QWidget):
         self.arrival_time_input = QtWidgets.QLineEdit()
         self.burst_time_input = QtWidgets.QLineEdit()
         self.priority_input = QtWidgets.QLineEdit()
-        self.priority_input.setPlaceholderText("Ignorado en FIFO/SJF")
+        self.priority_input.setPlaceholderText("Solo para algoritmos por Prioridad")
 
         input_layout.addWidget(self.process_id_input, 1, 0)
         input_layout.addWidget(self.arrival_time_input, 1, 1)
@@ -38,28 +83,63 @@ class SchedulerApp(QtWidgets.QWidget):
         button_layout.addWidget(add_button)
 
         self.algorithm_selection = QtWidgets.QComboBox()
-        self.algorithm_selection.addItems(['FIFO', 'SJF', 'Prioridad'])
+        self.algorithm_selection.addItems(list(ALGORITHMS))
         self.algorithm_selection.currentIndexChanged.connect(self.toggle_priority_input)
         button_layout.addWidget(self.algorithm_selection)
 
+        button_layout.addWidget(QtWidgets.QLabel('Quantum'))
+        self.quantum_input = QtWidgets.QSpinBox()
+        self.quantum_input.setRange(1, 1000000)
+        self.quantum_input.setValue(2)
+        self.quantum_input.setDisabled(True)
+        button_layout.addWidget(self.quantum_input)
+
+        button_layout.addWidget(QtWidgets.QLabel('CPUs'))
+        self.cores_input = QtWidgets.QSpinBox()
+        self.cores_input.setRange(1, 4096)
+        self.cores_input.setValue(1)
+        self.cores_input.valueChanged.connect(self.toggle_policy_input)
+        button_layout.addWidget(self.cores_input)
+
+        self.policy_selection = QtWidgets.QComboBox()
+        self.policy_selection.addItems(list(smp.POLICIES))
+        self.policy_selection.setToolTip('Cola de listos compartida o una cola por núcleo con robo de trabajo')
+        self.policy_selection.setDisabled(True)
+        button_layout.addWidget(self.policy_selection)
+
+        self.queue_checkbox = QtWidgets.QCheckBox('Cola de listos')
+        self.queue_checkbox.setToolTip('Instrumentar la ejecución y mostrar la longitud de la cola sobre el diagrama')
+        button_layout.addWidget(self.queue_checkbox)
+
         generate_button = QtWidgets.QPushButton('Generar Diagrama')
         generate_button.clicked.connect(self.generate_gantt)
         button_layout.addWidget(generate_button)
 
+        import_button = QtWidgets.QPushButton('Importar')
+        import_button.clicked.connect(self.import_file)
+        button_layout.addWidget(import_button)
+
+        export_button = QtWidgets.QPushButton('Exportar')
+        export_button.clicked.connect(self.export_files)
+        button_layout.addWidget(export_button)
+
         reset_button = QtWidgets.QPushButton('Reiniciar Todo')
         reset_button.clicked.connect(self.reset_all)
         button_layout.addWidget(reset_button)
 
-        # Tabla para procesos y resultados
-        self.table = QtWidgets.QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(['ID', 'Llegada', 'Ejecución', 'Prioridad', 'Espera', 'Finalización'])
+        # Tabla para procesos y resultados: la vista solo pide las filas visibles
+        self.processes = ProcessTable()
+        self.table_model = ProcessTableModel(self.processes, self)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.table_model)
+        # Filas de alto fijo: la vista no mide cada fila al desplazarse
+        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
         self.table.setAlternatingRowColors(True)
         self.table.setStyleSheet("""
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #B3E5FC;
             }
-            QTableWidget {
+            QTableView {
                 background-color: #F5F5F5;
                 alternate-background-color: #E0F7FA;
                 selection-background-color: #B2EBF2;
@@ -76,6 +156,8 @@ class SchedulerApp(QtWidgets.QWidget):
         main_layout.addWidget(self.table, stretch=3)
 
         # Gráfico de Gantt
+        # matplotlib es la importación más costosa; se carga al crear la ventana, no al importar gui
+        from gantt_chart import GanttChart
         self.gantt_chart = GanttChart(self)
         self.gantt_chart.setMinimumHeight(300)
         self.gantt_chart.setMinimumWidth(800)
@@ -89,9 +171,14 @@ class SchedulerApp(QtWidgets.QWidget):
         self.question_input.setMaximumHeight(100)
         gpt_layout.addWidget(self.question_input)
 
-        ask_button = QtWidgets.QPushButton('Preguntar a GPT')
-        ask_button.clicked.connect(self.ask_openai)
-        gpt_layout.addWidget(ask_button)
+        self.ask_button = QtWidgets.QPushButton('Preguntar a GPT')
+        self.ask_button.clicked.connect(self.ask_openai)
+        gpt_layout.addWidget(self.ask_button)
+
+        self.cancel_button = QtWidgets.QPushButton('Cancelar')
+        self.cancel_button.clicked.connect(self.cancel_question)
+        self.cancel_button.setDisabled(True)
+        gpt_layout.addWidget(self.cancel_button)
 
         main_layout.addLayout(gpt_layout)
 
@@ -102,19 +189,45 @@ class SchedulerApp(QtWidgets.QWidget):
 
         self.setLayout(main_layout)
 
-        # Inicializar lista de procesos y historial de resultados
-        self.processes = []
+        # Inicializar historial de resultados
         self.history = []
+        self.workloads = {}  # Hash de la carga -> copia de los procesos
+        self.result_cache = ResultCache()
+        self.incremental = {}  # Algoritmo -> IncrementalScheduler al día con self.processes
+        self.context_builder = ContextBuilder()
+
+        # Consultas a GPT en segundo plano; solo se muestra la respuesta de la última. Los hilos
+        # solo esperan a la red, así que no se limitan al número de núcleos: una consulta
+        # cancelada no debe dejar en cola a la siguiente
+        self.thread_pool = QtCore.QThreadPool()
+        self.thread_pool.setMaxThreadCount(MAX_GPT_REQUESTS)
+        self.response_cache = None  # Se abre con la primera pregunta (ver ``get_response_cache``)
+        self.current_request = 0
 
     def toggle_priority_input(self):
-        """Habilita o deshabilita el campo de prioridad dependiendo del algoritmo seleccionado."""
+        """Habilita o deshabilita los campos de prioridad y quantum dependiendo del algoritmo seleccionado."""
         algorithm = self.algorithm_selection.currentText()
-        if algorithm in ['FIFO', 'SJF']:
+        if algorithm not in PRIORITY_ALGORITHMS:
             self.priority_input.setDisabled(True)
             self.priority_input.setText('0')
         else:
             self.priority_input.setDisabled(False)
             self.priority_input.clear()
+        self.quantum_input.setDisabled(algorithm != 'Round Robin')
+        # Los algoritmos sin simulación multiprocesador solo se ejecutan en una CPU
+        if algorithm in smp.SMP_ALGORITHMS:
+            self.cores_input.setDisabled(False)
+            self.cores_input.setToolTip('')
+        else:
+            if self.cores_input.value() > 1:
+                QtWidgets.QMessageBox.warning(self, 'Aviso', f'{algorithm} solo se puede simular con una CPU.')
+                self.cores_input.setValue(1)
+            self.cores_input.setDisabled(True)
+            self.cores_input.setToolTip(f'{algorithm} solo se puede simular con una CPU')
+
+    def toggle_policy_input(self):
+        """La política de colas solo tiene sentido con más de un procesador."""
+        self.policy_selection.setDisabled(self.cores_input.value() == 1)
 
     def add_process(self):
         """Agregar un nuevo proceso a la lista de procesos."""
@@ -123,13 +236,15 @@ class SchedulerApp(QtWidgets.QWidget):
             arrival_time = int(self.arrival_time_input.text())
             burst_time = int(self.burst_time_input.text())
 
-            if self.algorithm_selection.currentText() == 'Prioridad':
+            if self.algorithm_selection.currentText() in PRIORITY_ALGORITHMS:
                 priority = int(self.priority_input.text())
             else:
                 priority = 0
 
-            self.processes.append((process_id, arrival_time, burst_time, priority))
-            self.update_table()
+            process = (process_id, arrival_time, burst_time, priority)
+            self.table_model.append_process(process)
+            for scheduler in self.incremental.values():
+                scheduler.add(process)
             self.clear_inputs()
         except ValueError:
             QtWidgets.QMessageBox.warning(self, 'Error', 'Por favor, ingrese valores válidos.')
@@ -142,15 +257,8 @@ class SchedulerApp(QtWidgets.QWidget):
         self.priority_input.clear()
 
     def update_table(self):
-        """Actualizar la tabla de procesos con los datos ingresados."""
-        self.table.setRowCount(len(self.processes))
-        for i, (pid, at, bt, pr) in enumerate(self.processes):
-            self.table.setItem(i, 0, QtWidgets.QTableWidgetItem(pid))
-            self.table.setItem(i, 1, QtWidgets.QTableWidgetItem(str(at)))
-            self.table.setItem(i, 2, QtWidgets.QTableWidgetItem(str(bt)))
-            self.table.setItem(i, 3, QtWidgets.QTableWidgetItem(str(pr)))
-            self.table.setItem(i, 4, QtWidgets.QTableWidgetItem(''))
-            self.table.setItem(i, 5, QtWidgets.QTableWidgetItem(''))
+        """Actualizar la tabla tras modificar la lista de procesos en bloque."""
+        self.table_model.reload()
 
     def generate_gantt(self):
         """Generar el diagrama de Gantt y mostrar métricas según el algoritmo seleccionado."""
@@ -158,98 +266,159 @@ class SchedulerApp(QtWidgets.QWidget):
             QtWidgets.QMessageBox.warning(self, 'Error', 'No hay procesos para programar.')
             return
 
-        self.gantt_chart.ax.clear()
-        self.table.setRowCount(len(self.processes))
-
         algorithm = self.algorithm_selection.currentText()
-
-        if algorithm == 'FIFO':
-            schedule, metrics = fifo(self.processes)
-        elif algorithm == 'SJF':
-            schedule, metrics = sjf(self.processes)
-        elif algorithm == 'Prioridad':
-            schedule, metrics = priority_scheduling(self.processes)
-
+        digest = workload_digest(self.processes)
+        params = {'quantum': self.quantum_input.value()} if algorithm == 'Round Robin' else {}
+        cores = self.cores_input.value() if algorithm in smp.SMP_ALGORITHMS else 1
+        if cores > 1:
+            # Una fila por núcleo en el diagrama de Gantt
+            policy = self.policy_selection.currentText()
+            function = smp.smp_algorithm(algorithm, cores, policy)
+            key = result_key(algorithm, dict(params, cores=cores, policy=policy), digest)
+        else:
+            function = ALGORITHMS[algorithm]
+            key = result_key(algorithm, params, digest)
+
+        tracer = Tracer() if self.queue_checkbox.isChecked() else None
+        # Con instrumentación hay que ejecutar el algoritmo aunque el resultado esté en caché
+        entry = self.result_cache.get(key) if tracer is None else None
+        if entry is None:
+            if tracer is None and cores == 1 and algorithm in INCREMENTAL_KEYS:
+                # Tras agregar un proceso solo se vuelve a simular desde su llegada
+                scheduler = self.incremental.get(algorithm)
+                if scheduler is None or len(scheduler) != len(self.processes):
+                    scheduler = self.incremental[algorithm] = IncrementalScheduler(algorithm, self.processes)
+                schedule, metrics = scheduler.schedule()
+            else:
+                run_params = dict(params, tracer=tracer) if tracer is not None else params
+                schedule, metrics = function(self.processes, **run_params)
+            entry = self.result_cache.put(key, schedule, metrics, algorithm)
+        schedule, metrics = entry.schedule, entry.metrics
+
+        # El historial guarda referencias: una copia por carga distinta y la entrada de la caché
+        if digest not in self.workloads:
+            self.workloads[digest] = self.processes.copy()
         self.history.append({
             'algorithm': algorithm,
-            'processes': self.processes.copy(),
-            'schedule': schedule,
-            'metrics': metrics
+            'workload': digest,
+            'result': entry,
+            'tracer': tracer
         })
+        self.context_builder.add_run(algorithm, self.processes, schedule, metrics)
 
         self.gantt_chart.plot_gantt(schedule)
+        if tracer is not None:
+            self.gantt_chart.plot_queue_depth(*tracer.queue_depth())
         self.show_metrics(metrics)
 
     def show_metrics(self, metrics):
         """Mostrar las métricas de los procesos en la tabla."""
-        total_waiting_time = 0
-        total_turnaround_time = 0
-        num_processes = len(metrics)
-
-        for i, metric in enumerate(metrics):
-            process_id, waiting_time, turnaround_time = metric
-            for row in range(self.table.rowCount()):
-                if self.table.item(row, 0).text() == process_id:
-                    self.table.setItem(row, 4, QtWidgets.QTableWidgetItem(str(waiting_time)))
-                    self.table.setItem(row, 5, QtWidgets.QTableWidgetItem(str(turnaround_time)))
-                    total_waiting_time += waiting_time
-                    total_turnaround_time += turnaround_time
-                    break
-
-        total_row = self.table.rowCount()
-        self.table.insertRow(total_row)
-        self.table.setItem(total_row, 0, QtWidgets.QTableWidgetItem('Totales / Promedios'))
-        self.table.item(total_row, 0).setBackground(QtGui.QColor('#FFEB3B'))
-        self.table.setItem(total_row, 4, QtWidgets.QTableWidgetItem(f'Suma: {total_waiting_time}, Promedio: {total_waiting_time / num_processes:.2f}'))
-        self.table.item(total_row, 4).setBackground(QtGui.QColor('#FFEB3B'))
-        self.table.setItem(total_row, 5, QtWidgets.QTableWidgetItem(f'Suma: {total_turnaround_time}, Promedio: {total_turnaround_time / num_processes:.2f}'))
-        self.table.item(total_row, 5).setBackground(QtGui.QColor('#FFEB3B'))
+        self.table_model.set_metrics(metrics)
+
+    def import_file(self):
+        """Cargar procesos desde CSV, JSONL o formato columnar, o mostrar resultados archivados."""
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, 'Importar', '', IMPORT_FILTER)
+        if not path:
+            return
+        try:
+            if workload_io.file_kind(path) == 'results':
+                schedule, metrics = workload_io.open_results(path)
+                self.gantt_chart.plot_gantt(schedule)
+                self.show_metrics(metrics)
+                return
+            processes = workload_io.load_workload(path)
+        except (OSError, ValueError) as error:
+            QtWidgets.QMessageBox.warning(self, 'Error', f'No se pudo importar {path}: {error}')
+            return
+
+        self.processes = processes
+        self.incremental.clear()
+        self.table_model.set_processes(processes)
+        self.gantt_chart.clear_chart()
+
+    def export_files(self):
+        """Guardar los procesos y, si hay, la última ejecución (y su traza de Chrome) en formato columnar."""
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, 'Exportar procesos', '', BINARY_FILTER)
+        if not path:
+            return
+        if not path.endswith(workload_io.BINARY_EXTENSION):
+            path += workload_io.BINARY_EXTENSION
+        base = path[:-len(workload_io.BINARY_EXTENSION)]
+        try:
+            workload_io.save_processes(path, self.processes)
+            if self.history:
+                last_run = self.history[-1]
+                workload_io.save_results(base + '.resultados' + workload_io.BINARY_EXTENSION,
+                                         last_run['result'].schedule, last_run['result'].metrics)
+                if last_run['tracer'] is not None:
+                    last_run['tracer'].write_chrome_trace(base + '.traza.json')
+        except OSError as error:
+            QtWidgets.QMessageBox.warning(self, 'Error', f'No se pudo exportar {path}: {error}')
 
     def reset_all(self):
         """Reiniciar todos los datos y la interfaz."""
-        self.processes.clear()
+        self.table_model.clear()
         self.history.clear()
-        self.table.setRowCount(0)
-        self.gantt_chart.ax.clear()
-        self.gantt_chart.draw()
+        self.workloads.clear()
+        self.incremental.clear()
+        self.context_builder.clear()
+        self.gantt_chart.clear_chart()
         QtWidgets.QMessageBox.information(self, 'Reiniciar', 'Todos los datos han sido reiniciados.')
 
+    def get_response_cache(self):
+        """Devolver la caché de respuestas de GPT, abriéndola la primera vez (o None si no se puede)."""
+        if self.response_cache is None:
+            try:
+                self.response_cache = ResponseCache()
+            except (sqlite3.Error, OSError):
+                return None  # Se pregunta sin caché y se reintenta en la siguiente consulta
+        return self.response_cache
+
     def ask_openai(self):
-        """Manejar la interacción con OpenAI GPT."""
+        """Manejar la interacción con OpenAI GPT sin bloquear la interfaz."""
         question = self.question_input.toPlainText()
         if question.strip():
             context = self.generate_context()
-            answer = ask_openai(context, question)
-            self.answer_output.setMarkdown(answer)
+            self.current_request += 1
+            worker = GptWorker(self.current_request, context, question, self.get_response_cache())
+            worker.signals.finished.connect(self.show_answer)
+            self.ask_button.setDisabled(True)
+            self.cancel_button.setDisabled(False)
+            self.answer_output.setMarkdown('*Consultando a GPT...*')
+            self.thread_pool.start(worker)
         else:
             QtWidgets.QMessageBox.warning(self, 'Error', 'Por favor, ingrese una pregunta.')
 
-    def generate_context(self):
-        """Generar una descripción detallada del contexto actual de la aplicación."""
-        context = "### Historial Completo de Ejecuciones ###\n"
-
-        for entry in self.history:
-            context += f"\n--- Algoritmo: {entry['algorithm']} ---\n"
-            for process in entry['processes']:
-                pid, at, bt, pr = process
-                context += f"Proceso {pid}: Llegada={at}, Ejecución={bt}, Prioridad={pr}\n"
-
-            context += "\nResultados:\n"
-            for pid, wait, turnaround in entry['metrics']:
-                context += f"Proceso {pid}: Espera={wait}, Finalización={turnaround}\n"
-
-            context += "\nDescripción de la Gráfica de Gantt:\n"
-            for pid, start, end in entry['schedule']:
-                duration = end - start
-                context += f"Proceso {pid}: Inicio={start}, Fin={end}, Duración={duration}\n"
+    def show_answer(self, request_id, answer):
+        """Mostrar la respuesta de GPT si corresponde a la consulta vigente."""
+        if request_id != self.current_request:
+            return
+        self.answer_output.setMarkdown(answer)
+        self.ask_button.setDisabled(False)
+        self.cancel_button.setDisabled(True)
+
+    def cancel_question(self):
+        """
+        Descartar la consulta en curso; su respuesta se ignorará al llegar.
+
+        La cancelación es suave: la petición no se aborta y ocupa su hilo hasta
+        terminar (ver ``GptWorker``), pero se puede preguntar de nuevo enseguida.
+        """
+        self.current_request += 1
+        self.answer_output.setMarkdown('*Consulta cancelada.*')
+        self.ask_button.setDisabled(False)
+        self.cancel_button.setDisabled(True)
 
-        return context
+    def generate_context(self):
+        """Generar una descripción del contexto actual de la aplicación, acotada en tamaño."""
+        return self.context_builder.build()
 
     def show_gantt_chart_fullscreen(self, event):
         """Mostrar el diagrama de Gantt en una ventana más grande al hacer doble clic."""
         dialog = QtWidgets.QDialog(self)
         dialog.setWindowTitle("Diagrama de Gantt Ampliado")
         dialog.setGeometry(50, 50, 1000, 700)
+        from gantt_chart import GanttChart
         gantt_chart_large = GanttChart(dialog)
         gantt_chart_large.setMinimumWidth(950)
         gantt_chart_large.plot_gantt(self.gantt_chart.current_schedule)
@@ -0,0 +1,130 @@
+import bisect
+import math
+from operator import itemgetter
+
+from scheduler import _dispatch_non_preemptive
+
+
+# Clave del heap de cada algoritmo no apropiativo, la misma que usa ``scheduler``
+INCREMENTAL_KEYS = {
+    'FIFO': itemgetter(1),
+    'SJF': itemgetter(2),
+    'Prioridad': itemgetter(3),
+}
+
+
+class IncrementalScheduler:
+    """
+    Planificador no apropiativo que reaprovecha la simulación anterior al cambiar la carga.
+
+    En un algoritmo no apropiativo, lo ocurrido antes de la llegada de un
+    proceso no depende de él. La simulación guarda cada cierto número de
+    despachos un punto de control con el reloj, la siguiente llegada por
+    admitir, una copia de la cola de listos y el número de procesos ya
+    terminados. Al agregar o modificar un proceso, ``schedule`` retoma la
+    simulación desde el último punto de control anterior a la llegada afectada,
+    de modo que solo se vuelve a simular el final del horario. El despacho es el
+    mismo bucle de ``scheduler`` (``_dispatch_non_preemptive``).
+
+    El resultado es idéntico al de las funciones de ``scheduler``, incluidos los
+    desempates por llegada y por posición en la lista de entrada.
+    """
+
+    def __init__(self, algorithm='FIFO', processes=(), checkpoints=32):
+        """
+        Args:
+            algorithm (str): 'FIFO', 'SJF' o 'Prioridad'.
+            processes (list | ProcessTable): Carga inicial.
+            checkpoints (int): Número aproximado de puntos de control por simulación
+                completa; más puntos reaprovechan más trabajo pero copian más veces la
+                cola de listos.
+        """
+        if algorithm not in INCREMENTAL_KEYS:
+            raise ValueError(f"Algoritmo no soportado en modo incremental: {algorithm}")
+        self.algorithm = algorithm
+        self.checkpoints = checkpoints
+        self.reused = 0  # Despachos reaprovechados en el último ``schedule``
+        self._key = INCREMENTAL_KEYS[algorithm]
+        self._processes = list(processes)  # Orden de entrada
+        # Procesos ordenados como el ``sorted`` estable de ``scheduler``; en paralelo, (llegada, posición_de_entrada)
+        self._positions = sorted((process[1], index) for index, process in enumerate(self._processes))
+        self._sorted = [self._processes[index] for _, index in self._positions]
+        self._changed_from = -math.inf
+        self._interval = 1
+        self._checkpoint_clocks = []
+        self._checkpoint_states = []  # (siguiente_llegada, cola_de_listos, despachos)
+        self._gantt = []
+        self._metrics = []
+
+    def __len__(self):
+        return len(self._processes)
+
+    def _changed(self, arrival_time):
+        self._changed_from = min(self._changed_from, arrival_time)
+
+    def _insert(self, index, process):
+        position = bisect.bisect(self._positions, (process[1], index))
+        self._positions.insert(position, (process[1], index))
+        self._sorted.insert(position, process)
+
+    def add(self, process):
+        """Agregar un proceso al final de la lista de entrada."""
+        index = len(self._processes)
+        self._processes.append(process)
+        self._insert(index, process)
+        self._changed(process[1])
+
+    def update(self, index, process):
+        """Reemplazar el proceso en la posición ``index`` de la lista de entrada."""
+        previous = self._processes[index]
+        position = bisect.bisect_left(self._positions, (previous[1], index))
+        del self._positions[position], self._sorted[position]
+        self._processes[index] = process
+        self._insert(index, process)
+        self._changed(min(previous[1], process[1]))
+
+    def schedule(self):
+        """
+        Devolver el horario de la carga actual, simulando solo lo que cambió.
+
+        Returns:
+            gantt_chart (list): Diagrama de Gantt con tuplas (ID, tiempo_inicio, tiempo_fin).
+            metrics (list): Métricas con tuplas (ID, tiempo_espera, tiempo_retorno).
+        """
+        if self._changed_from == math.inf:
+            self.reused = len(self._gantt)
+            return self._gantt, self._metrics
+
+        # Último punto de control cuyo reloj es anterior a la primera llegada modificada
+        position = bisect.bisect_left(self._checkpoint_clocks, self._changed_from) - 1
+        if position < 0:
+            self._interval = max(1, len(self._sorted) // self.checkpoints)
+            del self._checkpoint_clocks[:], self._checkpoint_states[:]
+            start_time, next_arrival, ready, done = 0, 0, [], 0
+        else:
+            start_time = self._checkpoint_clocks[position]
+            next_arrival, ready, done = self._checkpoint_states[position]
+            ready = list(ready)
+            # El punto restaurado se vuelve a guardar en la primera vuelta
+            del self._checkpoint_clocks[position:], self._checkpoint_states[position:]
+
+        # Listas nuevas: los resultados devueltos antes no cambian
+        gantt_chart = self._gantt[:done]
+        metrics = self._metrics[:done]
+        self._simulate(start_time, next_arrival, ready, gantt_chart, metrics)
+        self.reused = done
+        self._gantt, self._metrics = gantt_chart, metrics
+        self._changed_from = math.inf
+        return gantt_chart, metrics
+
+    def _simulate(self, start_time, next_arrival, ready, gantt_chart, metrics):
+        """Retomar el despacho de ``scheduler`` guardando un punto de control cada ``_interval`` despachos."""
+        clocks, states, interval = self._checkpoint_clocks, self._checkpoint_states, self._interval
+
+        def checkpoint(clock, next_arrival, ready):
+            if len(gantt_chart) % interval == 0:
+                clocks.append(clock)
+                states.append((next_arrival, list(ready), len(gantt_chart)))
+
+        _dispatch_non_preemptive(self._sorted, self._key, start_time, next_arrival, ready, gantt_chart, metrics,
+                                 checkpoint=checkpoint)
@@ -0,0 +1,130 @@
+import json
+import time
+from contextlib import contextmanager
+
+
+class Tracer:
+    """
+    Instrumentación opcional de una ejecución de ``scheduler``.
+
+    Los algoritmos aceptan ``tracer=None``; sin tracer solo pagan una
+    comparación con None por despacho. Con un ``Tracer`` se registran los
+    despachos, la longitud de la cola de listos en cada despacho, los huecos en
+    que la CPU está ociosa, las expulsiones y el tiempo real de cada fase
+    (ordenar las llegadas, simular). Cada despacho se notifica además a las
+    funciones registradas con ``add_callback``.
+
+    El resultado se puede exportar como trace-event JSON de Chrome, que se abre
+    en chrome://tracing o en Perfetto.
+    """
+
+    def __init__(self, record_events=True):
+        self.record_events = record_events
+        self.dispatches = 0
+        self.preemptions = 0
+        self.idle_gaps = 0
+        self.idle_time = 0
+        self.max_queue_depth = 0
+        self.phase_times = {}    # fase -> segundos reales acumulados
+        self.events = []         # (ID, inicio, fin, núcleo) de cada despacho
+        self.queue_samples = []  # (tiempo, procesos_en_cola)
+        self.idle_intervals = []
+        self._phase_spans = []   # (fase, inicio, duración) en segundos reales
+        self._callbacks = []
+        self._origin = time.perf_counter()
+
+    def add_callback(self, callback):
+        """Registrar ``callback(pid, inicio, fin, procesos_en_cola, núcleo)`` para cada despacho."""
+        self._callbacks.append(callback)
+
+    @contextmanager
+    def phase(self, name):
+        """Medir el tiempo real de una fase de la simulación."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + elapsed
+            if self.record_events:
+                self._phase_spans.append((name, start - self._origin, elapsed))
+
+    def dispatch(self, pid, start, end, queue_depth, core=0):
+        """Registrar que ``pid`` ocupa la CPU de ``start`` a ``end`` con ``queue_depth`` procesos esperando."""
+        self.dispatches += 1
+        if queue_depth > self.max_queue_depth:
+            self.max_queue_depth = queue_depth
+        if self.record_events:
+            self.events.append((pid, start, end, core))
+            self.queue_samples.append((start, queue_depth))
+        for callback in self._callbacks:
+            callback(pid, start, end, queue_depth, core)
+
+    def idle(self, start, end):
+        """Registrar un hueco en que la CPU no tiene nada que ejecutar."""
+        self.idle_gaps += 1
+        self.idle_time += end - start
+        if self.record_events:
+            self.idle_intervals.append((start, end))
+            self.queue_samples.append((start, 0))
+
+    def preempt(self, pid, time_point):
+        """Registrar que ``pid`` vuelve a la cola sin haber terminado."""
+        self.preemptions += 1
+
+    def queue_depth(self):
+        """
+        Devolver las muestras de la cola de listos como (tiempos, longitudes), ordenadas por tiempo.
+
+        Con varios núcleos (``smp``) cada despacho se registra al cerrar su tramo, así que
+        las muestras no llegan en orden; con un solo CPU ya lo están y ordenar es lineal.
+        """
+        samples = sorted(self.queue_samples, key=lambda sample: sample[0])
+        return [t for t, _ in samples], [d for _, d in samples]
+
+    def summary(self):
+        """Contadores agregados de la ejecución."""
+        return {
+            'dispatches': self.dispatches,
+            'preemptions': self.preemptions,
+            'idle_gaps': self.idle_gaps,
+            'idle_time': self.idle_time,
+            'max_queue_depth': self.max_queue_depth,
+            'phase_times': dict(self.phase_times),
+        }
+
+    def to_chrome_trace(self, time_scale=1000):
+        """
+        Convertir lo registrado a trace-event JSON de Chrome.
+
+        El proceso 1 muestra la línea de tiempo simulada (un hilo por núcleo y un
+        contador con la cola de listos); el proceso 2, las fases en tiempo real.
+
+        Args:
+            time_scale (float): Microsegundos de la traza por unidad de tiempo simulada.
+
+        Returns:
+            dict: Objeto con la clave ``traceEvents``.
+        """
+        events = [
+            {'name': 'process_name', 'ph': 'M', 'pid': 1, 'args': {'name': 'Simulación'}},
+            {'name': 'process_name', 'ph': 'M', 'pid': 2, 'args': {'name': 'Fases (tiempo real)'}},
+        ]
+        for pid, start, end, core in self.events:
+            events.append({'name': str(pid), 'cat': 'dispatch', 'ph': 'X', 'pid': 1, 'tid': core,
+                           'ts': start * time_scale, 'dur': (end - start) * time_scale})
+        for start, end in self.idle_intervals:
+            events.append({'name': 'ocioso', 'cat': 'idle', 'ph': 'X', 'pid': 1, 'tid': 0,
+                           'ts': start * time_scale, 'dur': (end - start) * time_scale})
+        for t, depth in self.queue_samples:
+            events.append({'name': 'cola de listos', 'ph': 'C', 'pid': 1, 'ts': t * time_scale,
+                           'args': {'procesos': depth}})
+        for name, start, elapsed in self._phase_spans:
+            events.append({'name': name, 'cat': 'phase', 'ph': 'X', 'pid': 2, 'tid': 0,
+                           'ts': start * 1e6, 'dur': elapsed * 1e6})
+        return {'traceEvents': events, 'otherData': self.summary()}
+
+    def write_chrome_trace(self, path, time_scale=1000):
+        """Guardar la traza de Chrome en ``path``."""
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_chrome_trace(time_scale), file)
@@ -0,0 +1,133 @@
+import heapq
+import math
+
+
+# Posición de la tupla usada como clave en cada algoritmo (None: orden de llegada)
+ONLINE_KEYS = {
+    'FIFO': None,
+    'SJF': 2,
+    'Prioridad': 3,
+}
+
+
+class OnlineScheduler:
+    """
+    Planificador incremental para flujos de llegadas sin fin.
+
+    Los procesos se envían con ``submit`` y el reloj avanza con ``advance``, que
+    produce las entradas de Gantt y las métricas a medida que los procesos
+    terminan. Solo se guardan los procesos pendientes de llegar y la cola de
+    listos, nunca el historial, así que la memoria no crece con la duración del
+    flujo.
+
+    ``advance(t)`` declara que ya se enviaron todas las llegadas anteriores a
+    ``t``: a partir de ahí ``submit`` rechaza llegadas menores que ``t``. Con esa
+    garantía, cada decisión se toma con la misma información que en las funciones
+    por lotes de ``scheduler`` y los resultados coinciden exactamente, incluidos
+    los desempates por orden de envío.
+    """
+
+    def __init__(self, algorithm='FIFO'):
+        if algorithm not in ONLINE_KEYS:
+            raise ValueError(f"Algoritmo no soportado en modo incremental: {algorithm}")
+        self.algorithm = algorithm
+        self._key_index = ONLINE_KEYS[algorithm]
+        self._pending = []  # Heap de (llegada, orden_de_envio, proceso) aún no llegados
+        self._ready = []    # Heap de (clave, llegada, orden_de_envio, proceso)
+        self._submitted = 0
+        self._horizon = -math.inf
+        self._clock = 0
+        self._running = None  # (entrada_gantt, métrica) del proceso en CPU
+
+    @property
+    def now(self):
+        """Instante en que la CPU queda libre tras el último despacho."""
+        return self._clock
+
+    def __len__(self):
+        """Número de procesos enviados que aún no han terminado."""
+        return len(self._pending) + len(self._ready) + (self._running is not None)
+
+    def submit(self, process):
+        """
+        Enviar un proceso al planificador.
+
+        Args:
+            process (tuple): Tupla (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+
+        Raises:
+            ValueError: Si la llegada es anterior al último ``advance``.
+        """
+        if process[1] < self._horizon:
+            raise ValueError(f"El proceso {process[0]} llega en {process[1]}, antes del tiempo ya simulado ({self._horizon}).")
+        heapq.heappush(self._pending, (process[1], self._submitted, process))
+        self._submitted += 1
+
+    def _admit(self, current_time):
+        """Mover a la cola de listos los procesos que llegaron hasta ``current_time``."""
+        while self._pending and self._pending[0][0] <= current_time:
+            arrival_time, order, process = heapq.heappop(self._pending)
+            key = arrival_time if self._key_index is None else process[self._key_index]
+            heapq.heappush(self._ready, (key, arrival_time, order, process))
+
+    def advance(self, to_time):
+        """
+        Avanzar la simulación hasta ``to_time``.
+
+        Es un generador: hay que consumirlo para que la simulación avance.
+
+        Args:
+            to_time (int): Instante hasta el que se simula; todas las llegadas
+                anteriores deben haberse enviado ya.
+
+        Yields:
+            tuple: Pares ((ID, tiempo_inicio, tiempo_fin), (ID, tiempo_espera, tiempo_retorno))
+                de cada proceso que termina a más tardar en ``to_time``.
+        """
+        self._horizon = max(self._horizon, to_time)
+
+        while True:
+            if self._running is not None:
+                if self._running[0][2] > to_time:
+                    return
+                yield self._running
+                self._running = None
+
+            self._admit(self._clock)
+            if not self._ready:
+                # CPU ociosa: saltar a la siguiente llegada si ya es definitiva
+                if not self._pending or self._pending[0][0] >= to_time:
+                    return
+                self._clock = self._pending[0][0]
+                self._admit(self._clock)
+            elif self._clock >= to_time:
+                return
+
+            _, arrival_time, _, process = heapq.heappop(self._ready)
+            start_time = self._clock
+            end_time = start_time + process[2]
+            self._running = ((process[0], start_time, end_time),
+                             (process[0], start_time - arrival_time, end_time - arrival_time))
+            self._clock = end_time
+
+    def flush(self):
+        """Simular hasta terminar todos los procesos enviados (fin del flujo)."""
+        return self.advance(math.inf)
+
+
+def replay(processes, algorithm='FIFO'):
+    """
+    Reproducir una lista de procesos a través de ``OnlineScheduler``.
+
+    Args:
+        processes (list | ProcessTable): Lista de tuplas (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+        algorithm (str): 'FIFO', 'SJF' o 'Prioridad'.
+
+    Yields:
+        tuple: Los mismos pares (entrada_gantt, métrica) que ``OnlineScheduler.advance``.
+    """
+    scheduler = OnlineScheduler(algorithm)
+    for process in sorted(processes, key=lambda x: x[1]):
+        yield from scheduler.advance(process[1])
+        scheduler.submit(process)
+    yield from scheduler.flush()
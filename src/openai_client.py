@@ -1,37 +1,102 @@
-from openai import OpenAI
 import os
-from dotenv import load_dotenv
+import sqlite3
 
-# Carga variables de entorno desde el archivo .env
-load_dotenv()
+from response_cache import cache_key
 
-# Obtén la API key desde las variables de entorno
-api_key = os.getenv("OPENAI_API_KEY")
+# Cliente compartido; se crea con la primera pregunta (ver ``get_client``)
+client = None
 
-if not api_key:
-    raise ValueError("Falta la API key de OpenAI. Asegúrate de que está definida en el archivo .env.")
+# Modelo y parámetros de generación; también forman parte de la clave de caché
+MODEL = "gpt-4o-mini-2024-07-18"
+COMPLETION_PARAMS = {
+    "max_tokens": 200,  # Limita la respuesta a un máximo de 200 tokens
+    "temperature": 0.4,  # Mantén la temperatura baja para respuestas más deterministas y concisas
+    "top_p": 0.3,  # Reduce ligeramente top-p para limitar la diversidad de las respuestas
+    "frequency_penalty": 0.2,  # Penaliza repeticiones de información
+    "presence_penalty": 0.0  # No penalices la introducción de nueva información
+}
+# Tiempo máximo de espera por petición, en segundos
+DEFAULT_TIMEOUT = 30
 
-# Crear una instancia del cliente OpenAI
-client = OpenAI(api_key=api_key)
+SYSTEM_PROMPT = "Eres un asistente experto que ayuda con preguntas sobre el contexto de la aplicación. Responde de manera concisa y solo proporciona la información más relevante."
 
-def ask_openai(context, question):
-    """Function to handle interaction with OpenAI GPT using the gpt-4 model."""
+
+def get_client():
+    """
+    Devolver el cliente de OpenAI, creándolo la primera vez.
+
+    Importar ``openai`` y leer el archivo .env cuesta bastante, así que se hace
+    solo cuando realmente se va a preguntar algo; importar este módulo no
+    requiere la API key.
+
+    Raises:
+        ValueError: Si falta la API key.
+    """
+    global client
+    if client is None:
+        from dotenv import load_dotenv
+        from openai import OpenAI
+
+        # Carga variables de entorno desde el archivo .env
+        load_dotenv()
+
+        # Obtén la API key desde las variables de entorno
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("Falta la API key de OpenAI. Asegúrate de que está definida en el archivo .env.")
+
+        # Crear una instancia del cliente OpenAI
+        client = OpenAI(api_key=api_key)
+    return client
+
+
+def ask_openai(context, question, cache=None, timeout=DEFAULT_TIMEOUT, openai_client=None):
+    """
+    Function to handle interaction with OpenAI GPT using the gpt-4 model.
+
+    Las respuestas correctas se guardan en ``cache`` (si se indica) con una clave
+    derivada de (contexto, pregunta, modelo, parámetros); los errores nunca se
+    guardan. Si la caché no se puede leer o escribir, se pregunta sin ella.
+
+    Args:
+        context (str): Contexto de la aplicación.
+        question (str): Pregunta del usuario.
+        cache (ResponseCache, optional): Caché de respuestas en disco.
+        timeout (float): Segundos máximos de espera por la respuesta.
+        openai_client (OpenAI, optional): Cliente a usar en lugar del global.
+
+    Returns:
+        str: Respuesta del modelo o un mensaje de error.
+    """
     # Mensaje del sistema que indica una respuesta concisa y precisa
     messages = [
-        {"role": "system", "content": "Eres un asistente experto que ayuda con preguntas sobre el contexto de la aplicación. Responde de manera concisa y solo proporciona la información más relevante."},
+        {"role": "system", "content": SYSTEM_PROMPT},
         {"role": "user", "content": f"Contexto de la aplicación:\n{context}\n\nPregunta del usuario:\n{question}"}
     ]
 
+    key = cache_key(context, question, MODEL, COMPLETION_PARAMS, SYSTEM_PROMPT)
+    if cache is not None:
+        try:
+            cached = cache.get(key)
+        except (sqlite3.Error, OSError):
+            cached = None  # Caché dañada o bloqueada: se trata como un fallo
+        if cached is not None:
+            return cached
+
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini-2024-07-18",  # Modelo a usar
+        response = (openai_client or get_client()).chat.completions.create(
+            model=MODEL,  # Modelo a usar
             messages=messages,
-            max_tokens=200,  # Limita la respuesta a un máximo de 100 tokens
-            temperature=0.4,  # Mantén la temperatura baja para respuestas más deterministas y concisas
-            top_p=0.3,  # Reduce ligeramente top-p para limitar la diversidad de las respuestas
-            frequency_penalty=0.2,  # Penaliza repeticiones de información
-            presence_penalty=0.0  # No penalices la introducción de nueva información
+            timeout=timeout,
+            **COMPLETION_PARAMS
         )
-        return response.choices[0].message.content.strip()
+        answer = response.choices[0].message.content.strip()
     except Exception as e:
         return f'Error al contactar con OpenAI: {str(e)}'
+
+    if cache is not None:
+        try:
+            cache.put(key, answer)
+        except (sqlite3.Error, OSError):
+            pass  # La caché es opcional
+    return answer
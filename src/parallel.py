@@ -0,0 +1,58 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+from scheduler import ALGORITHMS
+
+
+def resolve_algorithms(algorithms=None):
+    """
+    Convertir nombres de algoritmos en funciones dentro del proceso principal.
+
+    Los algoritmos agregados con ``scheduler.register_algorithm`` solo existen
+    en el proceso que los registró: con los métodos de inicio ``spawn`` o
+    ``forkserver`` los trabajadores no los ven. Por eso a los trabajadores se
+    envía la función, que se serializa por su nombre de módulo.
+
+    Args:
+        algorithms (list, optional): Nombres registrados en ``scheduler.ALGORITHMS``
+            o funciones a nivel de módulo; por defecto, todos los registrados.
+
+    Returns:
+        labels (list): Nombre de cada algoritmo para los resultados y los parámetros.
+        functions (list): Función de cada algoritmo.
+
+    Raises:
+        ValueError: Si algún nombre no está registrado.
+    """
+    if algorithms is None:
+        algorithms = list(ALGORITHMS)
+    unknown = [a for a in algorithms if isinstance(a, str) and a not in ALGORITHMS]
+    if unknown:
+        raise ValueError(f"Algoritmos no registrados: {', '.join(unknown)}")
+    labels = [a if isinstance(a, str) else a.__name__ for a in algorithms]
+    functions = [ALGORITHMS[a] if isinstance(a, str) else a for a in algorithms]
+    return labels, functions
+
+
+def run_tasks(function, tasks, max_workers=None, initializer=None, initargs=(), mp_context=None):
+    """
+    Ejecutar ``function(*task)`` para cada tarea y devolver los resultados en orden.
+
+    Con ``max_workers`` igual a 1 las tareas se ejecutan en el proceso actual y
+    ``initializer`` no se llama; si no, en un ``ProcessPoolExecutor``.
+
+    Args:
+        function (callable): Función a nivel de módulo.
+        tasks (list): Tuplas de argumentos serializables.
+        max_workers (int, optional): Número de procesos; por defecto, el número de núcleos.
+        initializer (callable, optional): Inicializador de cada trabajador.
+        initargs (tuple): Argumentos de ``initializer``.
+        mp_context (multiprocessing.context.BaseContext, optional): Contexto de
+            ``multiprocessing`` con el que se crean los trabajadores.
+    """
+    if (max_workers or os.cpu_count() or 1) == 1:
+        return [function(*task) for task in tasks]
+    with ProcessPoolExecutor(max_workers, mp_context=mp_context, initializer=initializer,
+                             initargs=initargs) as executor:
+        futures = [executor.submit(function, *task) for task in tasks]
+        return [future.result() for future in futures]
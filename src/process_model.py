@@ -0,0 +1,160 @@
+import numpy as np
+from PyQt5 import QtCore, QtGui
+
+
+HEADERS = ['ID', 'Llegada', 'Ejecución', 'Prioridad', 'Espera', 'Finalización']
+WAITING_COLUMN = 4
+TURNAROUND_COLUMN = 5
+TOTALS_COLOR = '#FFEB3B'
+
+
+class ProcessTableModel(QtCore.QAbstractTableModel):
+    """
+    Modelo de Qt para la tabla de procesos, respaldado por un ``ProcessTable``.
+
+    La vista solo pide los datos de las filas visibles, así que cargar cientos de
+    miles de procesos no crea ningún widget por celda. Un índice ID -> fila
+    permite actualizar las métricas en O(1) por proceso, y ``set_metrics`` emite
+    ``dataChanged`` únicamente para las columnas de métricas afectadas. Cuando hay
+    métricas, se agrega una fila final con totales y promedios.
+    """
+
+    def __init__(self, processes, parent=None):
+        super().__init__(parent)
+        self.processes = processes
+        self._pid_rows = {}
+        self._metrics = {}   # fila -> (tiempo_espera, tiempo_retorno)
+        self._totals = None  # Textos de espera y retorno de la fila de totales
+        self._index_pids(0)
+
+    def _index_pids(self, first):
+        # Con IDs repetidos se usa la primera fila, como hacía la tabla original
+        codes, rows = np.unique(self.processes.column('codes')[first:], return_index=True)
+        for code, row in zip(codes.tolist(), rows.tolist()):
+            self._pid_rows.setdefault(self.processes.pid(code), first + row)
+
+    def row_of(self, pid):
+        """Fila del proceso con ese ID, o None."""
+        return self._pid_rows.get(pid)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.processes) + (self._totals is not None)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+
+        if row == len(self.processes):
+            if role == QtCore.Qt.DisplayRole:
+                if column == 0:
+                    return 'Totales / Promedios'
+                if column in (WAITING_COLUMN, TURNAROUND_COLUMN):
+                    return self._totals[column - WAITING_COLUMN]
+            elif role == QtCore.Qt.BackgroundRole and column in (0, WAITING_COLUMN, TURNAROUND_COLUMN):
+                return QtGui.QColor(TOTALS_COLOR)
+            return None
+
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        if column == 0:
+            return self.processes.pid(self.processes.codes[row])
+        if column == 1:
+            return str(self.processes.arrival[row])
+        if column == 2:
+            return str(self.processes.burst[row])
+        if column == 3:
+            return str(self.processes.priority[row])
+        metric = self._metrics.get(row)
+        return '' if metric is None else str(metric[column - WAITING_COLUMN])
+
+    def append_process(self, process):
+        """Agregar un proceso al final; las métricas anteriores dejan de ser válidas."""
+        self.clear_metrics()
+        row = len(self.processes)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self.processes.append(process)
+        self._index_pids(row)
+        self.endInsertRows()
+
+    def set_processes(self, processes):
+        """Mostrar otra tabla de procesos, por ejemplo tras importar una carga."""
+        self.processes = processes
+        self.reload()
+
+    def reload(self):
+        """Reconstruir el modelo tras cambiar el ``ProcessTable`` en bloque."""
+        self.beginResetModel()
+        self._pid_rows = {}
+        self._metrics = {}
+        self._totals = None
+        self._index_pids(0)
+        self.endResetModel()
+
+    def clear(self):
+        """Eliminar todos los procesos y métricas."""
+        self.processes.clear()
+        self.reload()
+
+    def clear_metrics(self):
+        """Vaciar las columnas de métricas y quitar la fila de totales."""
+        if self._totals is not None:
+            totals_row = len(self.processes)
+            self.beginRemoveRows(QtCore.QModelIndex(), totals_row, totals_row)
+            self._totals = None
+            self.endRemoveRows()
+        if self._metrics:
+            rows = self._metrics.keys()
+            first, last = min(rows), max(rows)
+            self._metrics = {}
+            self.dataChanged.emit(self.index(first, WAITING_COLUMN), self.index(last, TURNAROUND_COLUMN))
+
+    def set_metrics(self, metrics):
+        """
+        Mostrar las métricas de una ejecución.
+
+        Args:
+            metrics (list): Tuplas (ID, tiempo_espera, tiempo_retorno).
+        """
+        if not metrics:
+            self.clear_metrics()
+            return
+
+        previous_rows = self._metrics.keys()
+        new_metrics = {}
+        total_waiting_time = 0
+        total_turnaround_time = 0
+        for process_id, waiting_time, turnaround_time in metrics:
+            row = self._pid_rows.get(process_id)
+            if row is not None:
+                new_metrics[row] = (waiting_time, turnaround_time)
+                total_waiting_time += waiting_time
+                total_turnaround_time += turnaround_time
+
+        changed = previous_rows | new_metrics.keys()
+        self._metrics = new_metrics
+        if changed:
+            self.dataChanged.emit(self.index(min(changed), WAITING_COLUMN),
+                                  self.index(max(changed), TURNAROUND_COLUMN))
+
+        num_processes = len(metrics)
+        totals = (f'Suma: {total_waiting_time}, Promedio: {total_waiting_time / num_processes:.2f}',
+                  f'Suma: {total_turnaround_time}, Promedio: {total_turnaround_time / num_processes:.2f}')
+        totals_row = len(self.processes)
+        if self._totals is None:
+            self.beginInsertRows(QtCore.QModelIndex(), totals_row, totals_row)
+            self._totals = totals
+            self.endInsertRows()
+        else:
+            self._totals = totals
+            self.dataChanged.emit(self.index(totals_row, 0), self.index(totals_row, TURNAROUND_COLUMN))
@@ -0,0 +1,186 @@
+from array import array
+
+
+COLUMNS = ('arrival', 'burst', 'priority')
+
+
+class ProcessTable:
+    """
+    Tabla columnar y compacta de procesos.
+
+    Guarda cada campo en un ``array('q')`` de enteros de 64 bits y reemplaza los
+    IDs por códigos enteros internados, de modo que cada proceso ocupa 32 bytes
+    en lugar de una tupla con cuatro objetos. El pool de IDs se comparte entre
+    copias, así que ``copy()`` solo duplica las columnas.
+
+    Iterar la tabla produce las mismas tuplas (ID, tiempo_llegada, tiempo_ejecucion,
+    prioridad) que usan los algoritmos de ``scheduler``, que la aceptan sin cambios.
+
+    Una tabla creada con ``from_mapped`` usa directamente arreglos NumPy de solo
+    lectura (por ejemplo, mapeados desde un archivo de ``workload_io``) y solo los
+    copia a ``array('q')`` si se modifica.
+    """
+
+    def __init__(self, processes=()):
+        self._pids = []        # código -> ID
+        self._pid_codes = {}   # ID -> código
+        self.codes = array('q')
+        self.arrival = array('q')
+        self.burst = array('q')
+        self.priority = array('q')
+        self.extend(processes)
+
+    @classmethod
+    def from_columns(cls, pids, arrival, burst, priority=None):
+        """
+        Construir una tabla a partir de columnas (listas o arreglos NumPy).
+
+        Args:
+            pids (iterable): IDs de los procesos.
+            arrival (array): Tiempos de llegada.
+            burst (array): Tiempos de ejecución.
+            priority (array, optional): Prioridades; cero si no se indican.
+
+        Returns:
+            ProcessTable: Nueva tabla con las columnas copiadas.
+        """
+        import numpy as np
+
+        table = cls()
+        for pid in pids:
+            table.codes.append(table._intern(pid))
+        for name, values in (('arrival', arrival), ('burst', burst)):
+            getattr(table, name).frombytes(np.ascontiguousarray(values, dtype=np.int64).tobytes())
+        if priority is None:
+            table.priority.frombytes(bytes(8 * len(table.codes)))
+        else:
+            table.priority.frombytes(np.ascontiguousarray(priority, dtype=np.int64).tobytes())
+        if not len(table.codes) == len(table.arrival) == len(table.burst) == len(table.priority):
+            raise ValueError("Todas las columnas deben tener el mismo tamaño.")
+        return table
+
+    @classmethod
+    def from_mapped(cls, pids, codes, arrival, burst, priority):
+        """
+        Envolver columnas NumPy de solo lectura sin copiarlas.
+
+        Args:
+            pids (sequence): Pool de IDs indexado por código.
+            codes, arrival, burst, priority (numpy.ndarray): Columnas int64.
+
+        Returns:
+            ProcessTable: Tabla que comparte la memoria de las columnas.
+        """
+        if not len(codes) == len(arrival) == len(burst) == len(priority):
+            raise ValueError("Todas las columnas deben tener el mismo tamaño.")
+        table = cls.__new__(cls)
+        table._pids = pids
+        table._pid_codes = None  # Se construye al modificar la tabla
+        table.codes, table.arrival, table.burst, table.priority = codes, arrival, burst, priority
+        return table
+
+    @property
+    def mapped(self):
+        """True si las columnas son arreglos de solo lectura compartidos."""
+        return self._pid_codes is None
+
+    def _make_writable(self):
+        import numpy as np
+
+        self._pids = list(self._pids)
+        self._pid_codes = {pid: code for code, pid in enumerate(self._pids)}
+        for name in ('codes',) + COLUMNS:
+            column = array('q')
+            column.frombytes(np.ascontiguousarray(getattr(self, name), dtype=np.int64).tobytes())
+            setattr(self, name, column)
+
+    def _intern(self, pid):
+        code = self._pid_codes.get(pid)
+        if code is None:
+            code = len(self._pids)
+            self._pid_codes[pid] = code
+            self._pids.append(pid)
+        return code
+
+    def append(self, process):
+        """Agregar una tupla (ID, tiempo_llegada, tiempo_ejecucion, prioridad)."""
+        pid, arrival_time, burst_time, priority = process
+        if self._pid_codes is None:
+            self._make_writable()
+        self.codes.append(self._intern(pid))
+        self.arrival.append(arrival_time)
+        self.burst.append(burst_time)
+        self.priority.append(priority)
+
+    def extend(self, processes):
+        """Agregar varias tuplas de proceso."""
+        for process in processes:
+            self.append(process)
+
+    def clear(self):
+        """Eliminar todos los procesos y liberar el pool de IDs."""
+        self._pids = []
+        self._pid_codes = {}
+        for name in ('codes',) + COLUMNS:
+            setattr(self, name, array('q'))
+
+    def copy(self):
+        """Copiar las columnas compartiendo el pool de IDs (que solo crece)."""
+        table = ProcessTable.__new__(ProcessTable)
+        table._pids = self._pids
+        table._pid_codes = self._pid_codes
+        for name in ('codes',) + COLUMNS:
+            values = getattr(self, name)
+            # Las columnas mapeadas no cambian, así que se pueden compartir
+            setattr(table, name, values if self.mapped else array('q', values))
+        return table
+
+    def pid(self, code):
+        """Devolver el ID asociado a un código interno."""
+        return self._pids[code]
+
+    def pids(self):
+        """Devolver el pool de IDs, indexado por código."""
+        return self._pids
+
+    def column(self, name):
+        """Devolver una columna como vista NumPy de solo lectura, sin copiarla."""
+        # NumPy se importa aquí para que la tabla pueda usarse sin cargarlo (p. ej. en la CLI)
+        import numpy as np
+
+        values = getattr(self, name)
+        if isinstance(values, np.ndarray):
+            return values
+        values = np.frombuffer(values, dtype=np.int64)
+        values.flags.writeable = False
+        return values
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __iter__(self):
+        if self.mapped:
+            return self._iter_mapped()
+        return zip(map(self._pids.__getitem__, self.codes), self.arrival, self.burst, self.priority)
+
+    def _iter_mapped(self, chunk_size=65536):
+        # Convertir por bloques evita crear un escalar NumPy por campo
+        for start in range(0, len(self), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            yield from zip(map(self._pids.__getitem__, self.codes[chunk].tolist()), self.arrival[chunk].tolist(),
+                           self.burst[chunk].tolist(), self.priority[chunk].tolist())
+
+    def __getitem__(self, index):
+        # Las claves de texto devuelven columnas, como en un arreglo estructurado
+        if isinstance(index, str):
+            return self.column(index)
+        return (self._pids[self.codes[index]], int(self.arrival[index]), int(self.burst[index]),
+                int(self.priority[index]))
+
+    def __eq__(self, other):
+        if not isinstance(other, ProcessTable):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return f'ProcessTable({len(self)} procesos)'
@@ -0,0 +1,70 @@
+from contextlib import contextmanager
+import hashlib
+import json
+import os
+import sqlite3
+
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'algoritmos_despacho', 'respuestas_gpt.sqlite3')
+
+
+def cache_key(*parts):
+    """Hash SHA-256 estable de cualquier combinación de valores serializables en JSON."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """
+    Caché LRU en disco (SQLite) para respuestas de GPT.
+
+    Cada operación abre su propia conexión, por lo que la caché puede usarse
+    desde los hilos de trabajo de la GUI sin compartir conexiones.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=500):
+        self.path = path
+        self.max_entries = max_entries
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS responses ('
+                               'key TEXT PRIMARY KEY, answer TEXT NOT NULL, last_used INTEGER NOT NULL)')
+            connection.execute('CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)')
+
+    @contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=10)
+        try:
+            with connection:  # Confirma o revierte la transacción
+                yield connection
+        finally:
+            connection.close()
+
+    def get(self, key):
+        """Devolver la respuesta guardada para ``key`` (o None) y marcarla como reciente."""
+        with self._connect() as connection:
+            row = connection.execute('SELECT answer FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            connection.execute('UPDATE responses SET last_used = '
+                               '(SELECT COALESCE(MAX(last_used), 0) + 1 FROM responses) WHERE key = ?', (key,))
+            return row[0]
+
+    def put(self, key, answer):
+        """Guardar una respuesta y descartar las menos usadas si se supera ``max_entries``."""
+        with self._connect() as connection:
+            connection.execute('INSERT OR REPLACE INTO responses (key, answer, last_used) VALUES '
+                               '(?, ?, (SELECT COALESCE(MAX(last_used), 0) + 1 FROM responses))', (key, answer))
+            connection.execute('DELETE FROM responses WHERE key NOT IN '
+                               '(SELECT key FROM responses ORDER BY last_used DESC LIMIT ?)', (self.max_entries,))
+
+    def clear(self):
+        """Eliminar todas las respuestas guardadas."""
+        with self._connect() as connection:
+            connection.execute('DELETE FROM responses')
+
+    def __len__(self):
+        with self._connect() as connection:
+            return connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
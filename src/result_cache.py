@@ -0,0 +1,163 @@
+from collections import OrderedDict, namedtuple
+import hashlib
+import os
+
+from process_table import COLUMNS, ProcessTable
+from response_cache import cache_key
+import workload_io
+
+
+# Estimación de memoria de una fila de resultados: la tupla y sus enteros
+ROW_BYTES = 100
+
+CacheEntry = namedtuple('CacheEntry', ['key', 'algorithm', 'schedule', 'metrics', 'size'])
+
+
+def workload_digest(processes):
+    """
+    Hash SHA-256 del contenido de una carga de procesos.
+
+    Dos cargas con las mismas tuplas en el mismo orden tienen el mismo hash,
+    sean listas o ``ProcessTable`` y con independencia de sus códigos internos.
+    """
+    if not isinstance(processes, ProcessTable):
+        processes = ProcessTable(processes)
+    digest = hashlib.sha256()
+    pids = processes.pids()
+    codes = processes.codes.tolist() if processes.mapped else processes.codes
+    digest.update('\x00'.join(map(repr, map(pids.__getitem__, codes))).encode('utf-8'))
+    for name in COLUMNS:
+        digest.update(b'\x01')
+        digest.update(processes.column(name).tobytes())
+    return digest.hexdigest()
+
+
+def result_key(algorithm, params, digest):
+    """Clave de una ejecución: algoritmo, parámetros (serializables en JSON) y hash de la carga."""
+    return cache_key(algorithm, params, digest)
+
+
+class ResultCache:
+    """
+    Caché LRU de resultados de planificación, direccionada por contenido.
+
+    Cada entrada se identifica con ``result_key`` y guarda el diagrama de Gantt
+    y las métricas de una ejecución. En memoria se descartan las entradas menos
+    usadas al superar ``max_entries`` o ``max_bytes`` (estimados por fila).
+
+    Con ``directory`` las entradas se guardan además en disco con el formato
+    binario de ``workload_io``; al reabrirlas se mapean en memoria sin
+    parsearlas. El directorio se limita a ``max_disk_bytes`` descartando los
+    archivos usados hace más tiempo.
+    """
+
+    def __init__(self, max_entries=64, max_bytes=256 * 2 ** 20, directory=None, max_disk_bytes=2 ** 30):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+        self._entries = OrderedDict()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + workload_io.BINARY_EXTENSION)
+
+    def get(self, key):
+        """Devolver la entrada de ``key`` (o None) y marcarla como reciente."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        if self.directory and os.path.exists(self._path(key)):
+            try:
+                schedule, metrics = workload_io.open_results(self._path(key))
+                os.utime(self._path(key))
+            except (OSError, ValueError):
+                pass  # Archivo incompleto o de otra versión: se recalcula
+            else:
+                self.hits += 1
+                return self._store(CacheEntry(key, None, schedule, metrics, self._estimate(schedule, metrics)))
+        self.misses += 1
+        return None
+
+    def put(self, key, schedule, metrics, algorithm=None):
+        """Guardar el resultado de una ejecución y devolver su entrada."""
+        entry = self._store(CacheEntry(key, algorithm, schedule, metrics, self._estimate(schedule, metrics)))
+        if self.directory:
+            try:
+                workload_io.save_results(self._path(key), schedule, metrics)
+                self._trim_directory()
+            except OSError:
+                pass  # La caché en disco es opcional
+        return entry
+
+    def run(self, algorithm, processes, function, params=None, digest=None):
+        """
+        Devolver el resultado de ``function(processes, **params)``, calculándolo solo si no está en la caché.
+
+        Args:
+            algorithm (str): Nombre del algoritmo, parte de la clave.
+            processes (list | ProcessTable): Carga de procesos.
+            function (callable): Algoritmo con la firma de ``scheduler``.
+            params (dict, optional): Parámetros serializables en JSON.
+            digest (str, optional): ``workload_digest(processes)`` si ya se calculó.
+
+        Returns:
+            CacheEntry: Entrada con el diagrama de Gantt y las métricas.
+        """
+        params = params or {}
+        key = result_key(algorithm, params, digest or workload_digest(processes))
+        entry = self.get(key)
+        if entry is None:
+            schedule, metrics = function(processes, **params)
+            entry = self.put(key, schedule, metrics, algorithm)
+        return entry
+
+    @staticmethod
+    def _estimate(schedule, metrics):
+        return (len(schedule) + len(metrics)) * ROW_BYTES
+
+    def _store(self, entry):
+        previous = self._entries.pop(entry.key, None)
+        if previous is not None:
+            self.size -= previous.size
+        self._entries[entry.key] = entry
+        self.size += entry.size
+        # La entrada recién guardada se conserva aunque por sí sola supere el límite
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self.size > self.max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.size
+        return entry
+
+    def _trim_directory(self):
+        files = []
+        for name in os.listdir(self.directory):
+            if name.endswith(workload_io.BINARY_EXTENSION):
+                stat = os.stat(os.path.join(self.directory, name))
+                files.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in files)
+        for _, size, name in sorted(files)[:-1]:
+            if total <= self.max_disk_bytes:
+                break
+            os.remove(os.path.join(self.directory, name))
+            total -= size
+
+    def clear(self, disk=False):
+        """Vaciar la caché en memoria y, con ``disk``, también los archivos guardados."""
+        self._entries.clear()
+        self.size = 0
+        if disk and self.directory:
+            for name in os.listdir(self.directory):
+                if name.endswith(workload_io.BINARY_EXTENSION):
+                    os.remove(os.path.join(self.directory, name))
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
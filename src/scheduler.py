@@ -1,108 +1,577 @@
-def fifo(processes):
+import heapq
+import math
+from collections import deque
+from contextlib import nullcontext
+from operator import itemgetter
+
+
+def _phase(tracer, name):
+    """Medir una fase con el tracer, si lo hay (ver ``instrumentation.Tracer``)."""
+    return nullcontext() if tracer is None else tracer.phase(name)
+
+
+def fifo(processes, tracer=None):
     """
     Algoritmo de planificación FIFO (First In, First Out).
 
     Args:
-        processes (list): Lista de tuplas (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+        processes (list | ProcessTable): Lista de tuplas (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+        tracer (Tracer, optional): Instrumentación de la ejecución.
 
     Returns:
         gantt_chart (list): Diagrama de Gantt con tuplas (ID, tiempo_inicio, tiempo_fin).
         metrics (list): Métricas con tuplas (ID, tiempo_espera, tiempo_retorno).
     """
-    sorted_processes = sorted(processes, key=lambda x: x[1])  # Ordenar por tiempo de llegada
+    with _phase(tracer, 'ordenar llegadas'):
+        sorted_processes = sorted(processes, key=lambda x: x[1])  # Ordenar por tiempo de llegada
     start_time = 0
+    arrived = 0  # Procesos que ya llegaron; solo se usa con tracer
     gantt_chart = []
     metrics = []
 
-    for process in sorted_processes:
-        pid, arrival_time, burst_time, _ = process
-        
-        if start_time < arrival_time:
-            start_time = arrival_time
-        
-        end_time = start_time + burst_time
-        waiting_time = start_time - arrival_time
-        turnaround_time = end_time - arrival_time
-        
-        gantt_chart.append((pid, start_time, end_time))
-        metrics.append((pid, waiting_time, turnaround_time))
-        
-        start_time = end_time  # Actualizar tiempo de inicio para el siguiente proceso
+    with _phase(tracer, 'simulación'):
+        for position, process in enumerate(sorted_processes):
+            pid, arrival_time, burst_time, _ = process
+
+            if start_time < arrival_time:
+                if tracer is not None:
+                    tracer.idle(start_time, arrival_time)
+                start_time = arrival_time
+
+            end_time = start_time + burst_time
+            waiting_time = start_time - arrival_time
+            turnaround_time = end_time - arrival_time
+
+            gantt_chart.append((pid, start_time, end_time))
+            metrics.append((pid, waiting_time, turnaround_time))
+
+            if tracer is not None:
+                while arrived < len(sorted_processes) and sorted_processes[arrived][1] <= start_time:
+                    arrived += 1
+                tracer.dispatch(pid, start_time, end_time, arrived - position - 1)
+
+            start_time = end_time  # Actualizar tiempo de inicio para el siguiente proceso
 
     return gantt_chart, metrics
-def sjf(processes):
+
+
+def _run_non_preemptive(processes, key, tracer=None):
     """
-    Algoritmo de planificación SJF (Shortest Job First).
+    Núcleo de eventos discretos compartido por los algoritmos no apropiativos.
+
+    Recorre las llegadas en orden y las inserta en un min-heap indexado por
+    ``key(process)`` a medida que el reloj las alcanza. Cada despacho
+    cuesta O(log n), por lo que la simulación completa es O(n log n).
+
+    Los empates se resuelven de forma estable: gana el proceso que llegó antes y,
+    a igual llegada, el que aparece primero en la lista de entrada.
 
     Args:
-        processes (list): Lista de tuplas (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+        processes (list | ProcessTable): Lista de tuplas (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+        key (callable): Función proceso -> clave del heap, fija mientras el proceso espera.
+        tracer (Tracer, optional): Instrumentación de la ejecución.
 
     Returns:
         gantt_chart (list): Diagrama de Gantt con tuplas (ID, tiempo_inicio, tiempo_fin).
         metrics (list): Métricas con tuplas (ID, tiempo_espera, tiempo_retorno).
     """
-    sorted_processes = sorted(processes, key=lambda x: x[1])
-    remaining_processes = sorted_processes.copy()
-    start_time = 0
+    with _phase(tracer, 'ordenar llegadas'):
+        sorted_processes = sorted(processes, key=lambda x: x[1])
     gantt_chart = []
     metrics = []
 
-    while remaining_processes:
-        available_processes = [p for p in remaining_processes if p[1] <= start_time]
-        
-        if not available_processes:
-            start_time = min(p[1] for p in remaining_processes)
-            continue
+    with _phase(tracer, 'simulación'):
+        _dispatch_non_preemptive(sorted_processes, key, 0, 0, [], gantt_chart, metrics, tracer)
+
+    return gantt_chart, metrics
+
+
+def _dispatch_non_preemptive(sorted_processes, key, start_time, next_arrival, ready, gantt_chart, metrics,
+                             tracer=None, checkpoint=None):
+    """
+    Bucle de despacho de ``_run_non_preemptive``, reanudable desde un estado intermedio.
+
+    Agrega los tramos a ``gantt_chart`` y ``metrics`` y consume ``ready``.
+
+    Args:
+        sorted_processes (list): Procesos ordenados (de forma estable) por llegada.
+        key (callable): Función proceso -> clave del heap.
+        start_time (int): Reloj al retomar la simulación.
+        next_arrival (int): Posición en ``sorted_processes`` de la siguiente llegada por admitir.
+        ready (list): Heap de (clave, orden_de_llegada, proceso) con los procesos en cola.
+        gantt_chart (list): Diagrama de Gantt hasta ``start_time``.
+        metrics (list): Métricas de los procesos ya terminados.
+        tracer (Tracer, optional): Instrumentación de la ejecución.
+        checkpoint (callable, optional): Se llama con (reloj, siguiente_llegada, cola_de_listos)
+            antes de cada despacho (ver ``incremental.IncrementalScheduler``).
+    """
+    num_processes = len(sorted_processes)
+    while next_arrival < num_processes or ready:
+        if checkpoint is not None:
+            checkpoint(start_time, next_arrival, ready)
+
+        # CPU ociosa: saltar directamente a la siguiente llegada
+        if not ready and sorted_processes[next_arrival][1] > start_time:
+            if tracer is not None:
+                tracer.idle(start_time, sorted_processes[next_arrival][1])
+            start_time = sorted_processes[next_arrival][1]
+
+        while next_arrival < num_processes and sorted_processes[next_arrival][1] <= start_time:
+            process = sorted_processes[next_arrival]
+            heapq.heappush(ready, (key(process), next_arrival, process))
+            next_arrival += 1
+
+        _, _, next_process = heapq.heappop(ready)
 
-        next_process = min(available_processes, key=lambda x: x[2])
-        remaining_processes.remove(next_process)
-        
         pid, arrival_time, burst_time, _ = next_process
         end_time = start_time + burst_time
         waiting_time = start_time - arrival_time
         turnaround_time = end_time - arrival_time
-        
+
         gantt_chart.append((pid, start_time, end_time))
         metrics.append((pid, waiting_time, turnaround_time))
-        
+        if tracer is not None:
+            tracer.dispatch(pid, start_time, end_time, len(ready))
+
         start_time = end_time
 
+
+def sjf(processes, tracer=None):
+    """
+    Algoritmo de planificación SJF (Shortest Job First).
+
+    Args:
+        processes (list | ProcessTable): Lista de tuplas (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+        tracer (Tracer, optional): Instrumentación de la ejecución.
+
+    Returns:
+        gantt_chart (list): Diagrama de Gantt con tuplas (ID, tiempo_inicio, tiempo_fin).
+        metrics (list): Métricas con tuplas (ID, tiempo_espera, tiempo_retorno).
+    """
+    return _run_non_preemptive(processes, key=itemgetter(2), tracer=tracer)
+
+
+def priority_scheduling(processes, tracer=None):
+    """
+    Algoritmo de planificación por Prioridad (menor valor, mayor prioridad).
+
+    Args:
+        processes (list | ProcessTable): Lista de tuplas (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+        tracer (Tracer, optional): Instrumentación de la ejecución.
+
+    Returns:
+        gantt_chart (list): Diagrama de Gantt con tuplas (ID, tiempo_inicio, tiempo_fin).
+        metrics (list): Métricas con tuplas (ID, tiempo_espera, tiempo_retorno).
+    """
+    return _run_non_preemptive(processes, key=itemgetter(3), tracer=tracer)
+
+
+def priority_aging(processes, aging_interval=10, tracer=None):
+    """
+    Algoritmo de planificación por Prioridad con envejecimiento (no apropiativo).
+
+    Un proceso gana un nivel de prioridad por cada ``aging_interval`` unidades de
+    tiempo que pasa esperando, de modo que ningún proceso espera indefinidamente.
+    La prioridad efectiva en el instante t es
+    ``prioridad - (t - llegada) / aging_interval``; como t es común a todos los
+    procesos en cola, comparar prioridades efectivas equivale a comparar la clave
+    fija ``prioridad * aging_interval + llegada``. El envejecimiento queda así
+    implícito en la clave del heap (un desplazamiento en tiempo virtual): no hay
+    que recorrer la cola en cada instante y cada despacho sigue costando O(log n).
+
+    Args:
+        processes (list | ProcessTable): Lista de tuplas (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+        aging_interval (int): Tiempo de espera necesario para ganar un nivel de prioridad; debe ser positivo.
+        tracer (Tracer, optional): Instrumentación de la ejecución.
+
+    Returns:
+        gantt_chart (list): Diagrama de Gantt con tuplas (ID, tiempo_inicio, tiempo_fin).
+        metrics (list): Métricas con tuplas (ID, tiempo_espera, tiempo_retorno).
+    """
+    if aging_interval <= 0:
+        raise ValueError("El intervalo de envejecimiento debe ser un valor positivo.")
+    return _run_non_preemptive(processes, key=lambda process: process[3] * aging_interval + process[1],
+                               tracer=tracer)
+
+
+def _run_preemptive(processes, key, tracer=None):
+    """
+    Simulador por eventos para los algoritmos apropiativos de un solo CPU.
+
+    El reloj salta directamente a la siguiente llegada o finalización, por lo que
+    el coste depende del número de eventos y no de la duración de las ráfagas. En
+    cada llegada el proceso en ejecución se expulsa solo si el mejor proceso listo
+    tiene una clave estrictamente menor; los empates se resuelven por orden de
+    llegada y, a igual llegada, por orden en la lista de entrada.
+
+    Args:
+        processes (list | ProcessTable): Lista de tuplas (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+        key (callable): Función (tiempo_restante, proceso) -> clave del heap.
+        tracer (Tracer, optional): Instrumentación de la ejecución.
+
+    Returns:
+        gantt_chart (list): Diagrama de Gantt con una tupla (ID, tiempo_inicio, tiempo_fin)
+            por cada tramo contiguo de ejecución.
+        metrics (list): Métricas con tuplas (ID, tiempo_espera, tiempo_retorno) en orden
+            de finalización.
+    """
+    with _phase(tracer, 'ordenar llegadas'):
+        sorted_processes = sorted(processes, key=lambda x: x[1])
+    num_processes = len(sorted_processes)
+    ready = []  # Heap de (clave, orden_de_llegada, tiempo_restante, proceso)
+    next_arrival = 0
+    current_time = 0
+    current = None
+    slice_start = 0
+    slice_depth = 0  # Procesos en cola al empezar el tramo; solo se usa con tracer
+    gantt_chart = []
+    metrics = []
+
+    with _phase(tracer, 'simulación'):
+        while next_arrival < num_processes or ready or current is not None:
+            if current is None:
+                if not ready and sorted_processes[next_arrival][1] > current_time:
+                    if tracer is not None:
+                        tracer.idle(current_time, sorted_processes[next_arrival][1])
+                    current_time = sorted_processes[next_arrival][1]
+                while next_arrival < num_processes and sorted_processes[next_arrival][1] <= current_time:
+                    process = sorted_processes[next_arrival]
+                    heapq.heappush(ready, (key(process[2], process), next_arrival, process[2], process))
+                    next_arrival += 1
+                current = heapq.heappop(ready)
+                slice_start = current_time
+                if tracer is not None:
+                    slice_depth = len(ready)
+
+            current_key, order, remaining, process = current
+            completion_time = current_time + remaining
+
+            if next_arrival < num_processes and sorted_processes[next_arrival][1] < completion_time:
+                # Avanzar hasta la siguiente llegada y decidir si hay expulsión
+                arrival_time = sorted_processes[next_arrival][1]
+                remaining -= arrival_time - current_time
+                current_time = arrival_time
+                while next_arrival < num_processes and sorted_processes[next_arrival][1] <= current_time:
+                    arriving = sorted_processes[next_arrival]
+                    heapq.heappush(ready, (key(arriving[2], arriving), next_arrival, arriving[2], arriving))
+                    next_arrival += 1
+
+                if ready[0][0] < key(remaining, process):
+                    gantt_chart.append((process[0], slice_start, current_time))
+                    heapq.heappush(ready, (key(remaining, process), order, remaining, process))
+                    current = None
+                    if tracer is not None:
+                        tracer.dispatch(process[0], slice_start, current_time, slice_depth)
+                        tracer.preempt(process[0], current_time)
+                else:
+                    current = (current_key, order, remaining, process)
+            else:
+                pid, arrival_time, burst_time, _ = process
+                current_time = completion_time
+                turnaround_time = current_time - arrival_time
+                gantt_chart.append((pid, slice_start, current_time))
+                metrics.append((pid, turnaround_time - burst_time, turnaround_time))
+                current = None
+                if tracer is not None:
+                    tracer.dispatch(pid, slice_start, current_time, slice_depth)
+
     return gantt_chart, metrics
-def priority_scheduling(processes):
+
+
+def srtf(processes, tracer=None):
     """
-    Algoritmo de planificación por Prioridad.
+    Algoritmo de planificación SRTF (Shortest Remaining Time First).
 
     Args:
-        processes (list): Lista de tuplas (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+        processes (list | ProcessTable): Lista de tuplas (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+        tracer (Tracer, optional): Instrumentación de la ejecución.
 
     Returns:
         gantt_chart (list): Diagrama de Gantt con tuplas (ID, tiempo_inicio, tiempo_fin).
         metrics (list): Métricas con tuplas (ID, tiempo_espera, tiempo_retorno).
     """
-    sorted_processes = sorted(processes, key=lambda x: x[1])
-    remaining_processes = sorted_processes.copy()
-    start_time = 0
+    return _run_preemptive(processes, key=lambda remaining, process: remaining, tracer=tracer)
+
+
+def preemptive_priority(processes, tracer=None):
+    """
+    Algoritmo de planificación por Prioridad apropiativo (menor valor, mayor prioridad).
+
+    Args:
+        processes (list | ProcessTable): Lista de tuplas (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+        tracer (Tracer, optional): Instrumentación de la ejecución.
+
+    Returns:
+        gantt_chart (list): Diagrama de Gantt con tuplas (ID, tiempo_inicio, tiempo_fin).
+        metrics (list): Métricas con tuplas (ID, tiempo_espera, tiempo_retorno).
+    """
+    return _run_preemptive(processes, key=lambda remaining, process: process[3], tracer=tracer)
+
+
+def round_robin(processes, quantum=2, tracer=None):
+    """
+    Algoritmo de planificación Round Robin.
+
+    Los procesos que llegan durante un quantum se encolan antes que el proceso
+    expulsado al final de ese quantum. Cuando no hay nadie más en la cola, el
+    proceso en ejecución avanza de una vez hasta la siguiente llegada o hasta
+    terminar, y los quantums consecutivos del mismo proceso se fusionan en un
+    único tramo.
+
+    Args:
+        processes (list | ProcessTable): Lista de tuplas (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+        quantum (int): Tiempo máximo de CPU por turno; debe ser positivo.
+        tracer (Tracer, optional): Instrumentación de la ejecución; cada turno cuenta como
+            un despacho aunque se fusione en el diagrama.
+
+    Returns:
+        gantt_chart (list): Diagrama de Gantt con una tupla (ID, tiempo_inicio, tiempo_fin)
+            por cada tramo contiguo de ejecución.
+        metrics (list): Métricas con tuplas (ID, tiempo_espera, tiempo_retorno) en orden
+            de finalización.
+    """
+    if quantum <= 0:
+        raise ValueError("El quantum debe ser un valor positivo.")
+
+    with _phase(tracer, 'ordenar llegadas'):
+        sorted_processes = sorted(processes, key=lambda x: x[1])
+    num_processes = len(sorted_processes)
+    queue = deque()  # Entradas [tiempo_restante, proceso]
+    next_arrival = 0
+    current_time = 0
+    last_entry = None
     gantt_chart = []
     metrics = []
 
-    while remaining_processes:
-        available_processes = [p for p in remaining_processes if p[1] <= start_time]
-        
-        if not available_processes:
-            start_time = min(p[1] for p in remaining_processes)
-            continue
-
-        next_process = min(available_processes, key=lambda x: x[3])
-        remaining_processes.remove(next_process)
-        
-        pid, arrival_time, burst_time, priority = next_process
-        end_time = start_time + burst_time
-        waiting_time = start_time - arrival_time
-        turnaround_time = end_time - arrival_time
-        
-        gantt_chart.append((pid, start_time, end_time))
-        metrics.append((pid, waiting_time, turnaround_time))
-        
-        start_time = end_time
+    with _phase(tracer, 'simulación'):
+        while next_arrival < num_processes or queue:
+            if not queue:
+                if sorted_processes[next_arrival][1] > current_time:
+                    if tracer is not None:
+                        tracer.idle(current_time, sorted_processes[next_arrival][1])
+                    current_time = sorted_processes[next_arrival][1]
+                while next_arrival < num_processes and sorted_processes[next_arrival][1] <= current_time:
+                    queue.append([sorted_processes[next_arrival][2], sorted_processes[next_arrival]])
+                    next_arrival += 1
+
+            entry = queue.popleft()
+            remaining, process = entry
+
+            if queue or next_arrival == num_processes:
+                run_time = min(quantum, remaining)
+            else:
+                # Nadie más espera: encadenar quantums hasta la siguiente llegada
+                gap = sorted_processes[next_arrival][1] - current_time
+                run_time = min(max(1, -(-gap // quantum)) * quantum, remaining)
+
+            end_time = current_time + run_time
+            entry[0] = remaining - run_time
+            if tracer is not None:
+                tracer.dispatch(process[0], current_time, end_time, len(queue))
+
+            while next_arrival < num_processes and sorted_processes[next_arrival][1] <= end_time:
+                queue.append([sorted_processes[next_arrival][2], sorted_processes[next_arrival]])
+                next_arrival += 1
+
+            if entry is last_entry and gantt_chart[-1][2] == current_time:
+                gantt_chart[-1] = (process[0], gantt_chart[-1][1], end_time)
+            else:
+                gantt_chart.append((process[0], current_time, end_time))
+            last_entry = entry
+            current_time = end_time
+
+            if entry[0] > 0:
+                queue.append(entry)
+                if tracer is not None:
+                    tracer.preempt(process[0], current_time)
+            else:
+                turnaround_time = current_time - process[1]
+                metrics.append((process[0], turnaround_time - process[2], turnaround_time))
 
     return gantt_chart, metrics
+
+
+def mlfq(processes, quanta=(2, 4, 8), boost_interval=50, tracer=None):
+    """
+    Algoritmo de planificación MLFQ (Multilevel Feedback Queue).
+
+    Hay un nivel por cada quantum de ``quanta``; el nivel 0 es el de mayor
+    prioridad y cada nivel se atiende en Round Robin. Los procesos llegan al
+    nivel 0 y bajan un nivel al agotar el quantum del suyo (el último nivel no
+    baja más). Un proceso expulsado por una llegada vuelve al final de su nivel
+    conservando el tiempo ya usado de su quantum. Una llegada expulsa a los
+    procesos de los niveles inferiores, pero no a uno del nivel 0.
+
+    Cada ``boost_interval`` unidades de tiempo todos los procesos vuelven al
+    nivel 0, lo que evita la inanición de los trabajos largos. El boost es
+    perezoso: las colas de los niveles inferiores se encadenan enteras detrás de
+    la del nivel 0, en O(niveles) y sin recorrer los procesos; cada entrada lleva
+    la época en que se encoló para reiniciar su quantum al despacharla. Cada
+    despacho cuesta O(niveles), independiente del número de procesos en cola.
+
+    Con un solo nivel el resultado es el mismo que el de ``round_robin``.
+
+    Args:
+        processes (list | ProcessTable): Lista de tuplas (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+        quanta (sequence): Quantum de cada nivel, del más prioritario al menos; deben ser positivos.
+        boost_interval (int, optional): Periodo del boost de prioridad; None lo desactiva.
+        tracer (Tracer, optional): Instrumentación de la ejecución.
+
+    Returns:
+        gantt_chart (list): Diagrama de Gantt con una tupla (ID, tiempo_inicio, tiempo_fin)
+            por cada tramo contiguo de ejecución.
+        metrics (list): Métricas con tuplas (ID, tiempo_espera, tiempo_retorno) en orden
+            de finalización.
+    """
+    quanta = list(quanta)
+    if not quanta or any(quantum <= 0 for quantum in quanta):
+        raise ValueError("Los quantums deben ser valores positivos.")
+    if boost_interval is not None and boost_interval <= 0:
+        raise ValueError("El intervalo de boost debe ser un valor positivo.")
+
+    with _phase(tracer, 'ordenar llegadas'):
+        sorted_processes = sorted(processes, key=lambda x: x[1])
+    num_processes = len(sorted_processes)
+    bottom = len(quanta) - 1
+    top = deque([deque()])  # Nivel 0: segmentos que se consumen en orden
+    lower = [deque() for _ in range(bottom)]
+    waiting = [0] * len(quanta)  # Procesos en cola por nivel
+    epoch = 0
+    # Con un solo nivel el boost no cambia nada
+    next_boost = boost_interval if boost_interval and bottom else math.inf
+    next_arrival = 0
+    current_time = 0
+    current = None  # Entrada [tiempo_restante, tiempo_usado_del_quantum, época, proceso]
+    level = 0
+    slice_depth = 0  # Procesos en cola al despachar; solo se usa con tracer
+    last_entry = None
+    gantt_chart = []
+    metrics = []
+
+    def admit():
+        nonlocal next_arrival
+        while next_arrival < num_processes and sorted_processes[next_arrival][1] <= current_time:
+            process = sorted_processes[next_arrival]
+            top[-1].append([process[2], 0, epoch, process])
+            waiting[0] += 1
+            next_arrival += 1
+
+    def boost():
+        """Mover todos los procesos en cola al nivel 0, detrás de los que ya estaban en él."""
+        nonlocal epoch, next_boost
+        epoch += 1
+        next_boost = (current_time // boost_interval + 1) * boost_interval
+        for index, queue in enumerate(lower):
+            if queue:
+                top.append(queue)
+                waiting[0] += waiting[index + 1]
+                waiting[index + 1] = 0
+                lower[index] = deque()
+
+    def enqueue(entry, entry_level):
+        (top[-1] if entry_level == 0 else lower[entry_level - 1]).append(entry)
+        waiting[entry_level] += 1
+
+    with _phase(tracer, 'simulación'):
+        while next_arrival < num_processes or current is not None or any(waiting):
+            if current is None:
+                if not any(waiting) and sorted_processes[next_arrival][1] > current_time:
+                    if tracer is not None:
+                        tracer.idle(current_time, sorted_processes[next_arrival][1])
+                    current_time = sorted_processes[next_arrival][1]
+                admit()
+                if current_time >= next_boost:
+                    boost()
+                if waiting[0]:
+                    while not top[0]:
+                        top.popleft()
+                    current, level = top[0].popleft(), 0
+                else:
+                    level = next(index for index, count in enumerate(waiting) if count)
+                    current = lower[level - 1].popleft()
+                waiting[level] -= 1
+                if current[2] != epoch:
+                    current[1], current[2] = 0, epoch  # Subió al nivel 0 en un boost
+                if tracer is not None:
+                    slice_depth = sum(waiting)
+
+            remaining, used, _, process = current
+            quantum = quanta[level]
+            alone = not any(waiting)
+            if level == bottom and alone and (level > 0 or next_arrival == num_processes):
+                # Solo en el último nivel: los quantums se encadenan hasta la siguiente llegada
+                run_time = remaining
+            else:
+                run_time = min(remaining, quantum - used)
+            if next_arrival < num_processes:
+                gap = sorted_processes[next_arrival][1] - current_time
+                if level > 0:
+                    run_time = min(run_time, gap)  # La llegada lo expulsa
+                elif bottom == 0 and alone:
+                    # Un solo nivel y nadie espera: encadenar quantums como Round Robin
+                    run_time = min(max(1, -(-gap // quantum)) * quantum, remaining)
+            run_time = min(run_time, next_boost - current_time)
+
+            end_time = current_time + run_time
+            current[0] = remaining - run_time
+            current[1] = (used + run_time) % quantum if level == bottom else used + run_time
+            if tracer is not None:
+                tracer.dispatch(process[0], current_time, end_time, slice_depth)
+            if current is last_entry and gantt_chart[-1][2] == current_time:
+                gantt_chart[-1] = (process[0], gantt_chart[-1][1], end_time)
+            else:
+                gantt_chart.append((process[0], current_time, end_time))
+            last_entry = current
+            current_time = end_time
+
+            admit()
+            if current_time >= next_boost:
+                boost()
+                level, current[1], current[2] = 0, 0, epoch
+
+            if current[0] == 0:
+                turnaround_time = current_time - process[1]
+                metrics.append((process[0], turnaround_time - process[2], turnaround_time))
+                current = None
+            elif current[1] == quantum or (level == bottom and current[1] == 0 and run_time):
+                # Quantum agotado: baja un nivel y vuelve a elegirse (expulsión, como en Round Robin)
+                if tracer is not None:
+                    tracer.preempt(process[0], current_time)
+                level = min(level + 1, bottom)
+                current[1] = 0
+                enqueue(current, level)
+                current = None
+            elif any(waiting[:level]):
+                if tracer is not None:
+                    tracer.preempt(process[0], current_time)
+                enqueue(current, level)
+                current = None
+            elif tracer is not None:
+                slice_depth = sum(waiting)
+
+    return gantt_chart, metrics
+
+
+# Algoritmos disponibles por nombre, en el orden en que se muestran en la GUI
+ALGORITHMS = {
+    'FIFO': fifo,
+    'SJF': sjf,
+    'Prioridad': priority_scheduling,
+    'SRTF': srtf,
+    'Prioridad Apropiativa': preemptive_priority,
+    'Round Robin': round_robin,
+    'Prioridad con Envejecimiento': priority_aging,
+    'MLFQ': mlfq,
+}
+
+
+def register_algorithm(name, algorithm):
+    """
+    Registrar un algoritmo adicional para la GUI y el comparador.
+
+    Args:
+        name (str): Nombre con el que se mostrará el algoritmo.
+        algorithm (callable): Función processes -> (gantt_chart, metrics); para la
+            instrumentación de la GUI debe aceptar también ``tracer=None``.
+    """
+    ALGORITHMS[name] = algorithm
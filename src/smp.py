@@ -0,0 +1,263 @@
+import heapq
+from collections import deque
+
+from scheduler import _phase
+
+
+# Nombre -> (clave(tiempo_restante, proceso), apropiativo); Round Robin usa una cola FIFO
+_SPECS = {
+    'FIFO': (lambda remaining, process: 0, False),
+    'SJF': (lambda remaining, process: process[2], False),
+    'Prioridad': (lambda remaining, process: process[3], False),
+    'SRTF': (lambda remaining, process: remaining, True),
+    'Prioridad Apropiativa': (lambda remaining, process: process[3], True),
+    'Round Robin': (None, False),
+    # La clave depende de ``aging_interval``; ``simulate`` la construye (ver ``scheduler.priority_aging``)
+    'Prioridad con Envejecimiento': (None, False),
+}
+
+SMP_ALGORITHMS = tuple(_SPECS)
+POLICIES = ('global', 'por núcleo')
+
+
+def simulate(processes, algorithm='FIFO', cores=1, policy='global', quantum=2, aging_interval=10, tracer=None):
+    """
+    Simular la planificación en un sistema de ``cores`` procesadores.
+
+    Es una simulación por eventos: un heap de finalizaciones ordenado por
+    (tiempo, núcleo), un heap de núcleos libres y, para los algoritmos
+    apropiativos, un heap con el peor proceso en ejecución para decidir a quién
+    expulsar. Cada evento cuesta O(log n + log núcleos), por lo que escala a miles
+    de núcleos y millones de procesos.
+
+    En cada instante se procesan, en este orden, las finalizaciones (por índice de
+    núcleo), las llegadas, los procesos de Round Robin que agotan su quantum y los
+    núcleos libres, que toman trabajo por orden de índice. Con la política
+    ``'global'`` todos los núcleos comparten una cola de listos; con
+    ``'por núcleo'`` cada llegada va a la cola del núcleo ``orden % núcleos`` y un
+    núcleo sin trabajo roba el mejor proceso de la cola más larga. Una llegada
+    expulsa al peor proceso en ejecución de su cola si tiene una clave
+    estrictamente menor. Con un solo núcleo el resultado es idéntico al de las
+    funciones de ``scheduler``.
+
+    Args:
+        processes (list | ProcessTable): Lista de tuplas (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+        algorithm (str): Uno de ``SMP_ALGORITHMS``.
+        cores (int): Número de procesadores.
+        policy (str): 'global' o 'por núcleo'.
+        quantum (int): Quantum de Round Robin.
+        aging_interval (int): Intervalo de envejecimiento de 'Prioridad con Envejecimiento'.
+        tracer (Tracer, optional): Instrumentación de la ejecución.
+
+    Returns:
+        gantt_chart (list): Tuplas (ID, tiempo_inicio, tiempo_fin, núcleo) por cada tramo
+            contiguo de ejecución en un núcleo.
+        metrics (list): Tuplas (ID, tiempo_espera, tiempo_retorno) en orden de finalización.
+    """
+    if algorithm not in _SPECS:
+        raise ValueError(f"Algoritmo no soportado en SMP: {algorithm}")
+    if policy not in POLICIES:
+        raise ValueError(f"Política desconocida: {policy}. Disponibles: {', '.join(POLICIES)}")
+    if cores < 1:
+        raise ValueError("Se necesita al menos un núcleo.")
+    key, preemptive = _SPECS[algorithm]
+    if algorithm == 'Prioridad con Envejecimiento':
+        if aging_interval <= 0:
+            raise ValueError("El intervalo de envejecimiento debe ser un valor positivo.")
+        # Con un reloj común a todas las colas, la prioridad envejecida ordena igual que esta clave fija
+        key = lambda remaining, process: process[3] * aging_interval + process[1]
+    round_robin = key is None
+    if round_robin and quantum <= 0:
+        raise ValueError("El quantum debe ser un valor positivo.")
+    dynamic = algorithm == 'SRTF'  # La clave del proceso en ejecución baja con el tiempo
+    per_core = policy == 'por núcleo'
+
+    with _phase(tracer, 'ordenar llegadas'):
+        sorted_processes = sorted(processes, key=lambda x: x[1])
+    num_processes = len(sorted_processes)
+
+    # Colas de listos: heaps de (clave, orden, restante, proceso) o deques de [restante, orden, proceso]
+    queues = [deque() if round_robin else [] for _ in range(cores if per_core else 1)]
+    # Por núcleo: [entrada, inicio_tramo, inicio_turno, fin, versión, procesos_en_cola] o None
+    running = [None] * cores
+    free = list(range(cores))  # Heap de núcleos libres (una lista ordenada ya es un heap)
+    events = []                # Heap de (fin, núcleo, versión)
+    worst = [[] for _ in queues] if preemptive else None  # Heaps de (-rango, -orden, núcleo, versión)
+    loads = []                 # Heap de (-longitud, cola) para elegir a quién robar
+    version = 0
+    next_arrival = 0
+    gantt_chart = []
+    metrics = []
+
+    def queue_of(core):
+        return queues[core] if per_core else queues[0]
+
+    def run(core, entry, gantt_start, now):
+        """Poner ``entry`` en ``core`` desde ``now`` y programar el fin de su turno."""
+        nonlocal version
+        version += 1
+        queue = queue_of(core)
+        if round_robin:
+            remaining = entry[0]
+            if queue:
+                run_time = min(quantum, remaining)
+            elif next_arrival < num_processes:
+                # Nadie más espera en esta cola: encadenar quantums hasta la siguiente llegada
+                gap = sorted_processes[next_arrival][1] - now
+                run_time = min(max(1, -(-gap // quantum)) * quantum, remaining)
+            else:
+                run_time = remaining
+        else:
+            run_time = entry[2]
+        end = now + run_time
+        running[core] = [entry, gantt_start, now, end, version, len(queue)]
+        heapq.heappush(events, (end, core, version))
+        if preemptive:
+            rank = end if dynamic else entry[0]
+            candidates = worst[core if per_core else 0]
+            heapq.heappush(candidates, (-rank, -entry[1], core, version))
+            if len(candidates) > 4 * cores + 64:
+                # Quitar las entradas de procesos que ya no están en ejecución
+                candidates[:] = [c for c in candidates if running[c[2]] is not None and running[c[2]][4] == c[3]]
+                heapq.heapify(candidates)
+
+    def close(core, now):
+        """Cerrar el tramo de ``core`` en ``now`` y devolver la entrada con el tiempo restante."""
+        entry, gantt_start, run_start, _, _, depth = running[core]
+        running[core] = None
+        process = entry[-1]
+        if tracer is not None:
+            tracer.dispatch(process[0], run_start, now, depth, core)
+        if now > gantt_start:
+            gantt_chart.append((process[0], gantt_start, now, core))
+        if round_robin:
+            entry[0] -= now - run_start
+            return entry
+        remaining = entry[2] - (now - run_start)
+        return (key(remaining, process), entry[1], remaining, process)
+
+    def push(queue_index, entry):
+        queue = queues[queue_index]
+        if round_robin:
+            queue.append(entry)
+        else:
+            heapq.heappush(queue, entry)
+        if per_core:
+            heapq.heappush(loads, (-len(queue), queue_index))
+            if len(loads) > 4 * cores + 64:
+                loads[:] = [(-len(q), i) for i, q in enumerate(queues) if q]
+                heapq.heapify(loads)
+
+    def take(queue):
+        return queue.popleft() if round_robin else heapq.heappop(queue)
+
+    def source(core):
+        """Cola de la que debe tomar trabajo ``core`` (la propia o la víctima de un robo), o None."""
+        own = queue_of(core)
+        if own or not per_core:
+            return own if own else None
+        while loads:
+            negative_length, victim = loads[0]
+            if -negative_length == len(queues[victim]) and queues[victim]:
+                return queues[victim]
+            heapq.heappop(loads)
+            if queues[victim]:
+                heapq.heappush(loads, (-len(queues[victim]), victim))
+        return None
+
+    with _phase(tracer, 'simulación'):
+        while next_arrival < num_processes or events:
+            while events and (running[events[0][1]] is None or running[events[0][1]][4] != events[0][2]):
+                heapq.heappop(events)  # Despacho expulsado: evento obsoleto
+            if events:
+                now = events[0][0]
+                if next_arrival < num_processes and sorted_processes[next_arrival][1] < now:
+                    now = sorted_processes[next_arrival][1]
+            elif next_arrival < num_processes:
+                now = sorted_processes[next_arrival][1]
+            else:
+                break
+
+            # 1. Finalizaciones y quantums agotados
+            expired = []
+            while events and events[0][0] == now:
+                _, core, event_version = heapq.heappop(events)
+                if running[core] is None or running[core][4] != event_version:
+                    continue
+                entry = running[core][0]
+                remaining = (entry[0] if round_robin else entry[2]) - (now - running[core][2])
+                if remaining > 0:
+                    expired.append(core)
+                    continue
+                process = close(core, now)[-1]
+                turnaround_time = now - process[1]
+                metrics.append((process[0], turnaround_time - process[2], turnaround_time))
+                heapq.heappush(free, core)
+
+            # 2. Llegadas
+            arrived = set()
+            while next_arrival < num_processes and sorted_processes[next_arrival][1] <= now:
+                process = sorted_processes[next_arrival]
+                queue_index = next_arrival % cores if per_core else 0
+                if round_robin:
+                    push(queue_index, [process[2], next_arrival, process])
+                else:
+                    push(queue_index, (key(process[2], process), next_arrival, process[2], process))
+                arrived.add(queue_index)
+                next_arrival += 1
+
+            # 3. Round Robin: vuelve a la cola solo si alguien más espera en ella
+            for core in expired:
+                queue = queue_of(core)
+                if queue:
+                    entry = close(core, now)
+                    push(core if per_core else 0, entry)
+                    heapq.heappush(free, core)
+                else:
+                    entry, gantt_start, run_start, _, _, depth = running[core]
+                    if tracer is not None:
+                        tracer.dispatch(entry[2][0], run_start, now, depth, core)
+                    entry[0] -= now - run_start
+                    run(core, entry, gantt_start, now)
+
+            # 4. Los núcleos libres toman trabajo por orden de índice
+            while free:
+                queue = source(free[0])
+                if queue is None:
+                    break
+                core = heapq.heappop(free)
+                run(core, take(queue), now, now)
+
+            # 5. Expulsiones provocadas por las llegadas
+            if preemptive:
+                for queue_index in sorted(arrived):
+                    queue, candidates = queues[queue_index], worst[queue_index]
+                    while queue and candidates:
+                        negative_rank, _, core, run_version = candidates[0]
+                        if running[core] is None or running[core][4] != run_version:
+                            heapq.heappop(candidates)
+                            continue
+                        current_key = -negative_rank - now if dynamic else -negative_rank
+                        if not queue[0][0] < current_key:
+                            break
+                        heapq.heappop(candidates)
+                        if tracer is not None:
+                            tracer.preempt(running[core][0][3][0], now)
+                        push(queue_index, close(core, now))
+                        run(core, heapq.heappop(queue), now, now)
+
+    return gantt_chart, metrics
+
+
+def smp_algorithm(algorithm, cores, policy='global'):
+    """
+    Crear una función con la firma de ``scheduler`` para un algoritmo en ``cores`` procesadores.
+
+    Returns:
+        callable: processes -> (gantt_chart, metrics), que acepta ``quantum``, ``aging_interval`` y ``tracer``.
+    """
+    def scheduler(processes, quantum=2, aging_interval=10, tracer=None):
+        return simulate(processes, algorithm, cores=cores, policy=policy, quantum=quantum,
+                        aging_interval=aging_interval, tracer=tracer)
+    scheduler.__name__ = f'{algorithm} ({cores} núcleos, {policy})'
+    return scheduler
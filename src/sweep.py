@@ -0,0 +1,276 @@
+from collections import namedtuple
+import math
+
+import numpy as np
+
+from parallel import resolve_algorithms, run_tasks
+from workloads import GENERATORS, generate
+
+
+SweepRow = namedtuple('SweepRow', ['algorithm', 'workloads', 'processes', 'waiting', 'turnaround', 'average_waiting'])
+
+DEFAULT_ACCURACY = 0.01
+
+
+class RunningStats:
+    """
+    Media y varianza en streaming (Welford), combinables entre procesos (Chan et al.).
+
+    Solo guarda el número de valores, la media, la suma de cuadrados de las
+    desviaciones y los extremos, sea cual sea la cantidad de valores.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, value):
+        """Agregar un valor."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def add_batch(self, values):
+        """Agregar un arreglo NumPy de valores de una vez."""
+        if len(values):
+            mean = float(values.mean())
+            self._combine(len(values), mean, float(((values - mean) ** 2).sum()),
+                          float(values.min()), float(values.max()))
+
+    def merge(self, other):
+        """Acumular las estadísticas de ``other``."""
+        if other.count:
+            self._combine(other.count, other.mean, other.m2, other.minimum, other.maximum)
+
+    def _combine(self, count, mean, m2, minimum, maximum):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.minimum = min(self.minimum, minimum)
+        self.maximum = max(self.maximum, maximum)
+
+    @property
+    def variance(self):
+        """Varianza muestral (cero con menos de dos valores)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+
+class QuantileSketch:
+    """
+    Sketch de cuantiles con error relativo acotado y combinable (buckets logarítmicos).
+
+    Cada valor positivo x se cuenta en el bucket ``ceil(log(x) / log(gamma))`` con
+    ``gamma = (1 + a) / (1 - a)``; el cuantil estimado difiere del real como mucho
+    en una fracción ``a`` (``relative_accuracy``). Los ceros tienen su propio
+    contador. El número de buckets crece con el logaritmo del rango de valores,
+    no con su cantidad, y combinar dos sketches es sumar sus contadores, por lo que
+    el resultado no depende del orden en que se combinan.
+    """
+
+    def __init__(self, relative_accuracy=DEFAULT_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("La precisión relativa debe estar entre 0 y 1.")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.count = 0
+        self.zeros = 0
+        self.buckets = {}  # Índice de bucket -> número de valores
+
+    def add(self, value):
+        """Agregar un valor no negativo."""
+        self.count += 1
+        if value <= 0:
+            self.zeros += 1
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def add_batch(self, values):
+        """Agregar un arreglo NumPy de valores no negativos de una vez."""
+        positive = values[values > 0]
+        self.count += len(values)
+        self.zeros += len(values) - len(positive)
+        if len(positive):
+            indices, counts = np.unique(np.ceil(np.log(positive) / self._log_gamma).astype(np.int64),
+                                        return_counts=True)
+            for index, count in zip(indices.tolist(), counts.tolist()):
+                self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def merge(self, other):
+        """Acumular los contadores de ``other``, que debe tener la misma precisión."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Solo se pueden combinar sketches con la misma precisión relativa.")
+        self.count += other.count
+        self.zeros += other.zeros
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def quantile(self, q):
+        """
+        Estimar el cuantil ``q`` (entre 0 y 1) por rango más cercano.
+
+        Returns:
+            float: Valor estimado, o NaN si el sketch está vacío.
+        """
+        if not self.count:
+            return math.nan
+        rank = int(q * (self.count - 1))
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                # Punto del bucket (gamma^(i-1), gamma^i] con el mismo error relativo a ambos extremos
+                return 2 * self.gamma ** index / (self.gamma + 1)
+
+
+class Distribution:
+    """Resumen en streaming de una métrica: media y varianza exactas y cuantiles aproximados."""
+
+    def __init__(self, relative_accuracy=DEFAULT_ACCURACY):
+        self.stats = RunningStats()
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, value):
+        self.stats.add(value)
+        self.sketch.add(value)
+
+    def add_batch(self, values):
+        self.stats.add_batch(values)
+        self.sketch.add_batch(values)
+
+    def merge(self, other):
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+
+    @property
+    def count(self):
+        return self.stats.count
+
+    @property
+    def mean(self):
+        return self.stats.mean
+
+    def quantile(self, q):
+        return self.sketch.quantile(q)
+
+    def summary(self):
+        """Diccionario con media, desviación, extremos y percentiles 50, 95 y 99."""
+        return {
+            'count': self.stats.count,
+            'mean': self.stats.mean,
+            'std': self.stats.std,
+            'min': self.stats.minimum,
+            'max': self.stats.maximum,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+        }
+
+
+def workload_seed(seed, index):
+    """Semilla de la carga ``index`` de un barrido, independiente del reparto en lotes y procesos."""
+    return int(np.random.SeedSequence(seed, spawn_key=(index,)).generate_state(1, dtype=np.uint64)[0])
+
+
+def _run_batch(kind, size, workload_params, functions, params, seed, first, last, relative_accuracy):
+    """
+    Generar las cargas [first, last) y resumir las métricas de cada algoritmo sobre ellas.
+
+    ``functions`` son las funciones de los algoritmos y ``params`` sus parámetros, en el mismo orden.
+
+    Las métricas de cada carga se descartan en cuanto se agregan a los resúmenes.
+    """
+    summaries = [tuple(Distribution(relative_accuracy) for _ in range(3)) for _ in functions]
+    for index in range(first, last):
+        processes = generate(kind, size, seed=workload_seed(seed, index), **workload_params)
+        for function, function_params, (waiting, turnaround, average_waiting) in zip(functions, params, summaries):
+            _, metrics = function(processes, **function_params)
+            waiting_times = np.fromiter((m[1] for m in metrics), dtype=np.float64, count=len(metrics))
+            waiting.add_batch(waiting_times)
+            turnaround.add_batch(np.fromiter((m[2] for m in metrics), dtype=np.float64, count=len(metrics)))
+            if len(metrics):
+                average_waiting.add(float(waiting_times.mean()))
+    return summaries
+
+
+def sweep(workload='poisson', count=1000, size=100, algorithms=None, params=None, workload_params=None,
+          seed=0, batch_size=50, max_workers=None, relative_accuracy=DEFAULT_ACCURACY, mp_context=None):
+    """
+    Barrido Monte Carlo: ejecutar los algoritmos sobre ``count`` cargas aleatorias.
+
+    Cada carga se genera con ``workloads.generate`` y una semilla derivada de
+    ``seed`` y de su índice (``SeedSequence``). Los lotes de ``batch_size``
+    cargas se generan y ejecutan dentro de los procesos trabajadores, que solo
+    devuelven resúmenes en streaming (``Distribution``); nunca se guardan las
+    métricas por proceso de todo el barrido. Los resúmenes se combinan en orden
+    de lote, así que el resultado depende de ``seed`` y ``batch_size`` pero no
+    del número de procesos.
+
+    Args:
+        workload (str): Generador de ``workloads.GENERATORS``.
+        count (int): Número de cargas.
+        size (int): Procesos por carga.
+        algorithms (list, optional): Nombres registrados en ``scheduler.ALGORITHMS``
+            o funciones a nivel de módulo; por defecto, todos los registrados.
+        params (dict, optional): Parámetros adicionales por algoritmo, por ejemplo
+            ``{'Round Robin': {'quantum': 4}}``.
+        workload_params (dict, optional): Parámetros del generador, por ejemplo ``{'rate': 0.3}``.
+        seed (int): Semilla del barrido.
+        batch_size (int): Cargas por tarea enviada a los trabajadores.
+        max_workers (int, optional): Número de procesos; con 1 se ejecuta en el
+            proceso actual. Por defecto, el número de núcleos.
+        relative_accuracy (float): Error relativo máximo de los percentiles.
+        mp_context (multiprocessing.context.BaseContext, optional): Contexto con el
+            que se crean los trabajadores, por ejemplo ``get_context('spawn')``.
+
+    Returns:
+        list: Una fila ``SweepRow`` por algoritmo con las distribuciones de la espera y
+            el retorno por proceso y de la espera media por carga.
+    """
+    if workload not in GENERATORS:
+        raise ValueError(f"Generador desconocido: {workload}. Disponibles: {', '.join(GENERATORS)}")
+    labels, functions = resolve_algorithms(algorithms)
+    if batch_size <= 0:
+        raise ValueError("El tamaño de lote debe ser un valor positivo.")
+    params = [(params or {}).get(label, {}) for label in labels]
+    workload_params = workload_params or {}
+
+    tasks = [(workload, size, workload_params, functions, params, seed, first, min(first + batch_size, count),
+              relative_accuracy) for first in range(0, count, batch_size)]
+    results = run_tasks(_run_batch, tasks, max_workers, mp_context=mp_context)
+
+    totals = [tuple(Distribution(relative_accuracy) for _ in range(3)) for _ in labels]
+    for partial in results:
+        for total, summaries in zip(totals, partial):
+            for distribution, summary in zip(total, summaries):
+                distribution.merge(summary)
+
+    return [SweepRow(label, count, waiting.count, waiting, turnaround, average_waiting)
+            for label, (waiting, turnaround, average_waiting) in zip(labels, totals)]
+
+
+def format_table(rows):
+    """Dar formato de tabla de texto al resultado de ``sweep``."""
+    lines = [f"{'Algoritmo':<30}{'Cargas':>8}{'Procesos':>12}{'Espera prom.':>14}{'p95':>10}{'p99':>10}"
+             f"{'Retorno prom.':>15}{'p95':>10}{'p99':>10}"]
+    for row in rows:
+        lines.append(f"{row.algorithm:<30}{row.workloads:>8}{row.processes:>12}"
+                     f"{row.waiting.mean:>14.2f}{row.waiting.quantile(0.95):>10.1f}{row.waiting.quantile(0.99):>10.1f}"
+                     f"{row.turnaround.mean:>15.2f}{row.turnaround.quantile(0.95):>10.1f}"
+                     f"{row.turnaround.quantile(0.99):>10.1f}")
+    return '\n'.join(lines)
@@ -0,0 +1,344 @@
+import csv
+import json
+import os
+import struct
+import tempfile
+
+from process_table import ProcessTable
+
+
+# NumPy solo se importa al leer o escribir el formato binario: los lectores de
+# texto se usan desde la CLI, que arranca sin cargarlo
+MAGIC = b'ADCOLS01'
+ALIGNMENT = 64
+BINARY_EXTENSION = '.adc'
+
+# Nombres aceptados para cada campo en CSV (cabecera) y JSONL (claves)
+FIELD_NAMES = {
+    'pid': ('id', 'pid', 'proceso', 'process'),
+    'arrival': ('arrival', 'llegada', 'arrival_time', 'tiempo_llegada'),
+    'burst': ('burst', 'ejecucion', 'ejecución', 'burst_time', 'tiempo_ejecucion'),
+    'priority': ('priority', 'prioridad'),
+}
+
+
+class MappedStrings:
+    """
+    Pool de textos guardado como bytes UTF-8 + desplazamientos.
+
+    Los textos se decodifican todos juntos la primera vez que se piden: el pool
+    tiene un elemento por ID distinto, no por fila.
+    """
+
+    def __init__(self, offsets, data):
+        self._offsets = offsets
+        self._data = data
+        self._strings = None
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def _decoded(self):
+        if self._strings is None:
+            raw = self._data.tobytes()
+            bounds = self._offsets.tolist()
+            self._strings = [raw[start:end].decode('utf-8') for start, end in zip(bounds, bounds[1:])]
+        return self._strings
+
+    def __getitem__(self, index):
+        return self._decoded()[index]
+
+    def __iter__(self):
+        return iter(self._decoded())
+
+
+class MappedRows:
+    """
+    Secuencia de tuplas respaldada por columnas mapeadas en memoria.
+
+    Las tuplas se construyen al acceder a ellas, por bloques, de modo que abrir un
+    archivo no recorre sus filas.
+    """
+
+    CHUNK = 65536
+
+    def __init__(self, strings, codes, *columns):
+        self._strings = strings
+        self._codes = codes
+        self._columns = columns
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __getitem__(self, index):
+        return (self._strings[self._codes[index]],) + tuple(column[index].item() for column in self._columns)
+
+    def __iter__(self):
+        for start in range(0, len(self), self.CHUNK):
+            chunk = slice(start, start + self.CHUNK)
+            pids = map(self._strings.__getitem__, self._codes[chunk].tolist())
+            yield from zip(pids, *(column[chunk].tolist() for column in self._columns))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+
+def write_columns(path, kind, columns, strings=()):
+    """
+    Guardar columnas de tamaño fijo en el formato binario columnar.
+
+    El archivo tiene una cabecera JSON con el tipo, el número de filas y la
+    posición de cada columna, seguida de los arreglos alineados a 64 bytes, de
+    modo que ``read_columns`` puede mapearlos en memoria sin copiarlos.
+
+    Args:
+        path (str): Ruta del archivo.
+        kind (str): Tipo de contenido ('processes' o 'results').
+        columns (dict): Nombre -> arreglo unidimensional.
+        strings (iterable): Pool de textos (IDs) referenciado por códigos enteros.
+    """
+    import numpy as np
+
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype='<i8')
+    np.cumsum([len(s) for s in encoded], out=offsets[1:])
+    arrays = {name: np.ascontiguousarray(values) for name, values in columns.items()}
+    arrays['__string_offsets'] = offsets
+    arrays['__string_data'] = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+    layout = {}
+    position = 0
+    for name, values in arrays.items():
+        dtype = values.dtype.newbyteorder('<') if values.dtype.byteorder == '>' else values.dtype
+        layout[name] = {'offset': position, 'dtype': dtype.str, 'length': len(values)}
+        position += -(-values.nbytes // ALIGNMENT) * ALIGNMENT
+
+    header = json.dumps({'kind': kind, 'columns': layout}).encode('utf-8')
+    data_start = -(-(len(MAGIC) + 8 + len(header)) // ALIGNMENT) * ALIGNMENT
+
+    # Escribir en un temporal y reemplazar: truncar en el sitio un archivo que otra tabla tiene
+    # mapeado en memoria provoca SIGBUS al leerlo; con os.replace el mapeo conserva el archivo viejo
+    descriptor, temporary = tempfile.mkstemp(prefix='.' + os.path.basename(path) + '.',
+                                             dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(descriptor, 'wb') as file:
+            file.write(MAGIC)
+            file.write(struct.pack('<Q', len(header)))
+            file.write(header)
+            for name, values in arrays.items():
+                file.seek(data_start + layout[name]['offset'])
+                file.write(values.astype(layout[name]['dtype'], copy=False).tobytes())
+            file.truncate(data_start + position)
+        # mkstemp crea el archivo con permisos 0600: conservar los del archivo reemplazado
+        os.chmod(temporary, os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def _read_header(path):
+    with open(path, 'rb') as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} no es un archivo columnar de Algoritmos de Despacho.")
+        header_length, = struct.unpack('<Q', file.read(8))
+        header = json.loads(file.read(header_length).decode('utf-8'))
+    return header, -(-(len(MAGIC) + 8 + header_length) // ALIGNMENT) * ALIGNMENT
+
+
+def file_kind(path):
+    """Tipo de contenido ('processes' o 'results') de un archivo binario, o None si no lo es."""
+    try:
+        return _read_header(path)[0]['kind']
+    except ValueError:
+        return None
+
+
+def read_columns(path):
+    """
+    Abrir un archivo columnar mapeándolo en memoria.
+
+    Returns:
+        kind (str): Tipo de contenido.
+        columns (dict): Nombre -> arreglo NumPy de solo lectura (sin copiar).
+        strings (MappedStrings): Pool de textos.
+    """
+    import numpy as np
+
+    header, data_start = _read_header(path)
+
+    if os.path.getsize(path) > data_start:
+        mapped = np.memmap(path, dtype=np.uint8, mode='r')
+    else:
+        mapped = np.zeros(data_start, dtype=np.uint8)
+    columns = {}
+    for name, info in header['columns'].items():
+        dtype = np.dtype(info['dtype'])
+        start = data_start + info['offset']
+        columns[name] = mapped[start:start + info['length'] * dtype.itemsize].view(dtype)
+
+    strings = MappedStrings(columns.pop('__string_offsets'), columns.pop('__string_data'))
+    return header['kind'], columns, strings
+
+
+def save_processes(path, processes):
+    """Guardar una carga de trabajo (lista de tuplas o ProcessTable) en formato binario."""
+    if not isinstance(processes, ProcessTable):
+        processes = ProcessTable(processes)
+    write_columns(path, 'processes', {'codes': processes['codes'], 'arrival': processes['arrival'],
+                                      'burst': processes['burst'], 'priority': processes['priority']},
+                  processes.pids())
+
+
+def open_processes(path):
+    """Abrir una carga binaria como ProcessTable mapeado en memoria, sin leer sus filas."""
+    kind, columns, strings = read_columns(path)
+    if kind != 'processes':
+        raise ValueError(f"{path} contiene '{kind}', no una carga de procesos.")
+    return ProcessTable.from_mapped(strings, columns['codes'], columns['arrival'],
+                                    columns['burst'], columns['priority'])
+
+
+def save_results(path, schedule, metrics):
+    """
+    Guardar el diagrama de Gantt y las métricas de una ejecución en formato binario.
+
+    Args:
+        path (str): Ruta del archivo.
+        schedule (list): Tuplas (ID, tiempo_inicio, tiempo_fin[, núcleo]).
+        metrics (list): Tuplas (ID, tiempo_espera, tiempo_retorno).
+    """
+    import numpy as np
+
+    pool = {}
+    intern = lambda pid: pool.setdefault(pid, len(pool))
+    columns = {
+        'gantt_codes': np.fromiter((intern(entry[0]) for entry in schedule), dtype=np.int64, count=len(schedule)),
+        'metric_codes': np.fromiter((intern(m[0]) for m in metrics), dtype=np.int64, count=len(metrics)),
+    }
+    names = ['gantt_start', 'gantt_end'] + (['gantt_core'] if schedule and len(schedule[0]) > 3 else [])
+    for position, name in enumerate(names, start=1):
+        columns[name] = np.array([entry[position] for entry in schedule])
+    columns['metric_waiting'] = np.array([m[1] for m in metrics])
+    columns['metric_turnaround'] = np.array([m[2] for m in metrics])
+    write_columns(path, 'results', columns, pool)
+
+
+def open_results(path):
+    """
+    Abrir resultados binarios sin parsearlos.
+
+    Returns:
+        schedule (MappedRows): Entradas del diagrama de Gantt.
+        metrics (MappedRows): Métricas por proceso.
+    """
+    kind, columns, strings = read_columns(path)
+    if kind != 'results':
+        raise ValueError(f"{path} contiene '{kind}', no resultados.")
+    gantt = [columns['gantt_start'], columns['gantt_end']]
+    if 'gantt_core' in columns:
+        gantt.append(columns['gantt_core'])
+    schedule = MappedRows(strings, columns['gantt_codes'], *gantt)
+    metrics = MappedRows(strings, columns['metric_codes'], columns['metric_waiting'], columns['metric_turnaround'])
+    return schedule, metrics
+
+
+def _field_positions(names):
+    lowered = [name.strip().lower() for name in names]
+    positions = {}
+    for field, aliases in FIELD_NAMES.items():
+        for alias in aliases:
+            if alias in lowered:
+                positions[field] = lowered.index(alias)
+                break
+    missing = {'pid', 'arrival', 'burst'} - positions.keys()
+    if missing:
+        raise ValueError(f"Faltan columnas en la cabecera: {', '.join(sorted(missing))}")
+    return positions
+
+
+def iter_csv(path):
+    """
+    Leer procesos de un CSV fila a fila.
+
+    La cabecera es opcional; sin ella las columnas son ID, llegada, ejecución y,
+    opcionalmente, prioridad.
+
+    Yields:
+        tuple: (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+    """
+    with open(path, newline='', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        positions = {'pid': 0, 'arrival': 1, 'burst': 2, 'priority': 3}
+        first_row = True
+        for line_number, row in enumerate(reader, start=1):
+            if not any(field.strip() for field in row):
+                continue
+            if first_row:
+                first_row = False
+                # La cabecera, si la hay, es la primera fila no vacía
+                if len(row) < 2 or not row[1].strip().lstrip('-').isdigit():
+                    try:
+                        positions = _field_positions(row)
+                    except ValueError as error:
+                        raise ValueError(f"Línea {line_number}: {error}") from None
+                    required = max(positions['pid'], positions['arrival'], positions['burst']) + 1
+                    continue
+                required = 3
+            if len(row) < required:
+                raise ValueError(f"Línea {line_number}: se esperaban al menos {required} columnas y hay {len(row)}.")
+            priority = positions.get('priority')
+            try:
+                process = (row[positions['pid']], int(row[positions['arrival']]), int(row[positions['burst']]),
+                           int(row[priority]) if priority is not None and priority < len(row)
+                           and row[priority].strip() else 0)
+            except ValueError:
+                raise ValueError(f"Línea {line_number}: valores no numéricos en {row}.") from None
+            yield process
+
+
+def iter_jsonl(path):
+    """
+    Leer procesos de un archivo JSONL línea a línea.
+
+    Cada línea es un objeto con las claves de ``FIELD_NAMES`` o una lista
+    [ID, llegada, ejecución, prioridad].
+
+    Yields:
+        tuple: (ID, tiempo_llegada, tiempo_ejecucion, prioridad).
+    """
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if isinstance(record, list):
+                pid, arrival_time, burst_time, *rest = record
+                yield (str(pid), int(arrival_time), int(burst_time), int(rest[0]) if rest else 0)
+                continue
+            values = {}
+            for field, aliases in FIELD_NAMES.items():
+                values[field] = next((record[alias] for alias in aliases if alias in record), None)
+            if values['pid'] is None or values['arrival'] is None or values['burst'] is None:
+                raise ValueError(f"Registro incompleto: {line.strip()}")
+            yield (str(values['pid']), int(values['arrival']), int(values['burst']), int(values['priority'] or 0))
+
+
+def load_workload(path):
+    """
+    Cargar una carga de trabajo según la extensión del archivo.
+
+    Los archivos ``.csv`` y ``.jsonl`` se leen en streaming; los binarios
+    (``.adc``) se mapean en memoria sin copiarlos.
+
+    Returns:
+        ProcessTable: Procesos cargados.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == BINARY_EXTENSION:
+        return open_processes(path)
+    if extension == '.csv':
+        return ProcessTable(iter_csv(path))
+    if extension in ('.jsonl', '.ndjson'):
+        return ProcessTable(iter_jsonl(path))
+    raise ValueError(f"Formato no soportado: {extension}")
@@ -0,0 +1,104 @@
+import math
+import random
+
+from process_table import ProcessTable
+
+
+# Generadores de cargas sintéticas para pruebas de rendimiento. Todos son
+# deterministas para una semilla dada y devuelven un ProcessTable con IDs P0..Pn-1.
+
+
+def uniform(n, seed=0, max_burst=10, max_priority=5):
+    """
+    Llegadas y ráfagas uniformes; la carga media es cercana a la capacidad del procesador.
+
+    Args:
+        n (int): Número de procesos.
+        seed (int): Semilla del generador.
+        max_burst (int): Ráfaga máxima (la mínima es 1).
+        max_priority (int): Prioridad máxima (la mínima es 0).
+    """
+    rng = random.Random(seed)
+    horizon = n * (max_burst + 1) // 2
+    return ProcessTable((f'P{i}', rng.randint(0, horizon), rng.randint(1, max_burst), rng.randint(0, max_priority))
+                        for i in range(n))
+
+
+def poisson(n, seed=0, rate=0.2, mean_burst=4, max_priority=5):
+    """
+    Llegadas de Poisson (intervalos exponenciales) con ráfagas geométricas.
+
+    Args:
+        rate (float): Llegadas por unidad de tiempo.
+        mean_burst (float): Ráfaga media.
+    """
+    rng = random.Random(seed)
+    arrival_time = 0.0
+    processes = []
+    for i in range(n):
+        arrival_time += rng.expovariate(rate)
+        burst_time = 1 + int(rng.expovariate(1 / max(mean_burst - 1, 1e-9)))
+        processes.append((f'P{i}', int(arrival_time), burst_time, rng.randint(0, max_priority)))
+    return ProcessTable(processes)
+
+
+def bursty(n, seed=0, burst_size=50, gap=200, max_burst=10, max_priority=5):
+    """
+    Llegadas en ráfagas: grupos de ``burst_size`` procesos casi simultáneos separados por silencios.
+
+    Args:
+        burst_size (int): Procesos medios por grupo.
+        gap (float): Separación media entre grupos.
+    """
+    rng = random.Random(seed)
+    group_start = 0.0
+    processes = []
+    while len(processes) < n:
+        group_start += rng.expovariate(1 / gap)
+        for _ in range(min(1 + int(rng.expovariate(1 / burst_size)), n - len(processes))):
+            processes.append((f'P{len(processes)}', int(group_start) + rng.randint(0, 3),
+                              rng.randint(1, max_burst), rng.randint(0, max_priority)))
+    return ProcessTable(processes)
+
+
+def heavy_tailed(n, seed=0, alpha=1.5, max_priority=5):
+    """
+    Ráfagas con distribución de Pareto: la mayoría cortas y unas pocas enormes.
+
+    Args:
+        alpha (float): Índice de cola; cuanto menor, más pesada.
+    """
+    rng = random.Random(seed)
+    # Llegadas al ritmo de la ráfaga media para que la cola no crezca sin límite
+    mean_burst = alpha / (alpha - 1) if alpha > 1 else 10
+    horizon = int(n * mean_burst)
+    return ProcessTable((f'P{i}', rng.randint(0, horizon), math.ceil(rng.paretovariate(alpha)),
+                         rng.randint(0, max_priority)) for i in range(n))
+
+
+def priority_ties(n, seed=0, levels=2, burst_values=(2, 4)):
+    """
+    Muchos empates: pocas prioridades, pocas ráfagas distintas y llegadas agrupadas.
+
+    Sirve para comprobar que el desempate por orden de llegada no se degrada.
+    """
+    rng = random.Random(seed)
+    horizon = max(n // 4, 1)
+    return ProcessTable((f'P{i}', rng.randrange(0, horizon, 10) if horizon > 10 else 0,
+                         rng.choice(burst_values), rng.randrange(levels)) for i in range(n))
+
+
+GENERATORS = {
+    'uniform': uniform,
+    'poisson': poisson,
+    'bursty': bursty,
+    'heavy_tailed': heavy_tailed,
+    'priority_ties': priority_ties,
+}
+
+
+def generate(kind, n, seed=0, **params):
+    """Generar una carga por nombre (ver ``GENERATORS``)."""
+    if kind not in GENERATORS:
+        raise ValueError(f"Generador desconocido: {kind}. Disponibles: {', '.join(GENERATORS)}")
+    return GENERATORS[kind](n, seed=seed, **params)
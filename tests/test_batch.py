@@ -0,0 +1,50 @@
+import unittest
+import sys
+import os
+import random
+
+import numpy as np
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from batch import fifo_batch
+from scheduler import fifo
+
+
+class TestFifoBatch(unittest.TestCase):
+
+    def assert_matches_fifo(self, processes):
+        pids = [p[0] for p in processes]
+        result = fifo_batch([p[1] for p in processes], [p[2] for p in processes])
+        gantt = [(pids[i], int(result.start[i]), int(result.end[i])) for i in result.order]
+        metrics = [(pids[i], int(result.waiting[i]), int(result.turnaround[i])) for i in result.order]
+        self.assertEqual((gantt, metrics), fifo(processes))
+
+    def test_matches_fifo_on_random_workloads(self):
+        # Prueba de propiedad: mismo resultado que fifo() con llegadas repetidas,
+        # ráfagas nulas y huecos de CPU ociosa
+        for seed in range(300):
+            rng = random.Random(seed)
+            size = rng.randint(0, 60)
+            spread = rng.choice([1, 10, 1000])
+            processes = [(f'P{i}', rng.randint(0, spread), rng.randint(0, 20), rng.randint(0, 5))
+                         for i in range(size)]
+            with self.subTest(seed=seed):
+                self.assert_matches_fifo(processes)
+
+    def test_structured_array_input(self):
+        table = np.array([(0, 2), (1, 8), (20, 2)], dtype=[('arrival', 'i8'), ('burst', 'i8')])
+        result = fifo_batch(table)
+        np.testing.assert_array_equal(result.start, [0, 2, 20])
+        np.testing.assert_array_equal(result.end, [2, 10, 22])
+        np.testing.assert_array_equal(result.waiting, [0, 1, 0])
+        np.testing.assert_array_equal(result.turnaround, [2, 9, 2])
+
+    def test_shape_mismatch(self):
+        with self.assertRaises(ValueError):
+            fifo_batch([0, 1], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import sys
+import os
+import io
+import subprocess
+import tempfile
+import time
+from contextlib import redirect_stderr, redirect_stdout
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, SRC_DIR)
+
+from cli import STARTUP_TARGET, main
+
+
+def imported_modules(code):
+    """Ejecutar ``code`` en un intérprete nuevo y devolver los módulos pesados que cargó."""
+    script = (f"import sys; sys.path.insert(0, {SRC_DIR!r})\n{code}\n"
+              "print(' '.join(m for m in ('PyQt5', 'matplotlib', 'openai', 'numpy') if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+    return result.stdout.split('\n')[-2].split()
+
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.workload = os.path.join(self.directory.name, 'carga.csv')
+        with open(self.workload, 'w', encoding='utf-8') as file:
+            file.write('id,llegada,ejecucion,prioridad\nP1,0,2,0\nP2,1,8,1\nP3,6,2,2\n')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_summary_and_output(self):
+        output_path = os.path.join(self.directory.name, 'metricas.csv')
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            self.assertEqual(main([self.workload, '-a', 'fifo', '-a', 'Round Robin', '-q', '3', '-o', output_path]), 0)
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(lines[1].split(), ['FIFO', '3', '1.67', '5.67'])
+        self.assertEqual(lines[2].split(), ['Round', 'Robin', '3', '1.67', '5.67'])
+        with open(os.path.join(self.directory.name, 'metricas-fifo.csv'), encoding='utf-8') as file:
+            self.assertEqual(file.read().split(), ['id,espera,retorno', 'P1,0,2', 'P2,1,9', 'P3,4,6'])
+
+    def test_cache_directory(self):
+        cache_directory = os.path.join(self.directory.name, 'cache')
+        outputs = []
+        for _ in range(2):
+            stdout = io.StringIO()
+            with redirect_stdout(stdout):
+                self.assertEqual(main([self.workload, '-a', 'SJF', '-a', 'SRTF', '-c', cache_directory]), 0)
+            outputs.append(stdout.getvalue())
+        # La segunda ejecución lee los resultados guardados por la primera
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(len(os.listdir(cache_directory)), 2)
+
+    def test_unknown_algorithm(self):
+        stderr = io.StringIO()
+        with self.assertRaises(SystemExit), redirect_stderr(stderr):
+            main([self.workload, '-a', 'LIFO'])
+        self.assertIn('Algoritmos desconocidos: LIFO', stderr.getvalue())
+
+    def test_no_heavy_imports(self):
+        self.assertEqual(imported_modules(f"import cli; cli.main([{self.workload!r}])"), [])
+        # La GUI carga matplotlib al crear la ventana y openai al hacer la primera pregunta
+        self.assertEqual(imported_modules("import gui"), ['PyQt5', 'numpy'])
+
+    def test_cold_start_time(self):
+        # El mejor de varios arranques descarta el ruido de la máquina y la compilación a bytecode
+        elapsed = []
+        for _ in range(5):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, '-m', 'src', '--help'], cwd=os.path.dirname(SRC_DIR),
+                           capture_output=True, check=True)
+            elapsed.append(time.perf_counter() - start)
+        self.assertLess(min(elapsed), STARTUP_TARGET, f'Arranque: {min(elapsed) * 1000:.0f} ms')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import sys
+import os
+import random
+from multiprocessing import get_context
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from compare import compare, format_table
+from process_table import ProcessTable
+from scheduler import ALGORITHMS, priority_scheduling, register_algorithm, round_robin
+
+
+def longest_job_first(processes):
+    """Algoritmo registrado solo en el proceso de las pruebas."""
+    return priority_scheduling([(pid, arrival, burst, -burst) for pid, arrival, burst, _ in processes])
+
+
+def expected_averages(workloads, algorithm, **params):
+    metrics = [m for workload in workloads for m in algorithm(workload, **params)[1]]
+    return (sum(m[1] for m in metrics) / len(metrics), sum(m[2] for m in metrics) / len(metrics))
+
+
+class TestCompare(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.workloads = [[(f'P{i}', rng.randint(0, 40), rng.randint(1, 9), rng.randint(0, 3)) for i in range(25)]
+                          for _ in range(12)]
+        self.workloads[5] = ProcessTable(self.workloads[5])
+
+    def test_matches_sequential_runs(self):
+        params = {'Round Robin': {'quantum': 3}}
+        for max_workers in (1, 2):
+            with self.subTest(max_workers=max_workers):
+                rows = compare(self.workloads, params=params, max_workers=max_workers)
+                self.assertEqual([row.algorithm for row in rows], list(ALGORITHMS))
+                for row in rows:
+                    waiting, turnaround = expected_averages(self.workloads, ALGORITHMS[row.algorithm],
+                                                            **params.get(row.algorithm, {}))
+                    self.assertEqual(row.processes, 300)
+                    self.assertAlmostEqual(row.average_waiting, waiting)
+                    self.assertAlmostEqual(row.average_turnaround, turnaround)
+
+    def test_single_workload_and_callable(self):
+        rows = compare(self.workloads[0], algorithms=['SJF', round_robin], max_workers=1)
+        self.assertEqual([row.algorithm for row in rows], ['SJF', 'round_robin'])
+        self.assertEqual(rows[0].workloads, 1)
+        self.assertIn('SJF', format_table(rows))
+
+        with self.assertRaises(ValueError):
+            compare(self.workloads, algorithms=['LIFO'])
+
+    def test_registered_algorithm_with_spawn(self):
+        # Los trabajadores creados con spawn no heredan el registro del proceso principal
+        register_algorithm('LJF', longest_job_first)
+        self.addCleanup(ALGORITHMS.pop, 'LJF')
+        rows = compare(self.workloads, algorithms=['LJF', 'SJF'], max_workers=2, mp_context=get_context('spawn'))
+        self.assertEqual([row.algorithm for row in rows], ['LJF', 'SJF'])
+        waiting, turnaround = expected_averages(self.workloads, longest_job_first)
+        self.assertAlmostEqual(rows[0].average_waiting, waiting)
+        self.assertAlmostEqual(rows[0].average_turnaround, turnaround)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+import sys
+import os
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from context_builder import HEADER, ContextBuilder
+from scheduler import fifo, sjf
+
+
+class TestContextBuilder(unittest.TestCase):
+
+    def setUp(self):
+        self.processes = [('P1', 0, 2, 0), ('P2', 1, 8, 1), ('P3', 6, 2, 2)]
+
+    def test_same_text_as_full_rebuild(self):
+        builder = ContextBuilder()
+        expected = HEADER
+        for algorithm in (fifo, sjf):
+            schedule, metrics = algorithm(self.processes)
+            builder.add_run(algorithm.__name__, self.processes, schedule, metrics)
+            # Construcción original, recorriendo todo el historial
+            expected += f"\n--- Algoritmo: {algorithm.__name__} ---\n"
+            for pid, at, bt, pr in self.processes:
+                expected += f"Proceso {pid}: Llegada={at}, Ejecución={bt}, Prioridad={pr}\n"
+            expected += "\nResultados:\n"
+            for pid, wait, turnaround in metrics:
+                expected += f"Proceso {pid}: Espera={wait}, Finalización={turnaround}\n"
+            expected += "\nDescripción de la Gráfica de Gantt:\n"
+            for pid, start, end in schedule:
+                expected += f"Proceso {pid}: Inicio={start}, Fin={end}, Duración={end - start}\n"
+        self.assertEqual(builder.build(), expected)
+
+    def test_old_runs_are_condensed_within_budget(self):
+        schedule, metrics = fifo(self.processes)
+        builder = ContextBuilder(max_chars=1000)
+        for _ in range(50):
+            builder.add_run('FIFO', self.processes, schedule, metrics)
+        context = builder.build()
+        self.assertLess(len(context), 1000 + 200)
+        # 0 + 1 + 4 = 5 de espera y 2 + 9 + 6 = 17 de retorno por ejecución
+        self.assertIn('ejecuciones, ', context)
+        self.assertIn('Espera promedio=1.67, Finalización promedio=5.67', context)
+        self.assertTrue(context.rstrip().endswith('Duración=2'))
+
+        builder.clear()
+        self.assertEqual(builder.build(), HEADER)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from gantt_chart import MAX_LABELS, bar_paths, decimate_steps, labels_to_draw, schedule_columns
+
+
+class TestGanttHelpers(unittest.TestCase):
+
+    def test_one_row_per_process(self):
+        row_keys, rows, starts, ends = schedule_columns([('P1', 0, 2), ('P2', 2, 5), ('P1', 5, 9)])
+        self.assertEqual(row_keys, {'P1': 0, 'P2': 1})
+        np.testing.assert_array_equal(rows, [0, 1, 0])
+        np.testing.assert_array_equal(starts, [0, 2, 5])
+        np.testing.assert_array_equal(ends, [2, 5, 9])
+
+    def test_one_row_per_core(self):
+        schedule = [('P1', 0, 2, 1), ('P2', 0, 3, 0), ('P3', 2, 4, 1)]
+        row_keys, rows, _, _ = schedule_columns(schedule, row_field=3)
+        self.assertEqual(row_keys, {1: 0, 0: 1})
+        np.testing.assert_array_equal(rows, [0, 1, 0])
+
+    def test_bar_paths_grouped_by_color(self):
+        rows = np.array([0, 1, 0, 2])
+        paths, colors = bar_paths(rows, np.array([0., 2, 5, 9]), np.array([2., 5, 9, 10]), rows % 2)
+        self.assertEqual(list(colors), [0, 1])
+        self.assertEqual([len(path.vertices) for path in paths], [15, 5])
+        np.testing.assert_array_equal(paths[1].get_extents().get_points(), [[2, 10], [5, 19]])
+
+    def test_labels_culled_by_zoom(self):
+        count = 10000
+        rows = np.zeros(count, dtype=np.int64)
+        starts = np.arange(count, dtype=float)
+        ends = starts + 1
+        # Con toda la traza en 800 px ninguna barra es lo bastante ancha
+        self.assertEqual(len(labels_to_draw(rows, starts, ends, (0, count), (0, 10), 800 / count)), 0)
+        # Al acercarse solo se etiquetan las barras visibles
+        labels = labels_to_draw(rows, starts, ends, (100, 110), (0, 10), 80)
+        np.testing.assert_array_equal(labels, np.arange(100, 110))
+        # Y nunca más de MAX_LABELS
+        self.assertEqual(len(labels_to_draw(rows, starts, ends, (0, count), (0, 10), 100)), MAX_LABELS)
+
+    def test_queue_steps_keep_peaks(self):
+        times = np.arange(1000)
+        depths = np.zeros(1000, dtype=np.int64)
+        depths[517] = 9
+        reduced_times, reduced_depths = decimate_steps(times, depths, 10)
+        self.assertLessEqual(len(reduced_times), 10)
+        self.assertEqual(reduced_depths.max(), 9)
+        self.assertEqual(reduced_times[0], 0)
+        # Con pocas muestras no se toca nada
+        self.assertEqual(len(decimate_steps(times[:15], depths[:15], 10)[0]), 15)
+
+
+if __name__ == '__main__':
+    unittest.main()
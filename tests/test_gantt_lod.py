@@ -0,0 +1,56 @@
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from gantt_lod import ScheduleIndex
+
+
+class TestScheduleIndex(unittest.TestCase):
+
+    def setUp(self):
+        # 4 filas con 10000 tramos de 1 unidad separados por huecos de 1 unidad
+        count = 10000
+        self.rows = np.arange(count) % 4
+        self.starts = np.arange(count) * 2.0
+        self.ends = self.starts + 1
+        self.index = ScheduleIndex(self.rows, self.starts, self.ends)
+
+    def test_memory_proportional_to_schedule(self):
+        self.assertGreater(len(self.index.levels), 1)
+        self.assertLess(len(self.index), 2 * len(self.rows))
+
+    def test_zoomed_in_returns_exact_slices(self):
+        rows, heights, starts, ends = self.index.query(100, 120, 0, 3, 800, 400)
+        visible = (self.ends >= 100) & (self.starts <= 120)
+        self.assertEqual(sorted(zip(rows, starts, ends)),
+                         sorted(zip(self.rows[visible], self.starts[visible], self.ends[visible])))
+        self.assertTrue(np.all(heights == 1))
+
+    def test_zoomed_out_is_bounded_by_pixels(self):
+        rows, heights, starts, ends = self.index.query(0, 20000, 0, 3, 800, 400)
+        # A lo sumo un rectángulo por píxel y fila
+        self.assertLessEqual(len(rows), 4 * 800)
+        # La cobertura total se conserva: todos los tramos quedan dentro de algún rectángulo
+        for row in range(4):
+            mask = rows == row
+            inside = np.searchsorted(starts[mask], self.starts[self.rows == row], side='right') - 1
+            self.assertTrue(np.all(ends[mask][inside] >= self.ends[self.rows == row]))
+
+    def test_rows_sharing_a_pixel_form_bands(self):
+        rows, heights, starts, ends = self.index.query(0, 20000, 0, 3, 800, 2)
+        self.assertTrue(set(rows) <= {0, 2})
+        self.assertTrue(np.all(heights == 2))
+
+    def test_empty_view(self):
+        rows, _, _, _ = self.index.query(30000, 40000, 0, 3, 800, 400)
+        self.assertEqual(len(rows), 0)
+        self.assertEqual(len(ScheduleIndex([], [], []).query(0, 1, 0, 0, 10, 10)[0]), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5 import QtWidgets
+
+import openai_client
+from gui import GptWorker, SchedulerApp
+from response_cache import ResponseCache
+
+
+class FakeCompletions:
+    """Responde con la pregunta del usuario; la pregunta 'lenta' espera a ``release``."""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def create(self, messages, **kwargs):
+        question = messages[-1]['content'].rsplit('\n', 1)[-1]
+        if question == 'lenta':
+            self.release.wait(10)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=f'Respuesta a {question}'))])
+
+
+class TestGptQuestions(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    def setUp(self):
+        self.completions = FakeCompletions()
+        previous, openai_client.client = openai_client.client, SimpleNamespace(
+            chat=SimpleNamespace(completions=self.completions))
+        self.addCleanup(setattr, openai_client, 'client', previous)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.cache = ResponseCache(os.path.join(self.directory.name, 'cache.sqlite3'))
+
+    def wait_for(self, condition, timeout=10):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            self.app.processEvents()
+            time.sleep(0.01)
+        return condition()
+
+    def test_worker_emits_answer(self):
+        worker = GptWorker(7, 'ctx', 'rápida', self.cache)
+        received = []
+        worker.signals.finished.connect(lambda request_id, answer: received.append((request_id, answer)))
+        worker.run()
+        self.assertEqual(received, [(7, 'Respuesta a rápida')])
+
+    def test_cancelled_answer_is_dropped(self):
+        window = SchedulerApp()
+        window.response_cache = self.cache
+        window.question_input.setPlainText('lenta')
+        window.ask_openai()
+        window.cancel_question()
+        self.assertTrue(window.ask_button.isEnabled())
+
+        # La consulta cancelada sigue en curso, pero no retrasa a la siguiente
+        window.question_input.setPlainText('rápida')
+        window.ask_openai()
+        self.assertTrue(self.wait_for(lambda: 'rápida' in window.answer_output.toPlainText()))
+
+        self.completions.release.set()
+        self.assertTrue(window.thread_pool.waitForDone(10000))
+        self.app.processEvents()
+        self.assertEqual(window.answer_output.toPlainText(), 'Respuesta a rápida')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import sys
+import os
+import random
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from incremental import IncrementalScheduler
+from scheduler import fifo, sjf, priority_scheduling
+from workloads import generate
+
+
+BATCH = {'FIFO': fifo, 'SJF': sjf, 'Prioridad': priority_scheduling}
+
+
+class TestIncrementalScheduler(unittest.TestCase):
+
+    def test_edits_match_full_run(self):
+        for seed in range(150):
+            rng = random.Random(seed)
+            processes = [(f'P{i}', rng.randint(0, 30), rng.randint(0, 6), rng.randint(0, 3))
+                         for i in range(rng.randint(0, 30))]
+            for algorithm, batch in BATCH.items():
+                scheduler = IncrementalScheduler(algorithm, processes, checkpoints=rng.choice([1, 4, 100]))
+                current = list(processes)
+                for step in range(5):
+                    process = (f'N{step}', rng.randint(0, 40), rng.randint(0, 6), rng.randint(0, 3))
+                    if current and rng.random() < 0.5:
+                        index = rng.randrange(len(current))
+                        current[index] = process
+                        scheduler.update(index, process)
+                    else:
+                        current.append(process)
+                        scheduler.add(process)
+                    with self.subTest(seed=seed, algorithm=algorithm, step=step):
+                        self.assertEqual(scheduler.schedule(), batch(current))
+
+    def test_resumes_from_checkpoint(self):
+        processes = generate('poisson', 5000, seed=1)
+        scheduler = IncrementalScheduler('SJF', processes)
+        previous = scheduler.schedule()
+        self.assertEqual(scheduler.reused, 0)
+        last_arrival = max(arrival for _, arrival, _, _ in processes)
+        scheduler.add(('X', last_arrival, 3, 0))
+        schedule, metrics = scheduler.schedule()
+        self.assertGreater(scheduler.reused, 4000)
+        self.assertEqual((schedule, metrics), sjf(list(processes) + [('X', last_arrival, 3, 0)]))
+        # El resultado anterior no se modifica
+        self.assertEqual(len(previous[0]), 5000)
+        # Sin cambios no se simula nada
+        self.assertIs(scheduler.schedule()[0], schedule)
+
+    def test_unsupported_algorithm(self):
+        with self.assertRaises(ValueError):
+            IncrementalScheduler('SRTF')
+
+
+if __name__ == '__main__':
+    unittest.main()
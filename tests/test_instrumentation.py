@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+import json
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from instrumentation import Tracer
+from scheduler import ALGORITHMS, fifo, mlfq, srtf, round_robin
+
+
+class TestTracer(unittest.TestCase):
+
+    def setUp(self):
+        self.processes = [
+            ('P1', 0, 2, 0),
+            ('P2', 1, 8, 1),
+            ('P3', 6, 2, 2),
+            ('P4', 2, 7, 3),
+            ('P5', 3, 4, 4),
+            ('P6', 4, 6, 5),
+            ('P7', 40, 1, 0),
+        ]
+
+    def test_same_results_with_tracer(self):
+        for name, algorithm in ALGORITHMS.items():
+            with self.subTest(algorithm=name):
+                tracer = Tracer()
+                self.assertEqual(algorithm(self.processes, tracer=tracer), algorithm(self.processes))
+                self.assertGreaterEqual(tracer.dispatches, len(self.processes))
+                self.assertEqual(set(tracer.phase_times), {'ordenar llegadas', 'simulación'})
+
+    def test_counts_queue_depth_and_idle_gaps(self):
+        tracer = Tracer()
+        fifo(self.processes, tracer=tracer)
+        # P1 empieza solo; al empezar P2 (t=2) ya esperan P4; al empezar P4 (t=10), P5, P6 y P3
+        self.assertEqual(tracer.queue_depth()[1][:3], [0, 1, 3])
+        self.assertEqual(tracer.max_queue_depth, 3)
+        # Todo termina en t=29 y P7 llega en t=40
+        self.assertEqual((tracer.idle_gaps, tracer.idle_time), (1, 11))
+        self.assertEqual(tracer.events[0], ('P1', 0, 2, 0))
+
+    def test_preemptions_and_callbacks(self):
+        tracer = Tracer()
+        seen = []
+        tracer.add_callback(lambda pid, start, end, depth, core: seen.append((pid, start, end)))
+        schedule, _ = srtf(self.processes, tracer=tracer)
+        self.assertEqual(seen, schedule)
+        self.assertEqual(tracer.preemptions, len(schedule) - len(self.processes))
+
+        tracer = Tracer()
+        schedule, _ = round_robin(self.processes, quantum=3, tracer=tracer)
+        # Cada turno es un despacho; los que no terminan vuelven a la cola
+        self.assertEqual(tracer.dispatches - tracer.preemptions, len(self.processes))
+        self.assertGreaterEqual(tracer.dispatches, len(schedule))
+
+        # Agotar el quantum en MLFQ también es una expulsión; con un nivel coincide con Round Robin
+        mlfq_tracer = Tracer()
+        mlfq(self.processes, quanta=(3,), tracer=mlfq_tracer)
+        self.assertEqual((mlfq_tracer.dispatches, mlfq_tracer.preemptions), (tracer.dispatches, tracer.preemptions))
+
+    def test_chrome_trace(self):
+        tracer = Tracer()
+        round_robin(self.processes, tracer=tracer)
+        trace = json.loads(json.dumps(tracer.to_chrome_trace(time_scale=10)))
+        slices = [e for e in trace['traceEvents'] if e['ph'] == 'X' and e.get('cat') == 'dispatch']
+        counters = [e for e in trace['traceEvents'] if e['ph'] == 'C']
+        self.assertEqual(len(slices), tracer.dispatches)
+        self.assertEqual(len(counters), len(tracer.queue_samples))
+        self.assertEqual((slices[0]['ts'], slices[0]['dur']), (0, 20))
+        self.assertEqual(trace['otherData']['idle_gaps'], 1)
+
+    def test_without_events(self):
+        tracer = Tracer(record_events=False)
+        fifo(self.processes, tracer=tracer)
+        self.assertEqual(tracer.dispatches, len(self.processes))
+        self.assertEqual(tracer.events, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,11 +4,11 @@ import os
 
 # Agregar el directorio raíz del proyecto al PYTHONPATH
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# y el directorio src, desde donde los módulos se importan entre sí
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
-from src.scheduler import fifo, sjf, priority_scheduling
-from src.openai_client import ask_openai
-from src.gantt_chart import GanttChart
-import matplotlib.pyplot as plt
+from src.scheduler import (fifo, sjf, priority_scheduling, srtf, preemptive_priority, round_robin, priority_aging,
+                           mlfq)
 
 class TestSchedulerAlgorithms(unittest.TestCase):
 
@@ -53,5 +53,79 @@ class TestSchedulerAlgorithms(unittest.TestCase):
         self.assertEqual(schedule, expected_gantt)
         self.assertEqual(metrics, expected_metrics)
 
+    def test_sjf_tie_breaking_is_stable(self):
+        # A igual ráfaga gana el que llegó antes y, a igual llegada, el primero en la lista
+        processes = [('A', 1, 3, 0), ('B', 0, 3, 0), ('C', 0, 3, 0), ('D', 0, 1, 0)]
+        schedule, _ = sjf(processes)
+        self.assertEqual(schedule, [('D', 0, 1), ('B', 1, 4), ('C', 4, 7), ('A', 7, 10)])
+
+    def test_priority_scheduling_idle_gap(self):
+        # La CPU queda ociosa hasta la siguiente llegada
+        processes = [('A', 0, 2, 1), ('B', 5, 1, 0), ('C', 5, 1, 2)]
+        schedule, metrics = priority_scheduling(processes)
+        self.assertEqual(schedule, [('A', 0, 2), ('B', 5, 6), ('C', 6, 7)])
+        self.assertEqual(metrics, [('A', 0, 2), ('B', 0, 1), ('C', 1, 2)])
+    def test_srtf(self):
+        expected_gantt = [('P1', 0, 2), ('P4', 2, 3), ('P5', 3, 7), ('P3', 7, 9), ('P4', 9, 15), ('P6', 15, 21), ('P2', 21, 29)]
+        expected_metrics = [('P1', 0, 2), ('P5', 0, 4), ('P3', 1, 3), ('P4', 6, 13), ('P6', 11, 17), ('P2', 20, 28)]
+
+        schedule, metrics = srtf(self.processes)
+        self.assertEqual(schedule, expected_gantt)
+        self.assertEqual(metrics, expected_metrics)
+
+    def test_preemptive_priority(self):
+        processes = [('P1', 0, 5, 2), ('P2', 1, 2, 1), ('P3', 2, 1, 0)]
+        schedule, metrics = preemptive_priority(processes)
+        self.assertEqual(schedule, [('P1', 0, 1), ('P2', 1, 2), ('P3', 2, 3), ('P2', 3, 4), ('P1', 4, 8)])
+        self.assertEqual(metrics, [('P3', 0, 1), ('P2', 1, 3), ('P1', 3, 8)])
+
+    def test_round_robin(self):
+        expected_gantt = [('P1', 0, 2), ('P2', 2, 5), ('P4', 5, 8), ('P5', 8, 11), ('P6', 11, 14), ('P2', 14, 17),
+                          ('P3', 17, 19), ('P4', 19, 22), ('P5', 22, 23), ('P6', 23, 26), ('P2', 26, 28), ('P4', 28, 29)]
+        expected_metrics = [('P1', 0, 2), ('P3', 11, 13), ('P5', 16, 20), ('P6', 16, 22), ('P2', 19, 27), ('P4', 20, 27)]
+
+        schedule, metrics = round_robin(self.processes, quantum=3)
+        self.assertEqual(schedule, expected_gantt)
+        self.assertEqual(metrics, expected_metrics)
+
+    def test_round_robin_long_burst_is_one_slice(self):
+        # Sin competencia, los quantums consecutivos se fusionan en un solo tramo
+        schedule, metrics = round_robin([('A', 0, 10 ** 9, 0), ('B', 10 ** 9 + 5, 1, 0)], quantum=1)
+        self.assertEqual(schedule, [('A', 0, 10 ** 9), ('B', 10 ** 9 + 5, 10 ** 9 + 6)])
+        self.assertEqual(metrics, [('A', 0, 10 ** 9), ('B', 0, 1)])
+
+        with self.assertRaises(ValueError):
+            round_robin(self.processes, quantum=0)
+
+    def test_priority_aging(self):
+        processes = [('A', 0, 4, 0), ('B', 1, 1, 3), ('C', 3, 2, 0), ('D', 5, 2, 0)]
+        # Sin envejecimiento B espera a C y a D; al envejecer adelanta a D, que llega después
+        self.assertEqual(priority_scheduling(processes)[0][-1], ('B', 8, 9))
+        schedule, metrics = priority_aging(processes, aging_interval=1)
+        self.assertEqual(schedule, [('A', 0, 4), ('C', 4, 6), ('B', 6, 7), ('D', 7, 9)])
+        self.assertEqual(metrics, [('A', 0, 4), ('C', 1, 3), ('B', 5, 6), ('D', 2, 4)])
+        # Con un intervalo mayor que cualquier espera equivale a prioridades estáticas
+        self.assertEqual(priority_aging(self.processes, aging_interval=10 ** 6), priority_scheduling(self.processes))
+        with self.assertRaises(ValueError):
+            priority_aging(processes, aging_interval=0)
+
+    def test_mlfq(self):
+        schedule, metrics = mlfq([('A', 0, 7, 0), ('B', 1, 2, 0)], quanta=(2, 4), boost_interval=None)
+        self.assertEqual(schedule, [('A', 0, 2), ('B', 2, 4), ('A', 4, 9)])
+        self.assertEqual(metrics, [('B', 1, 3), ('A', 2, 9)])
+        # Con un solo nivel es Round Robin
+        self.assertEqual(mlfq(self.processes, quanta=[3]), round_robin(self.processes, quantum=3))
+
+    def test_mlfq_boost_prevents_starvation(self):
+        processes = [('L', 0, 5, 0)] + [(f'S{i}', i, 1, 0) for i in range(1, 40)]
+        starved = dict((pid, turnaround) for pid, _, turnaround in mlfq(processes, (1, 2), None)[1])
+        boosted = dict((pid, turnaround) for pid, _, turnaround in mlfq(processes, (1, 2), 5)[1])
+        self.assertEqual(starved['L'], 44)
+        self.assertEqual(boosted['L'], 25)
+        with self.assertRaises(ValueError):
+            mlfq(processes, quanta=())
+        with self.assertRaises(ValueError):
+            mlfq(processes, boost_interval=0)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import sys
+import os
+import random
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from online import OnlineScheduler, replay
+from scheduler import fifo, sjf, priority_scheduling
+
+
+BATCH = {'FIFO': fifo, 'SJF': sjf, 'Prioridad': priority_scheduling}
+
+
+class TestOnlineScheduler(unittest.TestCase):
+
+    def test_replay_matches_batch(self):
+        for seed in range(200):
+            rng = random.Random(seed)
+            processes = [(f'P{i}', rng.randint(0, 30), rng.randint(0, 6), rng.randint(0, 3))
+                         for i in range(rng.randint(0, 25))]
+            for algorithm, batch in BATCH.items():
+                with self.subTest(seed=seed, algorithm=algorithm):
+                    events = list(replay(processes, algorithm))
+                    self.assertEqual(([g for g, _ in events], [m for _, m in events]), batch(processes))
+
+    def test_incremental_feed(self):
+        scheduler = OnlineScheduler('SJF')
+        scheduler.submit(('A', 0, 5, 0))
+        scheduler.submit(('B', 1, 2, 0))
+        # A ocupa la CPU hasta t=5, pero a t=3 aún no ha terminado
+        self.assertEqual(list(scheduler.advance(3)), [])
+        self.assertEqual(len(scheduler), 2)
+
+        scheduler.submit(('C', 3, 1, 0))
+        self.assertEqual(list(scheduler.advance(6)), [(('A', 0, 5), ('A', 0, 5)), (('C', 5, 6), ('C', 2, 3))])
+        self.assertEqual(list(scheduler.flush()), [(('B', 6, 8), ('B', 5, 7))])
+        self.assertEqual(len(scheduler), 0)
+
+    def test_rejects_arrivals_in_the_past(self):
+        scheduler = OnlineScheduler()
+        list(scheduler.advance(10))
+        with self.assertRaises(ValueError):
+            scheduler.submit(('A', 9, 1, 0))
+        with self.assertRaises(ValueError):
+            OnlineScheduler('Round Robin')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+from types import SimpleNamespace
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from openai_client import ask_openai
+from response_cache import ResponseCache, cache_key
+
+
+class FakeCompletions:
+    """Sustituto de ``client.chat.completions`` que registra las llamadas."""
+
+    def __init__(self, answer=' Respuesta ', error=None):
+        self.answer = answer
+        self.error = error
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.error is not None:
+            raise self.error
+        message = SimpleNamespace(content=self.answer)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def fake_client(completions):
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+
+class TestAskOpenAI(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(os.path.join(self.directory.name, 'cache.sqlite3'), max_entries=2)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_repeat_question_is_served_from_cache(self):
+        completions = FakeCompletions()
+        client = fake_client(completions)
+        self.assertEqual(ask_openai('ctx', '¿Qué?', cache=self.cache, timeout=5, openai_client=client), 'Respuesta')
+        self.assertEqual(ask_openai('ctx', '¿Qué?', cache=self.cache, openai_client=client), 'Respuesta')
+        self.assertEqual(len(completions.calls), 1)
+        self.assertEqual(completions.calls[0]['timeout'], 5)
+
+        # Otro contexto es otra clave
+        ask_openai('otro ctx', '¿Qué?', cache=self.cache, openai_client=client)
+        self.assertEqual(len(completions.calls), 2)
+
+    def test_errors_are_not_cached(self):
+        failing = fake_client(FakeCompletions(error=TimeoutError('timeout')))
+        self.assertIn('Error al contactar con OpenAI', ask_openai('ctx', 'q', cache=self.cache, openai_client=failing))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_cache_errors_are_ignored(self):
+        class BrokenCache:
+            def get(self, key):
+                raise sqlite3.OperationalError('database is locked')
+
+            def put(self, key, answer):
+                raise OSError('disco lleno')
+
+        completions = FakeCompletions()
+        self.assertEqual(ask_openai('ctx', 'q', cache=BrokenCache(), openai_client=fake_client(completions)),
+                         'Respuesta')
+        self.assertEqual(len(completions.calls), 1)
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResponseCache(os.path.join(directory, 'cache.sqlite3'), max_entries=2)
+            cache.put('a', '1')
+            cache.put('b', '2')
+            self.assertEqual(cache.get('a'), '1')  # 'a' pasa a ser la más reciente
+            cache.put('c', '3')
+            self.assertIsNone(cache.get('b'))
+            self.assertEqual((cache.get('a'), cache.get('c')), ('1', '3'))
+
+            # Persistencia entre instancias
+            self.assertEqual(ResponseCache(cache.path).get('c'), '3')
+
+    def test_cache_key_is_stable(self):
+        self.assertEqual(cache_key('c', 'q', {'b': 1, 'a': 2}), cache_key('c', 'q', {'a': 2, 'b': 1}))
+        self.assertNotEqual(cache_key('c', 'q'), cache_key('c', 'q2'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import sys
+import os
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from PyQt5 import QtCore
+
+from process_model import ProcessTableModel
+from process_table import ProcessTable
+from scheduler import sjf
+
+
+class TestProcessTableModel(unittest.TestCase):
+
+    def setUp(self):
+        self.processes = [('P1', 0, 2, 0), ('P2', 1, 8, 1), ('P3', 6, 2, 2)]
+        self.model = ProcessTableModel(ProcessTable(self.processes))
+        self.changes = []
+        self.model.dataChanged.connect(lambda first, last: self.changes.append(
+            ((first.row(), first.column()), (last.row(), last.column()))))
+
+    def cell(self, row, column, role=QtCore.Qt.DisplayRole):
+        return self.model.data(self.model.index(row, column), role)
+
+    def test_rows_come_from_process_table(self):
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertEqual([self.cell(1, c) for c in range(6)], ['P2', '1', '8', '1', '', ''])
+        self.assertEqual(self.model.headerData(4, QtCore.Qt.Horizontal), 'Espera')
+
+    def test_metrics_update_only_metric_cells(self):
+        _, metrics = sjf(self.processes)
+        self.model.set_metrics(metrics)
+        self.assertEqual(self.changes, [((0, 4), (2, 5))])
+        self.assertEqual([self.cell(r, 4) for r in range(3)], ['0', '1', '4'])
+        self.assertEqual(self.model.rowCount(), 4)
+        self.assertEqual(self.cell(3, 0), 'Totales / Promedios')
+        self.assertEqual(self.cell(3, 4), 'Suma: 5, Promedio: 1.67')
+        self.assertIsNotNone(self.cell(3, 4, QtCore.Qt.BackgroundRole))
+
+        # Cambian las columnas de métricas de las filas afectadas y la fila de totales
+        self.changes.clear()
+        self.model.set_metrics([('P3', 5, 7)])
+        self.assertEqual(self.changes, [((0, 4), (2, 5)), ((3, 0), (3, 5))])
+        self.assertEqual(self.cell(0, 4), '')
+
+    def test_append_clears_stale_metrics(self):
+        self.model.set_metrics(sjf(self.processes)[1])
+        self.model.append_process(('P4', 3, 1, 0))
+        self.assertEqual(self.model.rowCount(), 4)
+        self.assertEqual(self.cell(3, 0), 'P4')
+        self.assertEqual(self.cell(0, 5), '')
+        self.assertEqual(self.model.row_of('P4'), 3)
+
+        self.model.clear()
+        self.assertEqual(self.model.rowCount(), 0)
+        self.assertIsNone(self.model.row_of('P1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
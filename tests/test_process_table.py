@@ -0,0 +1,65 @@
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from batch import fifo_batch
+from process_table import ProcessTable
+from scheduler import fifo, sjf, priority_scheduling, srtf, preemptive_priority, round_robin
+
+
+class TestProcessTable(unittest.TestCase):
+
+    def setUp(self):
+        self.processes = [
+            ('P1', 0, 2, 0),
+            ('P2', 1, 8, 1),
+            ('P3', 6, 2, 2),
+            ('P4', 2, 7, 3),
+            ('P5', 3, 4, 4),
+            ('P6', 4, 6, 5)
+        ]
+
+    def test_round_trip(self):
+        table = ProcessTable(self.processes)
+        self.assertEqual(len(table), 6)
+        self.assertEqual(list(table), self.processes)
+        self.assertEqual(table[3], ('P4', 2, 7, 3))
+        np.testing.assert_array_equal(table['burst'], [2, 8, 2, 7, 4, 6])
+
+    def test_algorithms_accept_table(self):
+        table = ProcessTable(self.processes)
+        for algorithm in (fifo, sjf, priority_scheduling, srtf, preemptive_priority, round_robin):
+            with self.subTest(algorithm=algorithm.__name__):
+                self.assertEqual(algorithm(table), algorithm(self.processes))
+
+        result = fifo_batch(table)
+        self.assertEqual([table[i][0] for i in result.order], [p for p, _, _ in fifo(self.processes)[0]])
+
+    def test_copy_shares_pid_pool(self):
+        table = ProcessTable(self.processes)
+        snapshot = table.copy()
+        table.append(('P1', 9, 1, 0))
+        self.assertEqual(len(snapshot), 6)
+        self.assertEqual(list(snapshot), self.processes)
+        self.assertIs(snapshot._pids, table._pids)
+        # Los IDs repetidos reutilizan el mismo código
+        self.assertEqual(table.codes[6], table.codes[0])
+
+        table.clear()
+        self.assertEqual(len(table), 0)
+        self.assertEqual(list(snapshot), self.processes)
+
+    def test_from_columns(self):
+        table = ProcessTable.from_columns(['A', 'B'], np.array([3, 1]), [5, 2])
+        self.assertEqual(list(table), [('A', 3, 5, 0), ('B', 1, 2, 0)])
+        with self.assertRaises(ValueError):
+            ProcessTable.from_columns(['A'], [1, 2], [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
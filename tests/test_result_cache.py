@@ -0,0 +1,100 @@
+import unittest
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from process_table import ProcessTable
+from result_cache import ROW_BYTES, ResultCache, result_key, workload_digest
+from scheduler import round_robin, sjf
+from workload_io import open_processes, save_processes
+
+
+class CountingAlgorithm:
+    """Algoritmo que cuenta cuántas veces se ejecuta."""
+
+    def __init__(self, function):
+        self.function = function
+        self.calls = 0
+
+    def __call__(self, processes, **params):
+        self.calls += 1
+        return self.function(processes, **params)
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.processes = [('P1', 0, 2, 0), ('P2', 1, 8, 1), ('P3', 6, 2, 2)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_digest_depends_only_on_content(self):
+        table = ProcessTable(self.processes)
+        self.assertEqual(workload_digest(self.processes), workload_digest(table))
+        # Los códigos internos no influyen: aquí P3 se internó primero
+        reordered = ProcessTable.from_mapped(['P3', 'P1', 'P2'], np.array([1, 2, 0]), np.array([0, 1, 6]),
+                                             np.array([2, 8, 2]), np.array([0, 1, 2]))
+        self.assertEqual(workload_digest(reordered), workload_digest(table))
+        path = os.path.join(self.directory.name, 'carga.adc')
+        save_processes(path, table)
+        self.assertEqual(workload_digest(open_processes(path)), workload_digest(table))
+        self.assertNotEqual(workload_digest(self.processes[:2]), workload_digest(table))
+        self.assertNotEqual(workload_digest([('P1', 0, 2, 1)] + self.processes[1:]), workload_digest(table))
+
+    def test_run_reuses_results(self):
+        cache = ResultCache()
+        algorithm = CountingAlgorithm(round_robin)
+        first = cache.run('Round Robin', self.processes, algorithm, {'quantum': 2})
+        second = cache.run('Round Robin', ProcessTable(self.processes), algorithm, {'quantum': 2})
+        self.assertIs(first, second)
+        self.assertEqual(algorithm.calls, 1)
+        self.assertEqual((first.schedule, first.metrics), round_robin(self.processes, quantum=2))
+        # Otros parámetros son otra entrada
+        cache.run('Round Robin', self.processes, algorithm, {'quantum': 3})
+        self.assertEqual(algorithm.calls, 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_lru_eviction(self):
+        cache = ResultCache(max_entries=2)
+        for key in ('a', 'b'):
+            cache.put(key, [], [])
+        cache.get('a')
+        cache.put('c', [], [])
+        self.assertEqual(['a' in cache, 'b' in cache, 'c' in cache], [True, False, True])
+
+        # Por tamaño: cada entrada ocupa dos filas
+        cache = ResultCache(max_bytes=5 * ROW_BYTES)
+        for key in ('a', 'b', 'c'):
+            cache.put(key, [('P1', 0, 1)], [('P1', 0, 1)])
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size, 4 * ROW_BYTES)
+        self.assertNotIn('a', cache)
+
+    def test_disk_persistence(self):
+        directory = os.path.join(self.directory.name, 'resultados')
+        key = result_key('SJF', {}, workload_digest(self.processes))
+        ResultCache(directory=directory).run('SJF', self.processes, sjf)
+
+        algorithm = CountingAlgorithm(sjf)
+        entry = ResultCache(directory=directory).run('SJF', self.processes, algorithm)
+        self.assertEqual(algorithm.calls, 0)
+        self.assertEqual(entry.key, key)
+        self.assertEqual((list(entry.schedule), list(entry.metrics)), sjf(self.processes))
+
+        cache = ResultCache(directory=directory, max_disk_bytes=0)
+        cache.put('otra', *sjf(self.processes))
+        # Se conserva al menos el último archivo escrito
+        self.assertEqual(os.listdir(directory), ['otra.adc'])
+        cache.clear(disk=True)
+        self.assertEqual((len(cache), os.listdir(directory)), (0, []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+import random
+import sys
+import os
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from instrumentation import Tracer
+from scheduler import ALGORITHMS, priority_aging
+from smp import POLICIES, SMP_ALGORITHMS, simulate, smp_algorithm
+from workloads import generate
+
+
+def random_processes(rng, n):
+    return [(f'P{i}', rng.randint(0, 20), rng.randint(1, 8), rng.randint(0, 3)) for i in range(n)]
+
+
+class TestSMP(unittest.TestCase):
+
+    def test_single_core_matches_scheduler(self):
+        rng = random.Random(1)
+        for _ in range(200):
+            processes = random_processes(rng, rng.randint(0, 12))
+            quantum = rng.randint(1, 4)
+            for algorithm in SMP_ALGORITHMS:
+                params = {'quantum': quantum} if algorithm == 'Round Robin' else {}
+                expected = ALGORITHMS[algorithm](processes, **params)
+                for policy in POLICIES:
+                    with self.subTest(algorithm=algorithm, policy=policy, processes=processes):
+                        schedule, metrics = simulate(processes, algorithm, cores=1, policy=policy, quantum=quantum)
+                        self.assertEqual(([entry[:3] for entry in schedule], metrics), expected)
+
+    def test_aging_interval(self):
+        rng = random.Random(3)
+        for _ in range(100):
+            processes = random_processes(rng, rng.randint(0, 12))
+            interval = rng.randint(1, 6)
+            schedule, metrics = simulate(processes, 'Prioridad con Envejecimiento', aging_interval=interval)
+            self.assertEqual(([entry[:3] for entry in schedule], metrics), priority_aging(processes, interval))
+        scheduler = smp_algorithm('Prioridad con Envejecimiento', 2)
+        processes = [('P1', 0, 5, 0), ('P2', 0, 6, 0), ('P3', 1, 2, 3), ('P4', 4, 2, 1)]
+        # Con intervalo 1 pesa más la llegada temprana de P3 que su prioridad; con 10, P4 pasa primero
+        self.assertEqual([pid for pid, *_ in scheduler(processes, aging_interval=1)[0]], ['P1', 'P2', 'P3', 'P4'])
+        self.assertEqual([pid for pid, *_ in scheduler(processes, aging_interval=10)[0]], ['P1', 'P2', 'P4', 'P3'])
+
+    def test_multicore_invariants(self):
+        rng = random.Random(2)
+        for _ in range(100):
+            processes = random_processes(rng, rng.randint(0, 30))
+            arrivals = {pid: at for pid, at, _, _ in processes}
+            cores = rng.randint(2, 6)
+            for algorithm in SMP_ALGORITHMS:
+                for policy in POLICIES:
+                    schedule, metrics = simulate(processes, algorithm, cores=cores, policy=policy)
+                    self.assertEqual(sorted(pid for pid, _, _ in metrics), sorted(pid for pid, *_ in processes))
+                    executed = {}
+                    for pid, start, end, core in schedule:
+                        self.assertTrue(0 <= core < cores and end > start >= arrivals[pid])
+                        executed[pid] = executed.get(pid, 0) + end - start
+                    self.assertEqual(executed, {pid: bt for pid, _, bt, _ in processes if bt})
+                    # Ni un núcleo ejecuta dos procesos a la vez ni un proceso corre en dos núcleos
+                    for field in (0, 3):
+                        spans = {}
+                        for entry in schedule:
+                            spans.setdefault(entry[field], []).append(entry[1:3])
+                        for intervals in spans.values():
+                            intervals.sort()
+                            self.assertTrue(all(a[1] <= b[0] for a, b in zip(intervals, intervals[1:])))
+
+    def test_enough_cores_means_no_waiting(self):
+        processes = generate('bursty', 200, seed=5)
+        for algorithm in ('FIFO', 'SJF', 'SRTF'):
+            _, metrics = simulate(processes, algorithm, cores=200)
+            self.assertTrue(all(waiting == 0 for _, waiting, _ in metrics))
+
+    def test_work_stealing_uses_idle_cores(self):
+        # Todas las llegadas caen en la cola del núcleo 0; el núcleo 1 debe robar
+        processes = [('P1', 0, 4, 0), ('P2', 1, 4, 0), ('P3', 2, 4, 0), ('P4', 3, 4, 0)]
+        schedule, _ = simulate(processes, 'FIFO', cores=2, policy='por núcleo')
+        self.assertEqual({core for *_, core in schedule}, {0, 1})
+
+    def test_tracer_sees_every_core(self):
+        tracer = Tracer()
+        schedule, _ = simulate(generate('uniform', 100), 'SRTF', cores=4, tracer=tracer)
+        self.assertEqual({core for *_, core in tracer.events}, {0, 1, 2, 3})
+        self.assertGreaterEqual(tracer.dispatches, len(schedule))
+        self.assertIn('simulación', tracer.phase_times)
+
+    def test_queue_samples_are_time_ordered(self):
+        for algorithm in ('FIFO', 'SRTF', 'Round Robin'):
+            tracer = Tracer()
+            simulate(generate('poisson', 2000, seed=2, rate=1.0), algorithm, cores=4, tracer=tracer)
+            times, depths = tracer.queue_depth()
+            self.assertEqual(len(times), tracer.dispatches)
+            self.assertTrue(all(a <= b for a, b in zip(times, times[1:])), algorithm)
+
+    def test_wrapper_and_errors(self):
+        scheduler = smp_algorithm('Round Robin', 2)
+        self.assertEqual(scheduler([('P1', 0, 3, 0)], quantum=1), ([('P1', 0, 3, 0)], [('P1', 0, 3)]))
+        with self.assertRaises(ValueError):
+            simulate([], 'Lotería')
+        with self.assertRaises(ValueError):
+            simulate([], 'FIFO', policy='aleatoria')
+        with self.assertRaises(ValueError):
+            simulate([], 'FIFO', cores=0)
+        with self.assertRaises(ValueError):
+            simulate([], 'Round Robin', quantum=0)
+        with self.assertRaises(ValueError):
+            simulate([], 'Prioridad con Envejecimiento', aging_interval=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+import sys
+import os
+import math
+import random
+from multiprocessing import get_context
+
+import numpy as np
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from scheduler import ALGORITHMS, priority_scheduling, register_algorithm, sjf
+from sweep import QuantileSketch, RunningStats, format_table, sweep, workload_seed
+from workloads import generate
+
+
+class TestStreamingEstimators(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(11)
+        self.values = np.array([rng.expovariate(0.1) for _ in range(5000)] + [0.0] * 300)
+        rng.shuffle(self.values)
+
+    def test_running_stats_merge(self):
+        single = RunningStats()
+        for value in self.values[:100]:
+            single.add(value)
+        merged = RunningStats()
+        for chunk in np.array_split(self.values[100:], 7):
+            partial = RunningStats()
+            partial.add_batch(chunk)
+            merged.merge(partial)
+        merged.merge(single)
+        self.assertEqual(merged.count, len(self.values))
+        self.assertAlmostEqual(merged.mean, self.values.mean())
+        self.assertAlmostEqual(merged.variance, self.values.var(ddof=1))
+        self.assertEqual((merged.minimum, merged.maximum), (self.values.min(), self.values.max()))
+
+    def test_sketch_relative_error(self):
+        sketch = QuantileSketch(relative_accuracy=0.02)
+        for chunk in np.array_split(self.values, 5):
+            partial = QuantileSketch(relative_accuracy=0.02)
+            partial.add_batch(chunk)
+            sketch.merge(partial)
+        exact = np.sort(self.values)
+        for q in (0.01, 0.25, 0.5, 0.95, 0.99, 1.0):
+            true_value = exact[int(q * (len(exact) - 1))]
+            self.assertLessEqual(abs(sketch.quantile(q) - true_value), 0.02 * true_value + 1e-12)
+        self.assertEqual(sketch.quantile(0.0), 0.0)
+        # Con muchos valores el sketch ocupa pocos buckets
+        self.assertLess(len(sketch.buckets), 600)
+        self.assertTrue(math.isnan(QuantileSketch().quantile(0.5)))
+        with self.assertRaises(ValueError):
+            sketch.merge(QuantileSketch(relative_accuracy=0.01))
+
+
+def longest_job_first(processes):
+    """Algoritmo registrado solo en el proceso de las pruebas."""
+    return priority_scheduling([(pid, arrival, burst, -burst) for pid, arrival, burst, _ in processes])
+
+
+class TestSweep(unittest.TestCase):
+
+    def test_matches_direct_runs(self):
+        rows = sweep('uniform', count=30, size=40, algorithms=['SJF'], batch_size=7, max_workers=1, seed=3)
+        waiting = np.array([m[1] for i in range(30)
+                            for m in sjf(generate('uniform', 40, seed=workload_seed(3, i)))[1]], dtype=float)
+        row = rows[0]
+        self.assertEqual((row.workloads, row.processes), (30, 1200))
+        self.assertAlmostEqual(row.waiting.mean, waiting.mean())
+        self.assertAlmostEqual(row.waiting.stats.variance, waiting.var(ddof=1))
+        self.assertEqual(row.average_waiting.count, 30)
+        self.assertIn('SJF', format_table(rows))
+
+    def test_reproducible_per_seed(self):
+        params = {'Round Robin': {'quantum': 3}}
+        runs = [sweep('bursty', count=12, size=30, algorithms=['Round Robin', 'MLFQ'], params=params,
+                      seed=seed, batch_size=5, max_workers=workers)
+                for seed, workers in ((1, 1), (1, 2), (2, 1))]
+        summaries = [[(row.waiting.summary(), row.turnaround.summary()) for row in rows] for rows in runs]
+        self.assertEqual(summaries[0], summaries[1])
+        self.assertNotEqual(summaries[0], summaries[2])
+
+    def test_registered_algorithm_with_spawn(self):
+        # Los trabajadores creados con spawn no heredan el registro del proceso principal
+        register_algorithm('LJF', longest_job_first)
+        self.addCleanup(ALGORITHMS.pop, 'LJF')
+        spawned = sweep('uniform', count=8, size=20, algorithms=['LJF'], batch_size=4, max_workers=2,
+                        mp_context=get_context('spawn'))
+        local = sweep('uniform', count=8, size=20, algorithms=[longest_job_first], batch_size=4, max_workers=1)
+        self.assertEqual(spawned[0].algorithm, 'LJF')
+        self.assertEqual(spawned[0].waiting.summary(), local[0].waiting.summary())
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            sweep('normal', count=1)
+        with self.assertRaises(ValueError):
+            sweep(count=1, algorithms=['LIFO'])
+        with self.assertRaises(ValueError):
+            sweep(count=1, batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from process_table import ProcessTable
+from scheduler import fifo, sjf, round_robin
+from workload_io import (file_kind, iter_csv, iter_jsonl, load_workload, open_processes, open_results,
+                         save_processes, save_results)
+
+
+class TestWorkloadIO(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.processes = [('P1', 0, 2, 0), ('P2', 1, 8, 1), ('P3', 6, 2, 2), ('Ñ4', 2, 7, 3)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_streaming_text_formats(self):
+        with open(self.path('carga.csv'), 'w', encoding='utf-8') as file:
+            file.write('llegada,id,ejecucion\n0,P1,2\n1,P2,8\n')
+        self.assertEqual(list(iter_csv(self.path('carga.csv'))), [('P1', 0, 2, 0), ('P2', 1, 8, 0)])
+
+        with open(self.path('sin_cabecera.csv'), 'w', encoding='utf-8') as file:
+            file.write(''.join(f'{pid},{at},{bt},{pr}\n' for pid, at, bt, pr in self.processes))
+        self.assertEqual(list(load_workload(self.path('sin_cabecera.csv'))), self.processes)
+
+        with open(self.path('carga.jsonl'), 'w', encoding='utf-8') as file:
+            file.write('{"id": "P1", "arrival": 0, "burst": 2}\n\n["P2", 1, 8, 1]\n')
+        self.assertEqual(list(iter_jsonl(self.path('carga.jsonl'))), [('P1', 0, 2, 0), ('P2', 1, 8, 1)])
+
+    def test_csv_validation(self):
+        # La cabecera se detecta en la primera fila no vacía
+        with open(self.path('blanco.csv'), 'w', encoding='utf-8') as file:
+            file.write('\n,,\nid,llegada,ejecucion\nP1,0,2\n')
+        self.assertEqual(list(iter_csv(self.path('blanco.csv'))), [('P1', 0, 2, 0)])
+        for name, content in (('corta.csv', 'P1\n'), ('irregular.csv', 'P1,0,2\nP2,1\n'),
+                              ('cabecera.csv', 'id,llegada,ejecucion\nP1,0\n'), ('texto.csv', 'P1,0,dos\n')):
+            with open(self.path(name), 'w', encoding='utf-8') as file:
+                file.write(content)
+            with self.subTest(name=name), self.assertRaisesRegex(ValueError, 'Línea'):
+                list(iter_csv(self.path(name)))
+
+    def test_binary_processes_are_mapped(self):
+        save_processes(self.path('carga.adc'), self.processes)
+        self.assertEqual(file_kind(self.path('carga.adc')), 'processes')
+        table = open_processes(self.path('carga.adc'))
+        self.assertTrue(table.mapped)
+        self.assertIsInstance(table['arrival'], np.memmap)
+        self.assertEqual(list(table), self.processes)
+        self.assertEqual(table[3], ('Ñ4', 2, 7, 3))
+        self.assertEqual(sjf(table), sjf(self.processes))
+
+        # Modificar la tabla la copia a memoria propia sin tocar el archivo
+        table.append(('P5', 3, 4, 4))
+        self.assertFalse(table.mapped)
+        self.assertEqual(len(open_processes(self.path('carga.adc'))), 4)
+        self.assertEqual(table, ProcessTable(self.processes + [('P5', 3, 4, 4)]))
+
+    def test_overwrite_keeps_existing_mappings(self):
+        save_processes(self.path('carga.adc'), self.processes)
+        table = open_processes(self.path('carga.adc'))
+        # Sobrescribir el archivo mapeado (importar y exportar al mismo archivo) no invalida la tabla
+        save_processes(self.path('carga.adc'), self.processes[:1])
+        self.assertEqual(list(table), self.processes)
+        self.assertEqual(list(open_processes(self.path('carga.adc'))), self.processes[:1])
+        self.assertEqual(os.listdir(self.directory.name), ['carga.adc'])
+
+    def test_results_round_trip(self):
+        for algorithm in (fifo, round_robin):
+            schedule, metrics = algorithm(self.processes)
+            save_results(self.path('resultados.adc'), schedule, metrics)
+            loaded_schedule, loaded_metrics = open_results(self.path('resultados.adc'))
+            self.assertEqual(list(loaded_schedule), schedule)
+            self.assertEqual(list(loaded_metrics), metrics)
+            self.assertEqual(loaded_schedule[-1], schedule[-1])
+
+        with self.assertRaises(ValueError):
+            open_processes(self.path('resultados.adc'))
+
+    def test_empty_files(self):
+        save_processes(self.path('vacia.adc'), [])
+        self.assertEqual(len(open_processes(self.path('vacia.adc'))), 0)
+        save_results(self.path('vacios.adc'), [], [])
+        self.assertEqual([list(rows) for rows in open_results(self.path('vacios.adc'))], [[], []])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import sys
+import os
+
+# Agregar el directorio src al PYTHONPATH, igual que al ejecutar la aplicación
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'benchmarks')))
+
+from bench_scheduler import check, run, scaling_exponent
+from scheduler import ALGORITHMS
+from workloads import GENERATORS, generate
+
+
+class TestWorkloads(unittest.TestCase):
+
+    def test_generators_are_deterministic(self):
+        for kind in GENERATORS:
+            with self.subTest(kind=kind):
+                table = generate(kind, 500, seed=3)
+                self.assertEqual(len(table), 500)
+                self.assertEqual(table, generate(kind, 500, seed=3))
+                self.assertNotEqual(table, generate(kind, 500, seed=4))
+                self.assertTrue(all(bt >= 1 and at >= 0 for _, at, bt, _ in table))
+
+    def test_priority_ties_have_few_distinct_keys(self):
+        table = generate('priority_ties', 1000)
+        self.assertLessEqual(len(set(table['priority'].tolist())), 2)
+        self.assertLessEqual(len(set(table['burst'].tolist())), 2)
+
+    def test_unknown_generator(self):
+        with self.assertRaises(ValueError):
+            generate('normal', 10)
+
+
+class TestBenchmarkGates(unittest.TestCase):
+
+    def test_scaling_exponent(self):
+        self.assertAlmostEqual(scaling_exponent([(10, 1.0), (100, 10.0), (1000, 100.0)]), 1.0)
+        self.assertAlmostEqual(scaling_exponent([(10, 1.0), (100, 100.0)]), 2.0)
+        self.assertIsNone(scaling_exponent([(10, 1.0)]))
+
+    def test_check_detects_regressions(self):
+        results = {
+            'FIFO|uniform|10000': {'seconds': 0.01, 'relative': 1.0},
+            'FIFO|uniform|100000': {'seconds': 1.0, 'relative': 100.0},
+            'SJF|uniform|10': {'seconds': 0.001, 'relative': 9.0},
+        }
+        baseline = {'FIFO|uniform|10000': {'relative': 0.5}, 'SJF|uniform|10': {'relative': 1.0}}
+        failures = check(results, baseline, threshold=0.5, max_exponent=1.3)
+        # Los tamaños pequeños no se comparan: solo fallan el 2x y la curva cuadrática
+        self.assertEqual(len(failures), 2)
+        self.assertIn('FIFO|uniform|10000', failures[0])
+        self.assertIn('n^2.00', failures[1])
+        self.assertEqual(check(results, baseline, threshold=1.5, max_exponent=2.5), [])
+
+    def test_run_covers_every_case(self):
+        with open(os.devnull, 'w') as out:
+            results = run(list(ALGORITHMS), ['uniform'], [10, 100], repeat=1, out=out)
+        self.assertEqual(len(results), 2 * len(ALGORITHMS))
+        self.assertTrue(all(result['peak_bytes'] > 0 for result in results.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()